@@ -26,15 +26,18 @@ class LLMSQLExtractor:
     def __init__(
         self,
         llm_provider_name: str = "watsonx_ai",
+        max_workers: int = 4,
     ):
         """
         Initialize LLMSQLExtractor
 
         Args:
             llm_provider_name: LLM Provider Name (default: watsonx_ai)
+            max_workers: Maximum number of concurrent LLM calls (default: 4)
         """
         self.logger = logging.getLogger(__name__)
         self.llm_provider = create_llm_provider(llm_provider_name)
+        self.max_workers = max_workers
 
         # Load template
         self.template_path = Path(__file__).parent / "template.md"
@@ -64,7 +67,7 @@ class LLMSQLExtractor:
             return []
 
         # Use BatchProcessor for parallel processing
-        processor = BatchProcessor()
+        processor = BatchProcessor(max_workers=self.max_workers)
         results = processor.process_items_parallel(
             source_files, self._process_single_file, desc="LLM SQL Extraction"
         )
@@ -66,7 +66,8 @@ class JDBCSQLExtractor(SQLExtractor):
             # LLM 기반 추출 사용
             if filtered_files:
                 llm_extractor = LLMSQLExtractor(
-                    llm_provider_name=self.config.llm_provider
+                    llm_provider_name=self.config.llm_provider,
+                    max_workers=self.config.max_workers,
                 )
                 return llm_extractor.extract_from_files(filtered_files)
             return []
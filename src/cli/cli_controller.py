@@ -45,6 +45,7 @@ from persistence.data_persistence_manager import (
     PersistenceError,
 )
 from persistence.debug_manager import DebugManager
+from util.file_utils import read_text_file
 
 
 class CLIController:
@@ -1488,18 +1489,32 @@ class CLIController:
                         if args.debug and debug_manager:
                             debug_manager.log_plans(context_plans, context.table_name)
 
-                        # 생성된 계획 즉시 적용
-                        for plan in context_plans:
+                        # 디버그 모드일 경우 diff용 원본 내용을 적용 전에 메모리에 보관
+                        # (keep_backups가 꺼져 있어도 diff를 남길 수 있도록 백업 파일에 의존하지 않음)
+                        original_contents = {}
+                        if args.debug and debug_manager and not args.dry_run:
+                            for plan in context_plans:
+                                try:
+                                    original_contents[plan.file_path] = read_text_file(
+                                        plan.file_path
+                                    )
+                                except OSError:
+                                    pass
+
+                        # 생성된 계획 즉시 적용 (이미 실패/스킵된 계획도 내부적으로 처리됨)
+                        # 대상 파일이 서로 다른 계획은 병렬로 적용됨
+                        results = code_modifier.apply_plans(
+                            context_plans, dry_run=args.dry_run
+                        )
+                        for plan, res in zip(context_plans, results):
                             # 디버그 모드일 경우 diff 저장
-                            # 적용 (이미 실패/스킵된 계획도 내부적으로 처리됨)
-                            res = code_modifier.apply_plan(
-                                plan, dry_run=args.dry_run
-                            )
-
                             if args.debug and debug_manager and res.get("status") == "success":
                                 debug_manager.log_diff(
                                     backup_path=res.get("backup_path"), 
-                                    file_path=res.get("file_path")
+                                    file_path=res.get("file_path"),
+                                    original_content=original_contents.get(
+                                        plan.file_path
+                                    ),
                                 )
 
                             table_modifications.append(res)
@@ -1535,8 +1550,13 @@ class CLIController:
                     table_info.table_name, table_modifications
                 )
 
-            # 최종 저장
-            code_modifier.result_tracker.save_statistics()
+            # 최종 저장 (백그라운드 수정 이력 저장 실패도 여기서 확인)
+            save_failed = False
+            try:
+                code_modifier.result_tracker.save_statistics()
+            except Exception as e:
+                self.logger.error(f"    ✗ 수정 결과 저장 실패: {e}")
+                save_failed = True
 
             # 수정된 table_access_info 저장
             persistence_manager.save_to_file(
@@ -1566,7 +1586,7 @@ class CLIController:
             if args.dry_run:
                 self.logger.info("\n[미리보기 모드] 실제 파일은 수정되지 않았습니다.")
 
-            return 0
+            return 1 if save_failed else 0
 
         except ConfigurationError as e:
             self.logger.error(f"오류: {e}")
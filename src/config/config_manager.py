@@ -103,6 +103,14 @@ class ThreeStepConfig(BaseModel):
         None,
         description="실행 옵션 (mode, plan_timestamp)",
     )
+    analysis_cache_dir: Optional[str] = Field(
+        None,
+        description="1/2단계 LLM 응답 디스크 캐시 디렉토리 "
+        "(지정 시 재실행에서 동일 프롬프트의 응답을 재사용)",
+    )
+    analysis_cache_ttl_hours: int = Field(
+        -1, description="1/2단계 LLM 응답 캐시 만료 시간 (시간). 음수면 만료 없음."
+    )
 
 class ArtifactGenerationConfig(BaseModel):
     old_code_path: Optional[str] = Field(None, description="기존 코드 경로")
@@ -167,8 +175,30 @@ class Configuration(BaseModel):
     )
     use_llm_parser: bool = Field(False, description="LLM 파서 사용 여부")
     max_tokens_per_batch: int = Field(8000, description="한번에 처리할 최대 토큰 수")
+    batch_packing: Literal["sequential", "first_fit_decreasing"] = Field(
+        "sequential",
+        description="배치 분할 방식 (sequential: 입력 순서대로 채움, "
+        "first_fit_decreasing: 토큰 크기 내림차순 first-fit으로 배치 수 최소화)",
+    )
     max_workers: int = Field(4, description="병렬 처리 워커 수")
+    llm_requests_per_minute: Optional[int] = Field(
+        None, gt=0, description="LLM 분당 최대 요청 수 (미지정 시 제한 없음)"
+    )
+    llm_tokens_per_minute: Optional[int] = Field(
+        None, gt=0, description="LLM 분당 최대 토큰 수 (미지정 시 제한 없음)"
+    )
+    llm_expected_output_tokens: int = Field(
+        0,
+        ge=0,
+        description="max_tokens를 지정하지 않은 LLM 호출의 예상 출력 토큰 수 "
+        "(llm_tokens_per_minute 차감용)",
+    )
     max_retries: int = Field(3, description="최대 재시도 횟수")
+    keep_backups: bool = Field(
+        True,
+        description="패치 적용 전 원본 파일을 .backup 파일로 보관할지 여부 "
+        "(패치는 임시 파일 작성 후 교체되므로 복구에는 필요하지 않음)",
+    )
     generate_type: Literal["full_source", "diff", "part", "method"] = Field(
         "diff",
         description="코드 생성 방식 (full_source: 전체 코드, diff: 변경분, part: 부분 코드, method: 메서드 단위)",
@@ -1,5 +1,29 @@
+import sys
 from dataclasses import dataclass, field
-from typing import List, Literal
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+
+def columns_cache_key(columns: List[Dict[str, Any]]) -> Optional[Tuple[Tuple, ...]]:
+    """
+    칼럼 정보 목록을 캐시 키로 쓸 수 있는 해시 가능한 튜플로 변환합니다.
+
+    True/1 처럼 해시가 같은 값이 섞이지 않도록 값의 타입도 키에 포함합니다.
+
+    Args:
+        columns: 칼럼 정보 목록
+
+    Returns:
+        Optional[Tuple[Tuple, ...]]: 캐시 키 (해시 불가능한 값이 있으면 None)
+    """
+    try:
+        columns_key = tuple(
+            tuple((key, type(value), value) for key, value in col.items())
+            for col in columns
+        )
+        hash(columns_key)
+    except (AttributeError, TypeError):
+        return None
+    return columns_key
 
 
 @dataclass
@@ -11,3 +35,8 @@ class ModificationContext:
     layer: Literal["service", "mapper"]
     context_files: List[str] = field(default_factory=list)
     """참조용 파일 (VO 등) - 수정 대상이 아닌 컨텍스트 파일"""
+
+    def __post_init__(self):
+        # 동일 테이블명은 같은 문자열 객체를 공유하여 dict 키 비교를 identity로 단축
+        if isinstance(self.table_name, str):
+            self.table_name = sys.intern(self.table_name)
@@ -57,6 +57,21 @@ class BatchProcessor:
 
         results = [None] * len(items)
 
+        # 아이템이 하나이거나 워커가 하나면 스레드 풀 생성 없이 현재 스레드에서 처리
+        if len(items) == 1 or self.max_workers <= 1:
+            item_iter = enumerate(items)
+            if show_progress:
+                item_iter = tqdm(item_iter, total=len(items), desc=desc)
+
+            for index, item in item_iter:
+                try:
+                    results[index] = process_func(item)
+                    logger.debug(f"아이템 {index + 1}/{len(items)} 처리 완료")
+                except Exception as e:
+                    logger.error(f"아이템 {index + 1} 처리 실패: {e}")
+                    results[index] = None
+            return results
+
         # 병렬 처리
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Future 객체와 아이템 인덱스 매핑
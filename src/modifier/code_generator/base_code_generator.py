@@ -1,20 +1,23 @@
+import functools
 import hashlib
-import json
 import logging
+import os
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import tiktoken
-from jinja2 import Template
+from jinja2 import Environment, Template
 
 from config.config_manager import Configuration
 from models.code_generator import CodeGeneratorInput, CodeGeneratorOutput
-from models.modification_context import ModificationContext
+from models.modification_context import ModificationContext, columns_cache_key
 from models.modification_plan import ModificationPlan
 from models.table_access_info import TableAccessInfo
 from modifier.llm.llm_provider import LLMProvider
+from util.file_utils import read_text_file
+from util.json_utils import dumps_pretty_json
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +28,63 @@ class CodeGeneratorError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def load_template_file(template_path: str) -> str:
+    """
+    템플릿 파일을 읽습니다. 같은 경로는 프로세스당 한 번만 읽습니다.
+
+    Args:
+        template_path: 템플릿 파일 경로
+
+    Returns:
+        str: 템플릿 문자열
+    """
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=64)
+def _list_template_dir(template_dir: str) -> frozenset:
+    """템플릿 디렉토리의 파일명 집합을 반환합니다. (디렉토리당 한 번만 조회)"""
+    try:
+        with os.scandir(template_dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def template_file_exists(template_path: Path) -> bool:
+    """
+    템플릿 파일이 존재하는지 확인합니다.
+
+    파일마다 stat()을 호출하는 대신 디렉토리 목록을 한 번 읽어
+    여러 생성기 인스턴스에서 공유합니다.
+
+    Args:
+        template_path: 템플릿 파일 경로
+
+    Returns:
+        bool: 템플릿 디렉토리에 해당 파일이 있으면 True
+    """
+    return template_path.name in _list_template_dir(str(template_path.parent))
+
+
+# 모든 생성기가 공유하는 Jinja2 환경 (기본 옵션은 Template()과 동일, 디스크에 쓰지 않음)
+_TEMPLATE_ENV = Environment(auto_reload=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template_str: str) -> Template:
+    """템플릿 문자열을 컴파일합니다. 같은 템플릿은 프로세스당 한 번만 컴파일됩니다."""
+    return _TEMPLATE_ENV.from_string(template_str)
+
+
 def render_template(template_str: str, variables: Dict[str, Any]) -> str:
     """
     Jinja2를 사용하여 템플릿을 렌더링합니다.
 
+    컴파일된 템플릿은 템플릿 문자열 기준으로 캐싱되어 재사용됩니다.
+
     Args:
         template_str: 템플릿 문자열
         variables: 치환할 변수 딕셔너리
@@ -37,8 +93,103 @@ def render_template(template_str: str, variables: Dict[str, Any]) -> str:
         str: 렌더링된 문자열
     """
 
-    template = Template(template_str)
-    return template.render(**variables)
+    template = _compile_template(template_str)
+    # dict를 그대로 전달 (**variables 언패킹 시 생기는 중간 kwargs dict 생략)
+    return template.render(variables)
+
+
+# 토큰 수 캐시: (인코딩명, 텍스트 해시) -> 토큰 수
+_TOKEN_COUNT_CACHE: Dict[Tuple[str, bytes], int] = {}
+_TOKEN_COUNT_CACHE_MAX = 4096
+
+
+def count_tokens(encoder: Any, text: str) -> int:
+    """
+    텍스트의 토큰 수를 계산합니다. 같은 내용은 프로세스당 한 번만 인코딩합니다.
+
+    같은 소스 파일이 여러 테이블/레이어의 배치 구성에서 반복해서 토큰 계산되므로
+    텍스트의 blake2b 해시를 키로 결과를 재사용합니다.
+
+    Args:
+        encoder: tiktoken 인코더
+        text: 토큰 수를 계산할 텍스트
+
+    Returns:
+        int: 토큰 수
+    """
+    key = (
+        encoder.name,
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+    )
+    count = _TOKEN_COUNT_CACHE.get(key)
+    if count is None:
+        count = len(encoder.encode(text))
+        if len(_TOKEN_COUNT_CACHE) >= _TOKEN_COUNT_CACHE_MAX:
+            _TOKEN_COUNT_CACHE.clear()
+        _TOKEN_COUNT_CACHE[key] = count
+    return count
+
+
+def count_tokens_batch(encoder: Any, texts: List[str]) -> List[int]:
+    """
+    여러 텍스트의 토큰 수를 한 번에 계산합니다.
+
+    count_tokens와 같은 캐시를 사용하며, 캐시에 없는 텍스트는 인코더의
+    encode_batch로 한 번에 인코딩합니다 (tiktoken은 내부 스레드에서 병렬 처리).
+
+    Args:
+        encoder: tiktoken 인코더
+        texts: 토큰 수를 계산할 텍스트 목록
+
+    Returns:
+        List[int]: texts와 같은 순서의 토큰 수 목록
+    """
+    keys = [
+        (encoder.name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        for text in texts
+    ]
+    counts: List[Optional[int]] = [_TOKEN_COUNT_CACHE.get(key) for key in keys]
+    missing = [index for index, count in enumerate(counts) if count is None]
+    if missing:
+        if len(missing) > 1 and hasattr(encoder, "encode_batch"):
+            encoded = encoder.encode_batch([texts[index] for index in missing])
+        else:
+            encoded = [encoder.encode(texts[index]) for index in missing]
+        if len(_TOKEN_COUNT_CACHE) + len(missing) > _TOKEN_COUNT_CACHE_MAX:
+            _TOKEN_COUNT_CACHE.clear()
+        for index, tokens in zip(missing, encoded):
+            counts[index] = len(tokens)
+            _TOKEN_COUNT_CACHE[keys[index]] = counts[index]
+    return counts
+
+
+@functools.lru_cache(maxsize=128)
+def _serialize_table_info(table_name: str, columns_key: Tuple[Tuple, ...]) -> str:
+    """(테이블명, 칼럼 키) 조합별로 table_info JSON을 한 번만 직렬화합니다."""
+    columns = [{key: value for key, _, value in items} for items in columns_key]
+    return dumps_pretty_json({"table_name": table_name, "columns": columns})
+
+
+def dumps_table_info(table_name: str, columns: List[Dict[str, Any]]) -> str:
+    """
+    프롬프트용 table_info JSON 문자열을 생성합니다.
+
+    {"table_name": ..., "columns": [...]}를 dumps_pretty_json으로 직렬화한 것과
+    동일하며, 같은 테이블/칼럼 조합은 Phase 및 컨텍스트 간에 재사용됩니다.
+    캐시 키는 호출 시점의 칼럼 내용으로 계산하므로 칼럼이 바뀌면 새로 직렬화하며,
+    칼럼 값에 해시 불가능한 객체가 있으면 캐시 없이 직렬화합니다.
+
+    Args:
+        table_name: 테이블명
+        columns: 칼럼 정보 목록
+
+    Returns:
+        str: 들여쓰기 2칸의 JSON 문자열
+    """
+    columns_key = columns_cache_key(columns)
+    if columns_key is None:
+        return dumps_pretty_json({"table_name": table_name, "columns": columns})
+    return _serialize_table_info(table_name, columns_key)
 
 
 class BaseCodeGenerator(ABC):
@@ -63,6 +214,8 @@ class BaseCodeGenerator(ABC):
         self.llm_provider = llm_provider
         self._prompt_cache = prompt_cache if prompt_cache is not None else {}
         self.config = config
+        # (table_info, layer_name) -> 소스 파일이 없는 프롬프트의 토큰 수
+        self._empty_prompt_tokens: Dict[Tuple[str, str], int] = {}
 
         if template_path:
             self.template_path = Path(template_path)
@@ -129,14 +282,60 @@ class BaseCodeGenerator(ABC):
         """
         if self.token_encoder:
             try:
-                tokens = self.token_encoder.encode(text)
-                return len(tokens)
+                return count_tokens(self.token_encoder, text)
             except Exception as e:
                 logger.warning(f"토큰 인코딩 실패, 추정값 사용: {e}")
 
         # 간단한 추정: 대략 1 토큰 = 4 문자
         return len(text) // 4
 
+    def calculate_token_sizes(self, texts: List[str]) -> List[int]:
+        """
+        여러 텍스트의 토큰 크기를 한 번에 계산합니다.
+
+        Args:
+            texts: 토큰 크기를 계산할 텍스트 목록
+
+        Returns:
+            List[int]: texts와 같은 순서의 토큰 크기 목록
+        """
+        if self.token_encoder:
+            try:
+                return count_tokens_batch(self.token_encoder, texts)
+            except Exception as e:
+                logger.warning(f"토큰 인코딩 실패, 추정값 사용: {e}")
+
+        # 간단한 추정: 대략 1 토큰 = 4 문자
+        return [len(text) // 4 for text in texts]
+
+    def calculate_empty_prompt_tokens(
+        self, table_info: str, layer_name: str = ""
+    ) -> int:
+        """
+        소스 파일이 없는 프롬프트의 토큰 크기를 계산합니다.
+
+        배치 구성의 기준 토큰 수로 사용되며, 테이블 정보와 레이어가 같으면
+        프롬프트 렌더링과 토큰 계산을 다시 하지 않습니다.
+
+        Args:
+            table_info: 직렬화된 테이블 정보
+            layer_name: 레이어명
+
+        Returns:
+            int: 빈 프롬프트의 토큰 크기
+        """
+        key = (table_info, layer_name)
+        tokens = self._empty_prompt_tokens.get(key)
+        if tokens is None:
+            empty_prompt = self.create_prompt(
+                CodeGeneratorInput(
+                    file_paths=[], table_info=table_info, layer_name=layer_name
+                )
+            )
+            tokens = self.calculate_token_size(empty_prompt)
+            self._empty_prompt_tokens[key] = tokens
+        return tokens
+
     def create_prompt(self, input_data: CodeGeneratorInput) -> str:
         """
         입력 데이터를 사용하여 프롬프트를 생성합니다.
@@ -151,19 +350,19 @@ class BaseCodeGenerator(ABC):
 
         for file_path in input_data.file_paths:
             path_obj = Path(file_path)
-            if not path_obj.exists():
+            try:
+                content = read_text_file(path_obj)
+            except FileNotFoundError:
                 logger.warning(f"File not found: {file_path}")
                 continue
 
-            with open(path_obj, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            if self.config.generate_type == 'full_source':
-                file_block = (
-                    f"=== File: {path_obj.name} ===\n"
-                    + "".join(lines)
-                )
+            if self.config.generate_type == "full_source":
+                file_block = f"=== File: {path_obj.name} ===\n" + content
             else:
+                lines = content.split("\n")
+                # 마지막 줄바꿈 뒤의 빈 요소는 readlines()에 없으므로 제거
+                if lines[-1] == "":
+                    lines.pop()
                 numbered_lines = [
                     f"{idx}|{line.rstrip()}"
                     for idx, line in enumerate(lines, start=1)
@@ -182,9 +381,11 @@ class BaseCodeGenerator(ABC):
         context_snippets = []
         for ctx_path in (input_data.context_files or []):
             ctx_obj = Path(ctx_path)
-            if ctx_obj.exists():
-                with open(ctx_obj, "r", encoding="utf-8") as f:
-                    context_snippets.append(f"=== File: {ctx_obj.name} ===\n{f.read()}")
+            try:
+                ctx_content = read_text_file(ctx_obj)
+            except FileNotFoundError:
+                continue
+            context_snippets.append(f"=== File: {ctx_obj.name} ===\n{ctx_content}")
         context_files_str = "\n\n".join(context_snippets)
 
         # 배치 프롬프트 생성
@@ -206,8 +407,7 @@ class BaseCodeGenerator(ABC):
             )
             batch_variables["call_stacks"] = call_stacks_str
 
-        with open(self.template_path, "r", encoding="utf-8") as f:
-            template_str = f.read()
+        template_str = load_template_file(str(self.template_path))
 
         return render_template(template_str, batch_variables)
 
@@ -399,12 +599,11 @@ class BaseCodeGenerator(ABC):
             str: call_stacks를 JSON 문자열 형태로 변환한 결과
         """
         call_stacks_list = []
+        # 중복 검사용 (list 선형 탐색 대신 tuple 집합으로 O(1) 확인)
+        seen_call_stacks = set()
 
         # 각 파일에 대해 public class 이름 생성 (파일명에서 확장자 제거)
-        file_class_names = []
-        for file_path in file_paths:
-            class_name = Path(file_path).stem
-            file_class_names.append(class_name)
+        file_class_names = {Path(file_path).stem for file_path in file_paths}
 
         # 각 sql_query에서 call_stacks 추출
         for sql_query in table_access_info.sql_queries:
@@ -431,11 +630,13 @@ class BaseCodeGenerator(ABC):
                 # file_class_names와 비교 (정확히 일치하는 경우만)
                 if method_class_name in file_class_names:
                     # 중복 방지
-                    if call_stack not in call_stacks_list:
+                    stack_key = tuple(call_stack)
+                    if stack_key not in seen_call_stacks:
+                        seen_call_stacks.add(stack_key)
                         call_stacks_list.append(call_stack)
 
         # JSON 문자열로 변환
-        return json.dumps(call_stacks_list, indent=2, ensure_ascii=False)
+        return dumps_pretty_json(call_stacks_list)
 
     def _get_sql_queries_for_prompt(
         self, table_access_info: TableAccessInfo, file_paths: List[str] = None
@@ -512,7 +713,7 @@ class BaseCodeGenerator(ABC):
                 }
             )
 
-        return json.dumps(relevant_queries, indent=2, ensure_ascii=False)
+        return dumps_pretty_json(relevant_queries)
 
     def _get_cache_key(self, prompt: str) -> str:
         """프롬프트의 캐시 키를 생성합니다."""
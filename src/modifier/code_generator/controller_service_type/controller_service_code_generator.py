@@ -6,7 +6,6 @@ Controller/Service 레이어를 대상으로 코드 수정을 수행하는 CodeG
 """
 
 import hashlib
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -19,8 +18,12 @@ from models.modification_plan import ModificationPlan
 from models.table_access_info import TableAccessInfo
 from modifier.batch_processor import BatchProcessor
 from modifier.llm.llm_provider import LLMProvider
+from util.file_utils import resolve_target_path
 
-from ..base_code_generator import BaseCodeGenerator
+from ..base_code_generator import (
+    BaseCodeGenerator,
+    dumps_table_info,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +60,7 @@ class ControllerOrServiceCodeGenerator(BaseCodeGenerator):
         # 캐시 확인
         cache_key = self._get_cache_key(prompt)
         if cache_key in self._prompt_cache:
-            logger.debug(f"캐시에서 응답을 가져왔습니다: {cache_key[:50]}...")
+            logger.debug("캐시에서 응답을 가져왔습니다: %s...", cache_key[:50])
             cached_output = self._prompt_cache[cache_key]
             # 캐시된 응답에도 file_mapping 추가
             cached_output.file_mapping = file_mapping
@@ -78,7 +81,7 @@ class ControllerOrServiceCodeGenerator(BaseCodeGenerator):
             try:
                 output.parsed_out = self.parse_llm_response(output)
             except Exception as e:
-                logger.debug(f"자동 Code 파싱 실패 (포맷 불일치 가능성): {e}")
+                logger.debug("자동 Code 파싱 실패 (포맷 불일치 가능성): %s", e)
                 output.parsed_out = None
 
             # 캐시에 저장
@@ -118,11 +121,7 @@ class ControllerOrServiceCodeGenerator(BaseCodeGenerator):
         # 배치 처리
         try:
             # variables에서 table_info와 layer_name 추출
-            table_info = {
-                "table_name": table_name,
-                "columns": columns,
-            }
-            table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+            table_info_str = dumps_table_info(table_name, columns)
 
             # extra_variables 준비
             extra_vars = {"file_count": len(batch)}
@@ -167,19 +166,19 @@ class ControllerOrServiceCodeGenerator(BaseCodeGenerator):
                 modified_code = mod.get("modified_code", "")
 
                 # LLM 응답에서 받은 절대 경로를 그대로 사용
-                file_path = Path(file_path_str)
-                if not file_path.is_absolute():
+                if not Path(file_path_str).is_absolute():
                     logger.warning(
                         f"LLM 응답에 상대 경로가 포함되었습니다: {file_path_str}. 절대 경로로 변환합니다."
                     )
-                    file_path = Path(self.config.target_project) / file_path
 
                 # 절대 경로로 정규화
-                file_path = file_path.resolve()
+                file_path = resolve_target_path(
+                    file_path_str, self.config.target_project
+                )
 
                 # 계획 객체 생성
                 plan = ModificationPlan(
-                    file_path=str(file_path),
+                    file_path=file_path,
                     layer_name=layer_name,
                     modification_type="encryption",
                     modified_code=modified_code,
@@ -15,10 +15,14 @@ TwoStepCodeGenerator와 ThreeStepCodeGenerator가 이 클래스를 상속합니
 
 import json
 import logging
+import os
 import re
+import weakref
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -33,11 +37,31 @@ from models.modification_context import ModificationContext
 from models.modification_plan import ModificationPlan
 from models.table_access_info import TableAccessInfo
 from modifier.llm.llm_provider import LLMProvider
-
-from ..base_code_generator import BaseCodeGenerator, CodeGeneratorError, render_template
+from util.file_utils import read_files_concurrently, read_text_file, resolve_target_path
+from util.json_utils import dumps_pretty_json, loads_json
+
+from ..base_code_generator import (
+    BaseCodeGenerator,
+    CodeGeneratorError,
+    count_tokens,
+    load_template_file,
+    render_template,
+)
 
 logger = logging.getLogger(__name__)
 
+# Execution 응답의 FILE 마커 (======FILE_1====== 또는 ======FILE======)
+_FILE_MARKER_RE = re.compile(r"======FILE(?:_(\d+))?======")
+
+# LLM이 반환한 인덱스 형식 파일 식별자 (예: FILE_1)
+_FILE_INDEX_RE = re.compile(r"FILE_(\d+)", re.IGNORECASE)
+
+# Java 패키지 선언 / 클래스 선언 (코드 시그니처 매칭용)
+_PACKAGE_RE = re.compile(r"package\s+([\w.]+)\s*;")
+_CLASS_DECL_RE = re.compile(
+    r"(?:public\s+)?(?:abstract\s+)?(?:class|interface|enum)\s+(\w+)"
+)
+
 
 # 토큰 계산을 위한 기본 템플릿 (BaseContextGenerator.create_batches()에서 사용)
 _TOKEN_CALCULATION_TEMPLATE = """
@@ -49,6 +73,67 @@ _TOKEN_CALCULATION_TEMPLATE = """
 """
 
 
+@lru_cache(maxsize=256)
+def _read_file_text(path_str: str, mtime_ns: int, size: int, add_line_num: bool) -> str:
+    """
+    파일 내용을 읽어 반환합니다. (경로 + 수정 시각 기준 프로세스 단위 캐시)
+
+    같은 VO/소스 파일이 Phase 1/2/3 및 여러 컨텍스트에서 반복해서 읽히므로
+    디스크 재읽기와 줄 번호 재생성을 생략합니다. 파일이 수정되면 mtime/크기가
+    바뀌므로 새로 읽습니다.
+
+    Args:
+        path_str: 파일 경로
+        mtime_ns: 파일 수정 시각 (ns, 캐시 키 용도)
+        size: 파일 크기 (캐시 키 용도)
+        add_line_num: 줄 번호 추가 여부
+
+    Returns:
+        str: 파일 내용 (add_line_num이면 "{번호}|{줄}" 형식)
+    """
+    text = read_text_file(path_str)
+    if not add_line_num:
+        return text
+
+    lines = text.split("\n")
+    if lines and not lines[-1]:
+        # 마지막 줄바꿈 뒤의 빈 조각은 줄이 아님 (readlines()와 동일)
+        lines.pop()
+    return "\n".join(
+        f"{idx}|{line.rstrip()}" for idx, line in enumerate(lines, start=1)
+    )
+
+
+def _load_file_texts(
+    file_paths: List[str], line_num_flags: Tuple[bool, ...]
+) -> List[Union[Tuple[str, ...], Exception]]:
+    """
+    여러 파일을 병렬로 stat/읽기 하여 입력 순서대로 반환합니다.
+
+    읽은 내용은 _read_file_text 캐시에 남으므로 같은 파일을 다시 읽을 때는
+    stat만 수행합니다.
+
+    Args:
+        file_paths: 파일 경로 리스트
+        line_num_flags: 파일마다 읽어올 버전 (각 항목은 줄 번호 추가 여부)
+
+    Returns:
+        List[Union[Tuple[str, ...], Exception]]: 파일별 내용 튜플
+            (line_num_flags 순서) 또는 읽기 중 발생한 예외
+    """
+
+    def load(file_path: str) -> Tuple[str, ...]:
+        path_str = str(file_path)
+        # exists() + stat() 대신 stat 한 번으로 존재 여부와 캐시 키를 함께 확인
+        stat = os.stat(path_str)
+        return tuple(
+            _read_file_text(path_str, stat.st_mtime_ns, stat.st_size, flag)
+            for flag in line_num_flags
+        )
+
+    return read_files_concurrently(file_paths, load)
+
+
 class BaseMultiStepCodeGenerator(BaseCodeGenerator):
     """
     다단계 LLM 협업 전략을 사용하는 CodeGenerator의 공통 기반 클래스.
@@ -73,8 +158,16 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         """
         self.config = config
         self._prompt_cache: Dict[str, Any] = {}
+        self._empty_prompt_tokens: Dict[Tuple[str, str], int] = {}
         self._session_timestamp: Optional[str] = None  # 세션 공유 timestamp
 
+        # 프롬프트/결과 파일 저장용 백그라운드 워커 (디스크 쓰기를 LLM 호출과 병행)
+        # 프로세스 종료 시 대기 중인 저장 작업이 모두 끝날 때까지 기다립니다.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="multi-step-io"
+        )
+        weakref.finalize(self, self._io_pool.shutdown, wait=True)
+
         # 토큰 인코더 초기화
         self._init_token_encoder()
 
@@ -406,9 +499,8 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
     # ========== 템플릿 및 렌더링 유틸리티 ==========
 
     def _load_template(self, template_path: Path) -> str:
-        """템플릿 파일을 로드합니다."""
-        with open(template_path, "r", encoding="utf-8") as f:
-            return f.read()
+        """템플릿 파일을 로드합니다. (프로세스 단위 캐시)"""
+        return load_template_file(str(template_path))
 
     def _render_template(self, template_str: str, variables: Dict[str, Any]) -> str:
         """Jinja2 템플릿을 렌더링합니다."""
@@ -428,27 +520,16 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
             str: 파일 내용 문자열 (=== File: ... === 포함)
         """
         snippets = []
-        for file_path in file_paths:
-            try:
-                path_obj = Path(file_path)
-                if path_obj.exists():
-                    with open(path_obj, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    if add_line_num:
-                        numbered_lines = [
-                            f"{idx}|{line.rstrip()}"
-                            for idx, line in enumerate(lines, start=1)
-                        ]
-                        content = "\n".join(numbered_lines)
-                    else:
-                        content = "".join(lines)
-
-                    snippets.append(f"=== File: {path_obj.name} ===\n{content}")
-                else:
-                    logger.warning(f"File not found: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to read file: {file_path} - {e}")
+        loaded = _load_file_texts(file_paths, (add_line_num,))
+        for file_path, result in zip(file_paths, loaded):
+            if isinstance(result, FileNotFoundError):
+                logger.warning(f"File not found: {file_path}")
+            elif isinstance(result, Exception):
+                logger.error(f"Failed to read file: {file_path} - {result}")
+            else:
+                snippets.append(
+                    f"=== File: {os.path.basename(str(file_path))} ===\n{result[0]}"
+                )
         return "\n\n".join(snippets)
 
     def _read_file_contents_indexed(
@@ -471,39 +552,34 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         index_to_path: Dict[int, str] = {}
         path_to_content: Dict[str, str] = {}
 
-        for idx, file_path in enumerate(file_paths, start=1):
-            try:
-                path_obj = Path(file_path)
-                if path_obj.exists():
-                    with open(path_obj, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    if add_line_num:
-                        numbered_lines = [
-                            f"{idx}|{line.rstrip()}"
-                            for idx, line in enumerate(lines, start=1)
-                        ]
-                        content = "\n".join(numbered_lines)
-                    else:
-                        content = "".join(lines)
-
-                    # 인덱스 형식으로 파일 헤더 생성
-                    snippets.append(
-                        f"[FILE_{idx}] {path_obj.name}\n"
-                        f"=== Content ===\n{content}"
-                    )
-                    index_to_path[idx] = file_path
-                    # 시그니처 매칭용으로는 원본 내용(줄번호 없는 것)을 사용해야 함
-                    # 따라서 줄번호가 있더라도 원본 내용을 따로 저장해야 할 수 있음.
-                    # 하지만 path_to_content는 _match_by_code_signature에서 사용됨.
-                    # 거기서는 content를 파싱해서 시그니처를 찾음.
-                    # 줄번호가 있으면 파싱이 어려울 수 있음.
-                    # 그래서 path_to_content에는 항상 raw content를 저장하는 것이 안전함.
-                    path_to_content[file_path] = "".join(lines)
-                else:
-                    logger.warning(f"File not found: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to read file: {file_path} - {e}")
+        # 줄번호가 없으면 원본 내용을 그대로 공유 (중복 문자열 생성 방지)
+        line_num_flags = (False, True) if add_line_num else (False,)
+        loaded = _load_file_texts(file_paths, line_num_flags)
+
+        for idx, (file_path, result) in enumerate(zip(file_paths, loaded), start=1):
+            if isinstance(result, FileNotFoundError):
+                logger.warning(f"File not found: {file_path}")
+                continue
+            if isinstance(result, Exception):
+                logger.error(f"Failed to read file: {file_path} - {result}")
+                continue
+
+            raw_content = result[0]
+            content = result[-1]
+
+            # 인덱스 형식으로 파일 헤더 생성
+            snippets.append(
+                f"[FILE_{idx}] {os.path.basename(str(file_path))}\n"
+                f"=== Content ===\n{content}"
+            )
+            index_to_path[idx] = file_path
+            # 시그니처 매칭용으로는 원본 내용(줄번호 없는 것)을 사용해야 함
+            # 따라서 줄번호가 있더라도 원본 내용을 따로 저장해야 할 수 있음.
+            # 하지만 path_to_content는 _match_by_code_signature에서 사용됨.
+            # 거기서는 content를 파싱해서 시그니처를 찾음.
+            # 줄번호가 있으면 파싱이 어려울 수 있음.
+            # 그래서 path_to_content에는 항상 raw content를 저장하는 것이 안전함.
+            path_to_content[file_path] = raw_content
 
         return "\n\n".join(snippets), index_to_path, path_to_content
 
@@ -525,15 +601,12 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         class_name = None
 
         # 패키지명 추출
-        package_match = re.search(r"package\s+([\w.]+)\s*;", code)
+        package_match = _PACKAGE_RE.search(code)
         if package_match:
             package_name = package_match.group(1)
 
         # 클래스명 추출 (class, interface, enum)
-        class_match = re.search(
-            r"(?:public\s+)?(?:abstract\s+)?(?:class|interface|enum)\s+(\w+)",
-            code,
-        )
+        class_match = _CLASS_DECL_RE.search(code)
         if class_match:
             class_name = class_match.group(1)
 
@@ -634,13 +707,11 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
             Tuple[Optional[str], str]: (해결된 파일 경로, 매칭 방법)
         """
         # 1. 인덱스 매칭 시도 (FILE_1, FILE_2, ...)
-        index_match = re.match(
-            r"FILE_(\d+)", llm_file_identifier.strip(), re.IGNORECASE
-        )
+        index_match = _FILE_INDEX_RE.match(llm_file_identifier.strip())
         if index_match:
             idx = int(index_match.group(1))
             if idx in index_to_path:
-                logger.debug(f"인덱스 매칭 성공: FILE_{idx} -> {index_to_path[idx]}")
+                logger.debug("인덱스 매칭 성공: FILE_%s -> %s", idx, index_to_path[idx])
                 return index_to_path[idx], "index"
 
         # 2. 정확한 파일명 매칭 시도
@@ -650,13 +721,13 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
             clean_name = Path(clean_name).name
 
         if clean_name in file_mapping:
-            logger.debug(f"정확한 파일명 매칭 성공: {clean_name}")
+            logger.debug("정확한 파일명 매칭 성공: %s", clean_name)
             return file_mapping[clean_name], "exact"
 
         # 3. 대소문자 무시 매칭
         lower_mapping = {k.lower(): v for k, v in file_mapping.items()}
         if clean_name.lower() in lower_mapping:
-            logger.debug(f"대소문자 무시 매칭 성공: {clean_name}")
+            logger.debug("대소문자 무시 매칭 성공: %s", clean_name)
             return lower_mapping[clean_name.lower()], "case_insensitive"
 
         # 4. 코드 시그니처 매칭 (가장 신뢰도 높음)
@@ -803,7 +874,7 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
 
         # Step 2: 1차 파싱 시도
         try:
-            result = json.loads(json_str)
+            result = loads_json(json_str)
             logger.info(f"{phase_name} 응답 파싱 성공")
             return result
         except json.JSONDecodeError as first_error:
@@ -814,13 +885,13 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         # Step 3: JSON 복구 후 재시도
         try:
             repaired_json = self._repair_json(json_str)
-            result = json.loads(repaired_json)
+            result = loads_json(repaired_json)
             logger.info(f"{phase_name} 응답 파싱 성공 (자동 복구 적용)")
             return result
         except json.JSONDecodeError as second_error:
             logger.error(f"{phase_name} JSON 파싱 최종 실패: {second_error}")
-            logger.debug(f"원본 응답 (처음 500자):\n{content[:500]}...")
-            logger.debug(f"추출된 JSON (처음 500자):\n{json_str[:500]}...")
+            logger.debug("원본 응답 (처음 500자):\n%s...", content[:500])
+            logger.debug("추출된 JSON (처음 500자):\n%s...", json_str[:500])
             raise ValueError(
                 f"{phase_name} JSON 파싱 실패: {second_error}\n"
                 f"자동 복구를 시도했으나 실패했습니다."
@@ -828,6 +899,22 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
 
     # ========== 프롬프트 저장 ==========
 
+    def _submit_io(self, func, *args, **kwargs) -> Future:
+        """
+        파일 저장 작업을 백그라운드 I/O 풀에 제출합니다.
+
+        저장 실패는 메인 흐름을 중단시키지 않고 경고 로그로만 남깁니다.
+        제출한 result 등의 객체는 이후 읽기 전용으로만 사용해야 합니다.
+        """
+        future = self._io_pool.submit(func, *args, **kwargs)
+
+        def _log_failure(f: Future) -> None:
+            if f.exception() is not None:
+                logger.warning(f"백그라운드 파일 저장 실패: {f.exception()}")
+
+        future.add_done_callback(_log_failure)
+        return future
+
     def _save_prompt_to_file(
         self,
         prompt: str,
@@ -954,7 +1041,7 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         }
 
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
+            f.write(dumps_pretty_json(save_data))
 
         logger.info(f"Step {step_number} ({phase_name}) 결과 저장됨: {output_path}")
         return output_path
@@ -994,9 +1081,7 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         file_mapping = {Path(fp).name: fp for fp in modification_context.file_paths}
 
         # 수정 지침을 JSON 문자열로 변환
-        instructions_str = json.dumps(
-            modification_instructions, indent=2, ensure_ascii=False
-        )
+        instructions_str = dumps_pretty_json(modification_instructions)
 
         # 템플릿 변수 준비
         variables = {
@@ -1067,7 +1152,7 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
                 continue
 
             # FILE 마커 찾기 (======FILE_1====== 또는 ======FILE====== 형식 모두 지원)
-            file_marker_match = re.search(r"======FILE(?:_(\d+))?======", block)
+            file_marker_match = _FILE_MARKER_RE.search(block)
             if not file_marker_match:
                 continue
 
@@ -1161,11 +1246,13 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
         prompt, index_to_path, file_mapping, path_to_content = (
             self._create_execution_prompt(modification_context, modification_instructions)
         )
-        logger.debug(f"Execution 프롬프트 길이: {len(prompt)} chars")
-        logger.debug(f"파일 인덱스 매핑: {list(index_to_path.keys())}")
+        logger.debug("Execution 프롬프트 길이: %d chars", len(prompt))
+        logger.debug("파일 인덱스 매핑: %s", list(index_to_path.keys()))
 
-        # 프롬프트 저장 (LLM 호출 직전)
-        self._save_prompt_to_file(prompt, modification_context, "execution")
+        # 프롬프트 저장 (LLM 호출과 병행, 백그라운드)
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "execution"
+        )
 
         # LLM 호출
         response = self._get_execution_provider().call(prompt)
@@ -1193,7 +1280,8 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
             ],
             "raw_response_length": len(response.get("content", "")),
         }
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=execution_step_number,
@@ -1243,7 +1331,7 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
     def calculate_token_size(self, text: str) -> int:
         """텍스트의 토큰 크기를 계산합니다."""
         if self.token_encoder:
-            return len(self.token_encoder.encode(text))
+            return count_tokens(self.token_encoder, text)
         else:
             # 간단한 추정: 문자 4개당 1토큰
             return len(text) // 4
@@ -1373,14 +1461,12 @@ class BaseMultiStepCodeGenerator(BaseCodeGenerator):
                 file_name = Path(file_path_str).name
                 reason = planning_reasons.get(file_name, "")
 
-                file_path = Path(file_path_str)
-                if not file_path.is_absolute():
-                    file_path = Path(self.config.target_project) / file_path
-
-                file_path = file_path.resolve()
+                file_path = resolve_target_path(
+                    file_path_str, self.config.target_project
+                )
 
                 plan = ModificationPlan(
-                    file_path=str(file_path),
+                    file_path=file_path,
                     layer_name=layer_name,
                     modification_type="encryption",
                     modified_code=modified_code,
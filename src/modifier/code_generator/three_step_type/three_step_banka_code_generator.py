@@ -11,7 +11,6 @@ BNK 온라인 타입 전용 3단계 LLM 협업 코드 생성기입니다.
 Phase 1(Data Mapping)은 부모 클래스와 동일하게 동작합니다 (VO 파일 제외).
 """
 
-import json
 import logging
 import re
 from dataclasses import dataclass
@@ -22,11 +21,19 @@ from config.config_manager import Configuration
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
 from parser.java_ast_parser import JavaASTParser
+from util.json_utils import dumps_compact_json, dumps_pretty_json
 
+from ..base_code_generator import (
+    dumps_table_info,
+    template_file_exists,
+)
 from .three_step_code_generator import ThreeStepCodeGenerator
 
 logger = logging.getLogger(__name__)
 
+# Method Execution 응답의 METHOD 마커 (예: ======METHOD_1======)
+_METHOD_MARKER_RE = re.compile(r"======METHOD_(\d+)======")
+
 
 @dataclass
 class MethodIndexEntry:
@@ -55,6 +62,9 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
     - 비-BIZ 파일 (SVC, DEM, DQM 등): 전체 내용 포함
     """
 
+    # 전용 Planning 프롬프트를 사용하므로 기본 Phase 2 입력 선행 준비는 생략
+    _PREFETCH_PLANNING_INPUTS = False
+
     def __init__(self, config: Configuration):
         super().__init__(config)
         self._java_parser = JavaASTParser()
@@ -65,7 +75,7 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
             self._method_execution_template_path = (
                 template_dir / "execution_template_banka_method.md"
             )
-            if not self._method_execution_template_path.exists():
+            if not template_file_exists(self._method_execution_template_path):
                 raise FileNotFoundError(
                     f"Method 모드 execution 템플릿을 찾을 수 없습니다: "
                     f"{self._method_execution_template_path}"
@@ -92,11 +102,10 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
         banka 타입에서는 VO 파일을 Phase 1 프롬프트에 포함시키지 않습니다.
         SQL 쿼리와 테이블 정보만으로 데이터 매핑을 분석합니다.
         """
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         sql_queries_str = self._get_sql_queries_for_prompt(
             table_access_info, modification_context.file_paths
@@ -124,17 +133,16 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
         BIZ 파일은 call_stack 기반 메서드만, 나머지 파일은 전체 내용을 포함합니다.
         """
         # 테이블/칼럼 정보
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         # call_stacks 원본 데이터 추출 (메서드 필터링에 사용)
         raw_call_stacks = self._extract_raw_call_stacks(
             modification_context.file_paths, table_access_info
         )
-        call_stacks_str = json.dumps(raw_call_stacks, indent=2, ensure_ascii=False)
+        call_stacks_str = dumps_pretty_json(raw_call_stacks)
 
         # source_files: BIZ=메서드만, 나머지=전체
         add_line_num: bool = (
@@ -148,7 +156,7 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
         )
 
         # mapping_info (Phase 1 결과)
-        mapping_info_str = json.dumps(mapping_info, indent=2, ensure_ascii=False)
+        mapping_info_str = dumps_pretty_json(mapping_info)
 
         variables = {
             "table_info": table_info_str,
@@ -181,7 +189,8 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
         """
         call_stacks_list: List[List[str]] = []
 
-        file_class_names = [Path(fp).stem for fp in file_paths]
+        file_class_names = {Path(fp).stem for fp in file_paths}
+        seen_call_stacks: Set[Tuple[str, ...]] = set()
 
         for sql_query in table_access_info.sql_queries:
             call_stacks = sql_query.get("call_stacks", [])
@@ -202,7 +211,9 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
                     method_class_name = first_method
 
                 if method_class_name in file_class_names:
-                    if call_stack not in call_stacks_list:
+                    stack_key = tuple(call_stack)
+                    if stack_key not in seen_call_stacks:
+                        seen_call_stacks.add(stack_key)
                         call_stacks_list.append(call_stack)
 
         return call_stacks_list
@@ -255,7 +266,8 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
 
         if not target_methods:
             logger.debug(
-                f"BIZ 파일에 call_stack 메서드 없음, 전체 포함: {Path(file_path).name}"
+                "BIZ 파일에 call_stack 메서드 없음, 전체 포함: %s",
+                Path(file_path).name,
             )
             return self._read_single_file(file_path, add_line_num)
 
@@ -280,7 +292,8 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
 
         if not method_ranges:
             logger.debug(
-                f"BIZ 파일에서 매칭 메서드 없음, 전체 포함: {Path(file_path).name}"
+                "BIZ 파일에서 매칭 메서드 없음, 전체 포함: %s",
+                Path(file_path).name,
             )
             return self._read_single_file(file_path, add_line_num)
 
@@ -428,11 +441,13 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
         self._method_index_map = {
             entry.index: entry for entry in method_index_info
         }
-        logger.debug(f"Method Execution 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Method Execution 프롬프트 길이: %d chars", len(prompt))
         logger.info(f"추출된 메서드 수: {len(method_index_info)}")
 
         # 프롬프트 저장
-        self._save_prompt_to_file(prompt, modification_context, "execution_method")
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "execution_method"
+        )
 
         # 3. LLM 호출
         response = self._get_execution_provider().call(prompt)
@@ -460,7 +475,8 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
             "modified_method_count": len(modified_methods),
             "raw_response_length": len(response.get("content", "")),
         }
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=execution_step_number,
@@ -639,9 +655,7 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
 
         # 프롬프트 렌더링
         source_methods_str = "\n\n".join(method_snippets)
-        instructions_str = json.dumps(
-            modification_instructions, indent=2, ensure_ascii=False
-        )
+        instructions_str = dumps_pretty_json(modification_instructions)
 
         template_str = self._load_template(self._get_execution_template_path())
         variables = {
@@ -681,7 +695,7 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
                 continue
 
             # METHOD 마커 찾기
-            method_marker = re.search(r"======METHOD_(\d+)======", block)
+            method_marker = _METHOD_MARKER_RE.search(block)
             if not method_marker:
                 continue
 
@@ -713,13 +727,17 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
                         }
                     )
                     logger.debug(
-                        f"METHOD_{idx} 파싱 완료: "
-                        f"{Path(entry.file_path).name}::{entry.method_name}"
+                        "METHOD_%s 파싱 완료: %s::%s",
+                        idx,
+                        Path(entry.file_path).name,
+                        entry.method_name,
                     )
                 else:
                     logger.debug(
-                        f"METHOD_{idx} SKIP: "
-                        f"{Path(entry.file_path).name}::{entry.method_name}"
+                        "METHOD_%s SKIP: %s::%s",
+                        idx,
+                        Path(entry.file_path).name,
+                        entry.method_name,
                     )
             else:
                 logger.warning(f"알 수 없는 메서드 인덱스: METHOD_{idx}")
@@ -765,12 +783,11 @@ class ThreeStepBankaCodeGenerator(ThreeStepCodeGenerator):
 
         result: List[Dict[str, Any]] = []
         for file_path, methods in file_modifications.items():
-            json_data = json.dumps(
+            json_data = dumps_compact_json(
                 {
                     "methods": methods,
                     "imports": self._ENCRYPTION_IMPORTS,
-                },
-                ensure_ascii=False,
+                }
             )
 
             result.append(
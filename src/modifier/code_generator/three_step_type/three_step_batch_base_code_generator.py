@@ -49,6 +49,9 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
     _create_batch_planning_prompt()를 구현해야 합니다.
     """
 
+    # 전용 Planning 프롬프트를 사용하므로 기본 Phase 2 입력 선행 준비는 생략
+    _PREFETCH_PLANNING_INPUTS = False
+
     def __init__(self, config):
         """
         ThreeStepBatchBaseCodeGenerator 초기화
@@ -162,8 +165,9 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
                 query["target_columns"] = target_columns
 
         logger.debug(
-            f"mapping_info에 target metadata 추가 완료: "
-            f"table={target_table}, columns={target_columns}"
+            "mapping_info에 target metadata 추가 완료: table=%s, columns=%s",
+            target_table,
+            target_columns,
         )
         return mapping_info
 
@@ -195,13 +199,15 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
             modification_context, table_access_info
         )
 
-        logger.debug(f"Query Analysis 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Query Analysis 프롬프트 길이: %d chars", len(prompt))
 
         # 프롬프트 저장
-        self._save_prompt_to_file(prompt, modification_context, "data_mapping")
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "data_mapping"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "data_mapping")
         tokens_used = response.get("tokens_used", 0)
         logger.info(f"Query Analysis 응답 완료 (토큰: {tokens_used})")
 
@@ -214,7 +220,8 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
         )
 
         # 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=1,
@@ -252,13 +259,15 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
             modification_context, table_access_info, mapping_info
         )
 
-        logger.debug(f"Planning 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Planning 프롬프트 길이: %d chars", len(prompt))
 
         # 프롬프트 저장
-        self._save_prompt_to_file(prompt, modification_context, "planning")
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "planning"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "planning")
         tokens_used = response.get("tokens_used", 0)
         logger.info(f"Planning 응답 완료 (토큰: {tokens_used})")
 
@@ -266,7 +275,8 @@ class ThreeStepBatchBaseCodeGenerator(ThreeStepCodeGenerator):
         modification_instructions = self._parse_json_response(response, "Planning")
 
         # 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=2,
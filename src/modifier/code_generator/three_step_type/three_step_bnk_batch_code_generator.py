@@ -20,14 +20,15 @@ CCS Batch와의 차이점:
                 └── ThreeStepBNKBatchCodeGenerator (BNK Batch 전용)
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict
 
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
+from util.json_utils import dumps_pretty_json
 
+from ..base_code_generator import dumps_table_info
 from .three_step_batch_base_code_generator import ThreeStepBatchBaseCodeGenerator
 
 logger = logging.getLogger(__name__)
@@ -116,11 +117,10 @@ class ThreeStepBNKBatchCodeGenerator(ThreeStepBatchBaseCodeGenerator):
         - sql_queries: XXX_SQL.xml에서 추출한 쿼리
         - xml_content: XML 파일 원본 (참조용)
         """
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         bat_source = self._read_file_contents(modification_context.file_paths)
 
@@ -163,18 +163,17 @@ class ThreeStepBNKBatchCodeGenerator(ThreeStepBatchBaseCodeGenerator):
 
         Note: call_stacks는 포함하지 않음 (BNK Batch는 BAT가 최상위)
         """
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         add_line_num = self.config and self.config.generate_type != "full_source"
         source_files_str = self._read_file_contents(
             modification_context.file_paths, add_line_num=add_line_num
         )
 
-        mapping_info_str = json.dumps(mapping_info, indent=2, ensure_ascii=False)
+        mapping_info_str = dumps_pretty_json(mapping_info)
 
         variables = {
             "table_info": table_info_str,
@@ -14,15 +14,21 @@ CCS 프로젝트의 특징:
             └── ThreeStepCCSCodeGenerator (CCS 전용)
 """
 
-import json
+import functools
 import logging
+import os
 import re
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Set, Tuple
 
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
+from util.file_utils import read_text_file
+from util.json_utils import dumps_pretty_json
 
+from ..base_code_generator import dumps_table_info
 from .three_step_code_generator import ThreeStepCodeGenerator
 
 logger = logging.getLogger(__name__)
@@ -48,6 +54,341 @@ CCS_UTIL_MAPPING: Dict[str, Dict[str, str]] = {
 }
 
 
+# SELECT 항목의 공백 alias 판별 시 제외할 SQL 키워드 (대문자)
+_SQL_KEYWORDS: FrozenSet[str] = frozenset({
+    "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "NULL", "IS",
+    "IN", "LIKE", "BETWEEN", "EXISTS", "CASE", "WHEN", "THEN",
+    "ELSE", "END", "AS", "ON", "JOIN", "LEFT", "RIGHT", "INNER",
+    "OUTER", "FULL", "CROSS", "ORDER", "BY", "GROUP", "HAVING",
+    "UNION", "ALL", "DISTINCT", "TOP", "LIMIT", "OFFSET", "INTO",
+    "VALUES", "SET", "UPDATE", "DELETE", "INSERT", "CREATE", "DROP",
+    "ALTER", "TABLE", "INDEX", "VIEW", "TRIGGER", "PROCEDURE",
+    "FUNCTION", "BEGIN", "COMMIT", "ROLLBACK", "GRANT", "REVOKE",
+})
+
+# 메인 SELECT 키워드 (SQL 전체를 대문자로 변환하지 않고 대소문자 무시 매칭)
+_SELECT_RE = re.compile(r"\bSELECT\s+", re.IGNORECASE)
+
+# 단순 컬럼 / 테이블.컬럼 형태의 SELECT 표현식 (예: USER_NM, A.USER_NM)
+_BARE_COL_RE = re.compile(r"^\s*(?:(\w+)\.)?(\w+)\s*$")
+
+# import 문에서 DQM 클래스명 추출 (예: import com.example.dqm.UserDQM;)
+_DQM_IMPORT_RE = re.compile(r"^\s*import\s+(?:[\w.]+\.)?(\w*DQM)\s*;", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=512)
+def _read_java_source(path_str: str, mtime_ns: int) -> str:
+    """
+    Java 소스 파일을 UTF-8로 읽습니다. (공용 read_text_file 사용, 줄바꿈은 \\n으로 통일)
+
+    mtime_ns를 캐시 키에 포함하여 파일이 변경되면 자동으로 다시 읽습니다.
+
+    Args:
+        path_str: 파일 경로
+        mtime_ns: 파일 수정 시각 (os.stat().st_mtime_ns)
+
+    Returns:
+        str: 파일 내용
+    """
+    return read_text_file(path_str)
+
+
+def _read_java_source_cached(file_path: str) -> str:
+    """파일 mtime을 키로 캐싱된 Java 소스 내용을 반환합니다."""
+    path_str = str(file_path)
+    return _read_java_source(path_str, os.stat(path_str).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_dqm_imports(path_str: str, mtime_ns: int) -> FrozenSet[str]:
+    """
+    Java 파일에서 import된 DQM 클래스명 집합을 추출합니다.
+
+    Args:
+        path_str: 파일 경로
+        mtime_ns: 파일 수정 시각 (캐시 무효화 키)
+
+    Returns:
+        FrozenSet[str]: DQM 클래스명 집합 (예: {"UserDQM"})
+    """
+    return frozenset(_DQM_IMPORT_RE.findall(_read_java_source(path_str, mtime_ns)))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_target_columns_pattern(target_cols_upper: FrozenSet[str]) -> re.Pattern:
+    """
+    대상 컬럼들을 하나의 alternation 정규식으로 컴파일합니다.
+
+    동일한 컬럼 조합은 컨텍스트/쿼리가 달라도 한 번만 컴파일됩니다.
+    긴 컬럼명을 먼저 두어 접두어가 겹치는 컬럼(USER_NM, USER_NM_ENC)도 정확히 매칭합니다.
+
+    Args:
+        target_cols_upper: 대상 컬럼 집합 (대문자)
+
+    Returns:
+        re.Pattern: 대상 컬럼 중 하나와 단어 단위로 매칭되는 패턴
+    """
+    alternation = "|".join(
+        re.escape(col) for col in sorted(target_cols_upper, key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_column_to_alias_mapping(
+    sql: str,
+    target_cols_upper: Tuple[str, ...],
+) -> Mapping[str, Tuple[str, ...]]:
+    """
+    SQL SELECT 절에서 target_columns에 해당하는 컬럼이 어떤 alias로 사용되는지 추출합니다.
+
+    처리하는 패턴:
+    1. 단순 AS: USER_NM AS AENAM
+    2. 테이블.컬럼 AS: A.USER_NM AS AENAM
+    3. 공백 alias (AS 생략): USER_NM AENAM
+    4. 서브쿼리 AS: (SELECT USER_NM FROM x) AS AENAM
+    5. 함수 내 컬럼: NVL(USER_NM, '') AS AENAM
+    6. alias 없음: SELECT USER_NM (자기 자신을 alias로)
+
+    동일한 DQM SQL이 같은 컬럼 조합으로 여러 컨텍스트에서 반복 조회되므로
+    (sql, target_cols_upper) 기준으로 결과를 캐싱합니다.
+    결과는 캐시와 공유되므로 읽기 전용 매핑으로 반환합니다.
+
+    Args:
+        sql: SQL 쿼리 텍스트
+        target_cols_upper: 관심 대상 컬럼명 튜플 (대문자, 예: ("USER_NM",))
+
+    Returns:
+        Mapping[str, Tuple[str, ...]]: {원본컬럼_upper: (alias1, alias2, ...)}
+        예: {"USER_NM": ("AENAM", "TRTR_NM")}
+    """
+    result: Dict[str, List[str]] = {col: [] for col in target_cols_upper}
+    # SELECT 항목별 멤버십 검사용 (SQL당 한 번만 생성)
+    target_cols_set = frozenset(target_cols_upper)
+
+    # SELECT 절 추출 (괄호 깊이를 고려하여 메인 FROM 찾기)
+    # SQL 전체를 대문자로 복사하지 않고 원본에서 대소문자 무시 비교
+    select_clause = _extract_main_select_clause(sql)
+    # 디버그 로그는 %-포맷으로 지연 평가 (DEBUG 비활성 시 슬라이싱/포맷 비용 없음)
+    logger.debug("[DEBUG-1] SQL 원본 (처음 200자): %.200s...", sql)
+    logger.debug(
+        "[DEBUG-2] 추출된 SELECT 절 (처음 500자): %.500s...",
+        select_clause or "EMPTY",
+    )
+    if not select_clause:
+        logger.warning("[DEBUG-3] SELECT 절 추출 실패!")
+        return _freeze_alias_mapping(result)
+
+    # SELECT 절을 쉼표로 분리 (괄호 내부는 무시)
+    items = _split_select_items(select_clause)
+    logger.debug("[DEBUG-4] 분리된 SELECT 항목 수: %d", len(items))
+
+    for item in items:
+        item = item.strip()
+        if not item:
+            continue
+
+        # 각 SELECT 항목에서 alias와 원본 컬럼 추출
+        original_col, alias = _parse_select_item(item, target_cols_set)
+        # target_columns와 매칭되는 경우만 로깅
+        if original_col:
+            logger.debug(
+                "[DEBUG-5] 항목 파싱 성공: item='%.80s...' → original=%s, alias=%s",
+                item,
+                original_col,
+                alias,
+            )
+
+        if original_col and original_col in target_cols_set:
+            # alias가 있으면 추가, 없으면 자기 자신을 alias로
+            final_alias = alias if alias else original_col
+            if final_alias not in result[original_col]:
+                result[original_col].append(final_alias)
+
+    return _freeze_alias_mapping(result)
+
+
+def _freeze_alias_mapping(
+    column_to_aliases: Dict[str, List[str]],
+) -> Mapping[str, Tuple[str, ...]]:
+    """{컬럼: [alias, ...]} 매핑을 캐시에 보관할 읽기 전용 매핑으로 변환합니다."""
+    return MappingProxyType(
+        {col: tuple(aliases) for col, aliases in column_to_aliases.items()}
+    )
+
+
+def _extract_main_select_clause(sql: str) -> str:
+    """
+    괄호 깊이를 고려하여 메인 쿼리의 SELECT 절을 추출합니다.
+
+    서브쿼리 내부의 FROM은 무시하고, 괄호 깊이가 0인 FROM만 찾습니다.
+    키워드 비교는 대소문자를 무시하며, 반환값은 원본 대소문자를 유지합니다.
+
+    Args:
+        sql: SQL 쿼리
+
+    Returns:
+        str: SELECT와 메인 FROM 사이의 문자열 (없으면 빈 문자열)
+    """
+    # SELECT 키워드 찾기
+    select_match = _SELECT_RE.search(sql)
+    if not select_match:
+        return ""
+
+    start_pos = select_match.end()
+    depth = 0
+    i = start_pos
+    sql_len = len(sql)
+
+    while i < sql_len:
+        char = sql[i]
+
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and (char == "F" or char == "f"):
+            # 괄호 깊이가 0일 때만 FROM 키워드 확인
+            if sql[i : i + 4].upper() == "FROM" and (
+                i == 0 or not sql[i - 1].isalnum()
+            ):
+                # FROM 뒤에 공백이나 줄바꿈이 있는지 확인 (단어 경계)
+                if i + 4 >= sql_len or not sql[i + 4].isalnum():
+                    return sql[start_pos:i].strip()
+
+        i += 1
+
+    # FROM을 못 찾으면 전체 반환 (SELECT만 있는 경우)
+    return sql[start_pos:].strip()
+
+
+def _split_select_items(select_clause: str) -> List[str]:
+    """
+    SELECT 절을 쉼표로 분리합니다. 괄호 내부의 쉼표는 무시합니다.
+
+    Args:
+        select_clause: SELECT와 FROM 사이의 문자열
+
+    Returns:
+        List[str]: 분리된 SELECT 항목들
+    """
+    items = []
+    current = []
+    depth = 0
+
+    for char in select_clause:
+        if char == "(":
+            depth += 1
+            current.append(char)
+        elif char == ")":
+            depth -= 1
+            current.append(char)
+        elif char == "," and depth == 0:
+            items.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+
+    if current:
+        items.append("".join(current))
+
+    return items
+
+
+def _parse_select_item(
+    item: str,
+    target_cols_upper: FrozenSet[str],
+) -> Tuple[str, str]:
+    """
+    SELECT 항목에서 원본 컬럼과 alias를 추출합니다.
+
+    Args:
+        item: 단일 SELECT 항목 (예: "A.USER_NM AS AENAM")
+        target_cols_upper: 대상 컬럼 집합 (대문자)
+
+    Returns:
+        Tuple[str, str]: (원본컬럼_upper, alias_upper) 또는 (None, None)
+    """
+    item = item.strip()
+
+    # SQL 주석 제거 (/* ... */ 및 -- 스타일)
+    # /* ... */ 주석 제거
+    item = re.sub(r"/\*.*?\*/", "", item, flags=re.DOTALL)
+    # -- 주석 제거 (줄 끝까지)
+    item = re.sub(r"--.*$", "", item, flags=re.MULTILINE)
+    item = item.strip()
+
+    # 패턴 1: 명시적 AS alias
+    # 예: USER_NM AS AENAM, A.USER_NM AS AENAM, (SELECT ...) AS AENAM
+    as_match = re.search(r"\bAS\s+(\w+)\s*$", item, re.IGNORECASE)
+    if as_match:
+        alias = as_match.group(1).upper()
+        # AS 앞부분에서 원본 컬럼 찾기
+        before_as = item[: as_match.start()].strip()
+        original = _extract_column_from_expression(before_as, target_cols_upper)
+        return (original, alias) if original else (None, None)
+
+    # 패턴 2: 공백 alias (AS 생략)
+    # 예: USER_NM AENAM (단, 괄호로 시작하지 않는 경우)
+    if not item.startswith("("):
+        # 마지막 단어가 alias일 수 있음 (단어가 2개 이상인 경우)
+        parts = item.split()
+        if len(parts) >= 2:
+            potential_alias = parts[-1].upper()
+            # alias가 키워드가 아닌 경우만
+            if potential_alias not in _SQL_KEYWORDS:
+                before_alias = " ".join(parts[:-1])
+                original = _extract_column_from_expression(
+                    before_alias, target_cols_upper
+                )
+                if original:
+                    return (original, potential_alias)
+
+    # 패턴 3: alias 없음 - 단순 컬럼 또는 테이블.컬럼
+    original = _extract_column_from_expression(item, target_cols_upper)
+    if original:
+        return (original, None)
+
+    return (None, None)
+
+
+def _extract_column_from_expression(
+    expr: str,
+    target_cols_upper: FrozenSet[str],
+) -> str:
+    """
+    표현식에서 target_columns에 해당하는 컬럼명을 추출합니다.
+
+    처리하는 케이스:
+    - 단순 컬럼: USER_NM
+    - 테이블.컬럼: A.USER_NM
+    - 서브쿼리: (SELECT USER_NM FROM ...)
+    - 함수: NVL(USER_NM, ''), DECODE(A.USER_NM, ...)
+
+    Args:
+        expr: SQL 표현식
+        target_cols_upper: 대상 컬럼 집합 (대문자)
+
+    Returns:
+        str: 찾은 컬럼명 (대문자) 또는 None
+    """
+    if not target_cols_upper:
+        return None
+
+    # 대부분의 SELECT 항목은 단순 컬럼/테이블.컬럼이므로 정규식 검색 없이 바로 판별
+    bare_match = _BARE_COL_RE.match(expr)
+    if bare_match:
+        col = bare_match.group(2).upper()
+        return col if col in target_cols_upper else None
+
+    # 함수/서브쿼리 표현식: target_columns 중 표현식에 포함된 컬럼 찾기
+    # 단어 경계를 사용하여 정확한 매칭 (대소문자 무시)
+    # A.USER_NM, USER_NM, NVL(USER_NM, ...) 등 모두 매칭
+    cols_re = _compile_target_columns_pattern(target_cols_upper)
+    match = cols_re.search(expr)
+    return match.group(0).upper() if match else None
+
+
 class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
     """
     CCS(AnyframeCCS) 프레임워크 전용 3단계 LLM 협업 Code 생성기
@@ -68,29 +409,23 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         # CCS 유틸리티 정보 초기화
         self.ccs_util_info = self._get_ccs_util_info()
 
+        # TableAccessInfo별 call_stack 클래스명 → SQL 쿼리 인덱스 역색인 캐시
+        # {id(table_access_info): (weakref(table_access_info), {class_name: {query_idx, ...}})}
+        # TableAccessInfo는 dataclass(eq=True)라 해시할 수 없어 WeakKeyDictionary 대신
+        # 약한 참조를 보관하고, 인스턴스가 해제되면 항목도 함께 제거합니다.
+        self._sql_class_index_cache: Dict[
+            int, Tuple["weakref.ref[TableAccessInfo]", Dict[str, Set[int]]]
+        ] = {}
+
         # CCS 전용 템플릿 경로 설정
+        # 템플릿은 해당 Phase에서 처음 사용할 때 로드합니다. (_get_ccs_template)
         template_dir = Path(__file__).parent
-        self.data_mapping_template_ccs_path = (
-            template_dir / "data_mapping_template_ccs.md"
-        )
-        self.planning_template_ccs_path = (
-            template_dir / "planning_template_ccs.md"
-        )
-        self.execution_template_ccs_path = (
-            template_dir / "execution_template_ccs.md"
-        )
-
-        # CCS 템플릿 존재 여부 확인
-        required_templates = [
-            self.data_mapping_template_ccs_path,
-            self.planning_template_ccs_path,
-            self.execution_template_ccs_path,
-        ]
-        for template_path in required_templates:
-            if not template_path.exists():
-                raise FileNotFoundError(
-                    f"CCS 템플릿을 찾을 수 없습니다: {template_path}"
-                )
+        self._ccs_template_paths: Dict[str, Path] = {
+            "data_mapping": template_dir / "data_mapping_template_ccs.md",
+            "planning": template_dir / "planning_template_ccs.md",
+            "execution": template_dir / "execution_template_ccs.md",
+        }
+        self._ccs_templates: Dict[str, str] = {}
 
         # 로깅
         if self.ccs_util_info:
@@ -135,6 +470,31 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         return f"""- **Common Utility**: `{common_util}`
 - **Masking Utility**: `{masking_util}`"""
 
+    def _get_ccs_template(self, phase: str) -> str:
+        """
+        CCS 전용 템플릿 내용을 반환합니다. 최초 사용 시 한 번만 로드합니다.
+
+        Args:
+            phase: 템플릿 종류 (data_mapping, planning, execution)
+
+        Returns:
+            str: 템플릿 문자열
+
+        Raises:
+            FileNotFoundError: 템플릿 파일이 없는 경우
+        """
+        template_str = self._ccs_templates.get(phase)
+        if template_str is None:
+            template_path = self._ccs_template_paths[phase]
+            try:
+                template_str = self._load_template(template_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"CCS 템플릿을 찾을 수 없습니다: {template_path}"
+                ) from None
+            self._ccs_templates[phase] = template_str
+        return template_str
+
     # ========== Phase 1 오버라이드: CCS 전용 Data Mapping ==========
 
     def _execute_data_mapping_phase(
@@ -157,13 +517,15 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             modification_context, table_access_info
         )
 
-        logger.debug(f"Query Analysis 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Query Analysis 프롬프트 길이: %d chars", len(prompt))
 
-        # 프롬프트 저장 (LLM 호출 직전)
-        self._save_prompt_to_file(prompt, modification_context, "data_mapping")
+        # 프롬프트 저장 (LLM 호출과 병행, 백그라운드)
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "data_mapping"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "data_mapping")
         tokens_used = response.get("tokens_used", 0)
         logger.info(f"Query Analysis 응답 완료 (토큰: {tokens_used})")
 
@@ -176,8 +538,9 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             mapping_info, table_access_info
         )
 
-        # 결과 저장
-        self._save_phase_result(
+        # 결과 저장 (백그라운드, mapping_info는 이후 단계에서 읽기 전용으로만 사용)
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=1,
@@ -224,8 +587,9 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
                 query["target_columns"] = target_columns
 
         logger.debug(
-            f"mapping_info에 target metadata 추가 완료: "
-            f"table={target_table}, columns={target_columns}"
+            "mapping_info에 target metadata 추가 완료: table=%s, columns=%s",
+            target_table,
+            target_columns,
         )
         return mapping_info
 
@@ -248,11 +612,10 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             str: 렌더링된 프롬프트
         """
         # 테이블/칼럼 정보
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         # target columns 추출 (관심 대상 컬럼명 리스트)
         target_columns = [col.get("name", "") for col in modification_context.columns]
@@ -267,266 +630,70 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             "sql_queries_with_mappings": sql_queries_with_mappings,
         }
 
-        template_str = self._load_template(self.data_mapping_template_ccs_path)
+        template_str = self._get_ccs_template("data_mapping")
         return self._render_template(template_str, variables)
 
-    def _extract_column_to_alias_mapping(
+    def _build_alias_to_original(
         self,
-        sql: str,
-        target_columns: List[str],
-    ) -> Dict[str, List[str]]:
-        """
-        SQL SELECT 절에서 target_columns에 해당하는 컬럼이 어떤 alias로 사용되는지 추출합니다.
-
-        처리하는 패턴:
-        1. 단순 AS: USER_NM AS AENAM
-        2. 테이블.컬럼 AS: A.USER_NM AS AENAM
-        3. 공백 alias (AS 생략): USER_NM AENAM
-        4. 서브쿼리 AS: (SELECT USER_NM FROM x) AS AENAM
-        5. 함수 내 컬럼: NVL(USER_NM, '') AS AENAM
-        6. alias 없음: SELECT USER_NM (자기 자신을 alias로)
-
-        Args:
-            sql: SQL 쿼리 텍스트
-            target_columns: 관심 대상 컬럼명 리스트 (예: ["USER_NM"])
-
-        Returns:
-            Dict[str, List[str]]: {원본컬럼_upper: [alias1, alias2, ...]}
-            예: {"USER_NM": ["AENAM", "TRTR_NM"]}
-        """
-        result: Dict[str, List[str]] = {col.upper(): [] for col in target_columns}
-        target_cols_upper = {col.upper() for col in target_columns}
-
-        # SQL을 대문자로 변환하여 비교 (원본은 보존)
-        sql_upper = sql.upper()
-
-        # SELECT 절 추출 (괄호 깊이를 고려하여 메인 FROM 찾기)
-        select_clause = self._extract_main_select_clause(sql_upper)
-        logger.debug(f"[DEBUG-1] SQL 원본 (처음 200자): {sql_upper[:200]}...")
-        logger.debug(f"[DEBUG-2] 추출된 SELECT 절 (처음 500자): {select_clause[:500] if select_clause else 'EMPTY'}...")
-        if not select_clause:
-            logger.warning("[DEBUG-3] SELECT 절 추출 실패!")
-            return result
-
-        # SELECT 절을 쉼표로 분리 (괄호 내부는 무시)
-        items = self._split_select_items(select_clause)
-        logger.debug(f"[DEBUG-4] 분리된 SELECT 항목 수: {len(items)}")
-
-        for item in items:
-            item = item.strip()
-            if not item:
-                continue
-
-            # 각 SELECT 항목에서 alias와 원본 컬럼 추출
-            original_col, alias = self._parse_select_item(item, target_cols_upper)
-            # target_columns와 매칭되는 경우만 로깅
-            if original_col:
-                logger.debug(f"[DEBUG-5] 항목 파싱 성공: item='{item[:80]}...' → original={original_col}, alias={alias}")
-
-            if original_col and original_col in target_cols_upper:
-                # alias가 있으면 추가, 없으면 자기 자신을 alias로
-                final_alias = alias if alias else original_col
-                if final_alias not in result[original_col]:
-                    result[original_col].append(final_alias)
-
-        return result
-
-    def _extract_main_select_clause(self, sql_upper: str) -> str:
-        """
-        괄호 깊이를 고려하여 메인 쿼리의 SELECT 절을 추출합니다.
-
-        서브쿼리 내부의 FROM은 무시하고, 괄호 깊이가 0인 FROM만 찾습니다.
-
-        Args:
-            sql_upper: 대문자로 변환된 SQL 쿼리
-
-        Returns:
-            str: SELECT와 메인 FROM 사이의 문자열 (없으면 빈 문자열)
-        """
-        # SELECT 키워드 찾기
-        select_match = re.search(r"\bSELECT\s+", sql_upper)
-        if not select_match:
-            return ""
-
-        start_pos = select_match.end()
-        depth = 0
-        i = start_pos
-
-        while i < len(sql_upper):
-            char = sql_upper[i]
-
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-            elif depth == 0:
-                # 괄호 깊이가 0일 때만 FROM 키워드 확인
-                if sql_upper[i:i+4] == "FROM" and (i == 0 or not sql_upper[i-1].isalnum()):
-                    # FROM 뒤에 공백이나 줄바꿈이 있는지 확인 (단어 경계)
-                    if i + 4 >= len(sql_upper) or not sql_upper[i+4].isalnum():
-                        return sql_upper[start_pos:i].strip()
-
-            i += 1
-
-        # FROM을 못 찾으면 전체 반환 (SELECT만 있는 경우)
-        return sql_upper[start_pos:].strip()
-
-    def _split_select_items(self, select_clause: str) -> List[str]:
-        """
-        SELECT 절을 쉼표로 분리합니다. 괄호 내부의 쉼표는 무시합니다.
-
-        Args:
-            select_clause: SELECT와 FROM 사이의 문자열
-
-        Returns:
-            List[str]: 분리된 SELECT 항목들
+        column_to_aliases: Mapping[str, Tuple[str, ...]],
+    ) -> Dict[str, str]:
         """
-        items = []
-        current = []
-        depth = 0
-
-        for char in select_clause:
-            if char == "(":
-                depth += 1
-                current.append(char)
-            elif char == ")":
-                depth -= 1
-                current.append(char)
-            elif char == "," and depth == 0:
-                items.append("".join(current))
-                current = []
-            else:
-                current.append(char)
+        {원본컬럼: (alias, ...)} 매핑을 alias → 원본 컬럼 역색인으로 변환합니다.
 
-        if current:
-            items.append("".join(current))
-
-        return items
-
-    def _parse_select_item(
-        self,
-        item: str,
-        target_cols_upper: set,
-    ) -> Tuple[str, str]:
-        """
-        SELECT 항목에서 원본 컬럼과 alias를 추출합니다.
+        같은 alias가 여러 컬럼에 등장하면 먼저 나온 컬럼을 사용합니다.
 
         Args:
-            item: 단일 SELECT 항목 (예: "A.USER_NM AS AENAM")
-            target_cols_upper: 대상 컬럼 집합 (대문자)
+            column_to_aliases: {원본컬럼: (alias1, alias2, ...)} 매핑 (alias는 대문자)
 
         Returns:
-            Tuple[str, str]: (원본컬럼_upper, alias_upper) 또는 (None, None)
+            Dict[str, str]: {alias_upper: 원본컬럼_upper}
         """
-        item = item.strip()
-
-        # SQL 주석 제거 (/* ... */ 및 -- 스타일)
-        # /* ... */ 주석 제거
-        item = re.sub(r"/\*.*?\*/", "", item, flags=re.DOTALL)
-        # -- 주석 제거 (줄 끝까지)
-        item = re.sub(r"--.*$", "", item, flags=re.MULTILINE)
-        item = item.strip()
-
-        # 패턴 1: 명시적 AS alias
-        # 예: USER_NM AS AENAM, A.USER_NM AS AENAM, (SELECT ...) AS AENAM
-        as_match = re.search(r"\bAS\s+(\w+)\s*$", item, re.IGNORECASE)
-        if as_match:
-            alias = as_match.group(1).upper()
-            # AS 앞부분에서 원본 컬럼 찾기
-            before_as = item[: as_match.start()].strip()
-            original = self._extract_column_from_expression(before_as, target_cols_upper)
-            return (original, alias) if original else (None, None)
-
-        # 패턴 2: 공백 alias (AS 생략)
-        # 예: USER_NM AENAM (단, 괄호로 시작하지 않는 경우)
-        if not item.startswith("("):
-            # 마지막 단어가 alias일 수 있음 (단어가 2개 이상인 경우)
-            parts = item.split()
-            if len(parts) >= 2:
-                potential_alias = parts[-1].upper()
-                # alias가 키워드가 아닌 경우만
-                if not self._is_sql_keyword(potential_alias):
-                    before_alias = " ".join(parts[:-1])
-                    original = self._extract_column_from_expression(
-                        before_alias, target_cols_upper
-                    )
-                    if original:
-                        return (original, potential_alias)
-
-        # 패턴 3: alias 없음 - 단순 컬럼 또는 테이블.컬럼
-        original = self._extract_column_from_expression(item, target_cols_upper)
-        if original:
-            return (original, None)
-
-        return (None, None)
+        alias_to_original: Dict[str, str] = {}
+        for original_col, aliases in column_to_aliases.items():
+            for alias in aliases:
+                alias_to_original.setdefault(alias, original_col)
+        return alias_to_original
 
-    def _extract_column_from_expression(
-        self,
-        expr: str,
-        target_cols_upper: set,
-    ) -> str:
+    def _get_sql_class_index(
+        self, table_access_info: TableAccessInfo
+    ) -> Dict[str, Set[int]]:
         """
-        표현식에서 target_columns에 해당하는 컬럼명을 추출합니다.
+        call_stack에 등장하는 클래스명 → SQL 쿼리 인덱스 역색인을 반환합니다.
 
-        처리하는 케이스:
-        - 단순 컬럼: USER_NM
-        - 테이블.컬럼: A.USER_NM
-        - 서브쿼리: (SELECT USER_NM FROM ...)
-        - 함수: NVL(USER_NM, ''), DECODE(A.USER_NM, ...)
+        같은 TableAccessInfo가 여러 ModificationContext에서 반복 사용되므로
+        TableAccessInfo 인스턴스당 한 번만 구성하여 재사용합니다.
 
         Args:
-            expr: SQL 표현식
-            target_cols_upper: 대상 컬럼 집합 (대문자)
+            table_access_info: 테이블 접근 정보
 
         Returns:
-            str: 찾은 컬럼명 (대문자) 또는 None
+            Dict[str, Set[int]]: {클래스명: {sql_queries 인덱스, ...}}
         """
-        expr_upper = expr.upper()
-
-        # target_columns 중 표현식에 포함된 컬럼 찾기
-        for col in target_cols_upper:
-            # 단어 경계를 사용하여 정확한 매칭
-            # A.USER_NM, USER_NM, NVL(USER_NM, ...) 등 모두 매칭
-            pattern = rf"\b{re.escape(col)}\b"
-            if re.search(pattern, expr_upper):
-                return col
-
-        return None
-
-    def _is_sql_keyword(self, word: str) -> bool:
-        """SQL 키워드인지 확인합니다."""
-        keywords = {
-            "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "NULL", "IS",
-            "IN", "LIKE", "BETWEEN", "EXISTS", "CASE", "WHEN", "THEN",
-            "ELSE", "END", "AS", "ON", "JOIN", "LEFT", "RIGHT", "INNER",
-            "OUTER", "FULL", "CROSS", "ORDER", "BY", "GROUP", "HAVING",
-            "UNION", "ALL", "DISTINCT", "TOP", "LIMIT", "OFFSET", "INTO",
-            "VALUES", "SET", "UPDATE", "DELETE", "INSERT", "CREATE", "DROP",
-            "ALTER", "TABLE", "INDEX", "VIEW", "TRIGGER", "PROCEDURE",
-            "FUNCTION", "BEGIN", "COMMIT", "ROLLBACK", "GRANT", "REVOKE",
-        }
-        return word.upper() in keywords
-
-    def _find_original_column(
-        self,
-        alias: str,
-        column_to_aliases: Dict[str, List[str]],
-    ) -> str:
-        """
-        alias에서 원본 컬럼을 역추적합니다.
+        cache = self._sql_class_index_cache
+        key = id(table_access_info)
+        cached = cache.get(key)
+        if cached is not None and cached[0]() is table_access_info:
+            return cached[1]
+
+        class_index: Dict[str, Set[int]] = {}
+        for idx, sql_query in enumerate(table_access_info.sql_queries):
+            for call_stack in sql_query.get("call_stacks", []):
+                if not isinstance(call_stack, list):
+                    continue
+                for method_sig in call_stack:
+                    if not isinstance(method_sig, str):
+                        continue
+                    method_class_name = method_sig.partition(".")[0]
+                    class_index.setdefault(method_class_name, set()).add(idx)
 
-        Args:
-            alias: SQL alias (대문자)
-            column_to_aliases: {원본컬럼: [alias1, alias2, ...]} 매핑
+        def _evict(ref: "weakref.ref[TableAccessInfo]") -> None:
+            # 같은 id를 재사용한 새 인스턴스의 항목은 남겨 둠
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
 
-        Returns:
-            str: 원본 컬럼명 또는 None
-        """
-        alias_upper = alias.upper()
-        for original_col, aliases in column_to_aliases.items():
-            if alias_upper in [a.upper() for a in aliases]:
-                return original_col
-        return None
+        cache[key] = (weakref.ref(table_access_info, _evict), class_index)
+        return class_index
 
     def _format_ccs_sql_with_relevant_mappings(
         self,
@@ -549,36 +716,31 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             str: 포맷팅된 SQL 쿼리 + 매핑 정보 문자열
         """
         # 파일 경로에서 클래스명 추출 (필터링용)
-        file_class_names = set()
-        if file_paths:
-            for file_path in file_paths:
-                class_name = Path(file_path).stem
-                file_class_names.add(class_name)
+        file_class_names: FrozenSet[str] = frozenset(
+            Path(file_path).stem for file_path in file_paths or ()
+        )
 
-        output_parts = []
+        # 관련 SQL 인덱스를 역색인으로 한 번에 계산 (쿼리별 call_stack 중첩 순회 제거)
+        relevant_query_indices = None
+        if file_class_names:
+            class_index = self._get_sql_class_index(table_access_info)
+            relevant_query_indices = set()
+            for class_name in file_class_names:
+                relevant_query_indices.update(class_index.get(class_name, ()))
+
+        # 쿼리 루프 밖에서 한 번만 계산하는 불변 값들
+        # (컬럼 정규식은 _compile_target_columns_pattern에서 조합별로 한 번만 컴파일됨)
+        target_cols_upper = tuple(dict.fromkeys(col.upper() for col in target_columns))
+        target_columns_label = ", ".join(target_columns)
+
+        # 쿼리별로 완성된 블록 문자열 하나씩 보관 (마지막에 한 번만 join)
+        query_blocks: List[str] = []
         query_num = 0
 
-        for sql_query in table_access_info.sql_queries:
+        for idx, sql_query in enumerate(table_access_info.sql_queries):
             # 파일 경로가 지정된 경우 관련 SQL만 필터링
-            if file_paths and file_class_names:
-                call_stacks = sql_query.get("call_stacks", [])
-                is_relevant = False
-                for call_stack in call_stacks:
-                    if not isinstance(call_stack, list):
-                        continue
-                    for method_sig in call_stack:
-                        if not isinstance(method_sig, str):
-                            continue
-                        method_class_name = (
-                            method_sig.split(".")[0] if "." in method_sig else method_sig
-                        )
-                        if method_class_name in file_class_names:
-                            is_relevant = True
-                            break
-                    if is_relevant:
-                        break
-                if not is_relevant:
-                    continue
+            if relevant_query_indices is not None and idx not in relevant_query_indices:
+                continue
 
             query_num += 1
             query_id = sql_query.get("id", "unknown")
@@ -586,57 +748,56 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
             sql_text = sql_query.get("sql", "")
             strategy_specific = sql_query.get("strategy_specific", {})
 
-            # 쿼리 헤더
-            output_parts.append(f"### Query {query_num}: {query_id} ({query_type})")
-            output_parts.append("")
-
-            # SQL 텍스트 (strategy_specific 제외한 간결한 형태)
-            output_parts.append("**SQL:**")
-            output_parts.append("```sql")
-            output_parts.append(sql_text.strip())
-            output_parts.append("```")
-            output_parts.append("")
-
             # 메타 정보
             param_type = strategy_specific.get("parameter_type", "")
             result_type = strategy_specific.get("result_type", "")
+            meta_info = ""
             if param_type:
-                output_parts.append(f"- **Parameter Type:** `{param_type}`")
+                meta_info += f"- **Parameter Type:** `{param_type}`\n"
             if result_type:
-                output_parts.append(f"- **Result Type:** `{result_type}`")
-            output_parts.append("")
+                meta_info += f"- **Result Type:** `{result_type}`\n"
 
             # 관련 필드 매핑 (alias 기반 필터링)
             relevant_mappings = []
 
             if query_type == "SELECT":
                 # Step 1: SQL에서 target_columns의 alias 추출
-                column_to_aliases = self._extract_column_to_alias_mapping(
-                    sql_text, target_columns
+                column_to_aliases = _extract_column_to_alias_mapping(
+                    sql_text, target_cols_upper
+                )
+                logger.debug(
+                    "[DEBUG-6] Query %s: column_to_aliases = %s",
+                    query_id,
+                    column_to_aliases,
                 )
-                logger.info(f"[DEBUG-6] Query {query_id}: column_to_aliases = {column_to_aliases}")
 
                 # Step 2: alias 집합 구성 (target_columns + 그들의 alias들)
-                relevant_aliases = set()
-                for col in target_columns:
-                    col_upper = col.upper()
-                    relevant_aliases.add(col_upper)  # 원본 컬럼도 포함
-                    for alias in column_to_aliases.get(col_upper, []):
-                        relevant_aliases.add(alias.upper())
-                logger.info(f"[DEBUG-7] Query {query_id}: relevant_aliases = {relevant_aliases}")
+                # alias는 _extract_column_to_alias_mapping에서 이미 대문자로 저장됨
+                alias_to_original = self._build_alias_to_original(column_to_aliases)
+                relevant_aliases = set(target_cols_upper)  # 원본 컬럼도 포함
+                relevant_aliases.update(alias_to_original)
+                logger.debug(
+                    "[DEBUG-7] Query %s: relevant_aliases = %s",
+                    query_id,
+                    relevant_aliases,
+                )
 
                 # Step 3: resultMap에서 relevant_aliases에 해당하는 매핑만 필터링
                 result_field_mappings = strategy_specific.get(
                     "result_field_mappings", []
                 )
-                logger.info(f"[DEBUG-8] Query {query_id}: result_field_mappings = {result_field_mappings[:5]}... (총 {len(result_field_mappings)}개)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[DEBUG-8] Query %s: result_field_mappings = %s... (총 %d개)",
+                        query_id,
+                        result_field_mappings[:5],
+                        len(result_field_mappings),
+                    )
                 for java_field, db_column in result_field_mappings:
                     db_col_upper = db_column.upper()
                     if db_col_upper in relevant_aliases:
                         # 원본 컬럼 역추적
-                        original_col = self._find_original_column(
-                            db_column, column_to_aliases
-                        )
+                        original_col = alias_to_original.get(db_col_upper)
                         if original_col and original_col != db_col_upper:
                             # alias가 있는 경우: 원본 컬럼과 alias 함께 표시
                             relevant_mappings.append(
@@ -662,25 +823,37 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
                         )
 
             if relevant_mappings:
-                output_parts.append(
-                    f"**Relevant Field Mappings for Target Columns ({', '.join(target_columns)}):**"
+                mappings_section = (
+                    f"**Relevant Field Mappings for Target Columns ({target_columns_label}):**\n"
+                    + "\n".join(relevant_mappings)
                 )
-                output_parts.extend(relevant_mappings)
             else:
-                output_parts.append(
+                mappings_section = (
                     "**Field Mappings:** No direct mapping found for target columns. "
                     "Infer from SQL parameter names or use camelCase conversion."
                 )
 
-            output_parts.append("")
-            output_parts.append("---")
-            output_parts.append("")
+            # 쿼리 헤더 + SQL 텍스트(strategy_specific 제외한 간결한 형태) + 메타 정보 + 매핑
+            query_blocks.append(
+                f"### Query {query_num}: {query_id} ({query_type})\n"
+                f"\n"
+                f"**SQL:**\n"
+                f"```sql\n"
+                f"{sql_text.strip()}\n"
+                f"```\n"
+                f"\n"
+                f"{meta_info}"
+                f"\n"
+                f"{mappings_section}\n"
+                f"\n"
+                f"---\n"
+            )
 
         if query_num == 0:
             return "No relevant SQL queries found for this context."
 
         logger.info(f"CCS SQL 쿼리 포맷팅 완료: {query_num}개 쿼리")
-        return "\n".join(output_parts)
+        return "\n".join(query_blocks)
 
     # ========== DQM.java 정보 추출 (Phase 2용) ==========
 
@@ -706,16 +879,12 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         imported_dqm_classes = set()
         for file_path in modification_context.file_paths:
             try:
-                content = Path(file_path).read_text(encoding="utf-8")
-                for line in content.split("\n"):
-                    line = line.strip()
-                    # import 문에서 DQM 클래스 추출
-                    # 예: import com.example.dqm.UserDQM;
-                    if line.startswith("import ") and "DQM" in line:
-                        # 세미콜론 제거 후 마지막 부분(클래스명) 추출
-                        class_part = line.replace(";", "").split(".")[-1].strip()
-                        if class_part.upper().endswith("DQM"):
-                            imported_dqm_classes.add(class_part)
+                # import 문에서 DQM 클래스 추출 (파일 mtime 기준 캐싱)
+                # 예: import com.example.dqm.UserDQM;
+                path_str = str(file_path)
+                imported_dqm_classes.update(
+                    _extract_dqm_imports(path_str, os.stat(path_str).st_mtime_ns)
+                )
             except Exception as e:
                 logger.warning(f"DQM import 추출 실패: {file_path} - {e}")
                 continue
@@ -748,7 +917,7 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         output_parts = []
         for file_path in dqm_java_files:
             try:
-                content = Path(file_path).read_text(encoding="utf-8")
+                content = _read_java_source_cached(file_path)
                 file_name = Path(file_path).name
                 output_parts.append(f"### {file_name}")
                 output_parts.append("")
@@ -777,25 +946,20 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         CCS 전용 planning 템플릿을 사용합니다.
         """
         # 테이블/칼럼 정보
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
-        # 소스 파일 내용
-        add_line_num: bool = self.config and self.config.generate_type != "full_source"
-        source_files_str = self._read_file_contents(
-            modification_context.file_paths, add_line_num=add_line_num
+        # 소스 파일 내용 + Call Stacks 정보 (Phase 1 진행 중 선행 준비된 결과 사용)
+        planning_inputs = self._get_planning_inputs(
+            modification_context, table_access_info
         )
+        source_files_str = planning_inputs["source_files"]
+        call_stacks_str = planning_inputs["call_stacks"]
 
         # mapping_info (Phase 1 결과)를 JSON 문자열로 변환
-        mapping_info_str = json.dumps(mapping_info, indent=2, ensure_ascii=False)
-
-        # Call Stacks 정보
-        call_stacks_str = self._get_callstacks_from_table_access_info(
-            modification_context.file_paths, table_access_info
-        )
+        mapping_info_str = dumps_pretty_json(mapping_info)
 
         # DQM.java 정보 추출 (XML query id ↔ Java 메서드 매핑용)
         dqm_java_info = self._extract_dqm_java_info(
@@ -827,7 +991,7 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         }
 
         # CCS 전용 planning 템플릿 사용
-        template_str = self._load_template(self.planning_template_ccs_path)
+        template_str = self._get_ccs_template("planning")
         return self._render_template(template_str, variables)
 
     # ========== Phase 3 헬퍼: Instruction 포맷 변환 ==========
@@ -1006,7 +1170,7 @@ class ThreeStepCCSCodeGenerator(ThreeStepCodeGenerator):
         }
 
         # CCS 전용 execution 템플릿 사용
-        template_str = self._load_template(self.execution_template_ccs_path)
+        template_str = self._get_ccs_template("execution")
         prompt = self._render_template(template_str, variables)
 
         return prompt, index_to_path, file_mapping, path_to_content
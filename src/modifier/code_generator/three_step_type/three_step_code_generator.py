@@ -11,17 +11,27 @@ Phase 1, 2는 분석 능력이 뛰어난 모델 (예: GPT-OSS-120B)이 수행하
 Phase 3는 코드 생성 안정성이 높은 모델 (예: Codestral-2508)이 수행합니다.
 """
 
-import json
+import hashlib
 import logging
+import os
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from config.config_manager import Configuration, ThreeStepConfig
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
 from modifier.llm.llm_factory import create_llm_provider
 from modifier.llm.llm_provider import LLMProvider
+from util.json_utils import dumps_pretty_json, loads_json
 
+from ..base_code_generator import (
+    dumps_table_info,
+    template_file_exists,
+)
 from ..multi_step_base import BaseMultiStepCodeGenerator
 
 logger = logging.getLogger(__name__)
@@ -30,6 +40,10 @@ logger = logging.getLogger(__name__)
 class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
     """3단계 LLM 협업 Code 생성기 (VO Extraction + Planning + Execution)"""
 
+    # Phase 1 LLM 호출 중에 Phase 2 입력(소스 파일, call stack)을 미리 준비할지 여부
+    # _create_planning_prompt()를 독자적으로 구현하는 서브클래스는 False로 설정합니다.
+    _PREFETCH_PLANNING_INPUTS: bool = True
+
     def __init__(self, config: Configuration):
         """
         ThreeStepCodeGenerator 초기화
@@ -51,33 +65,50 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
 
         self.three_step_config: ThreeStepConfig = config.three_step_config
 
-        # LLM Provider 초기화
-        # Phase 1, 2: 분석용 (analysis_provider)
-        logger.info(
-            f"Analysis LLM 초기화: {self.three_step_config.analysis_provider} "
-            f"(model: {self.three_step_config.analysis_model})"
-        )
-        self.analysis_provider: LLMProvider = create_llm_provider(
-            provider_name=self.three_step_config.analysis_provider,
-            model_id=self.three_step_config.analysis_model,
-        )
+        # LLM Provider는 처음 사용할 때 생성 (analysis_provider / execution_provider)
+        # plan_only / execution_only 모드에서는 한쪽만 초기화됩니다.
 
-        # Phase 3: 코드 생성용 (execution_provider)
-        logger.info(
-            f"Execution LLM 초기화: {self.three_step_config.execution_provider} "
-            f"(model: {self.three_step_config.execution_model})"
-        )
-        self.execution_provider: LLMProvider = create_llm_provider(
-            provider_name=self.three_step_config.execution_provider,
-            model_id=self.three_step_config.execution_model,
+        # 템플릿 경로 결정 및 존재 여부 확인 (서브클래스 훅, 1회만 수행)
+        self._resolve_template_paths(Path(__file__).parent)
+
+        # BaseContextGenerator.create_batches()에서 토큰 계산을 위해 사용하는 속성
+        self.template_path = self.planning_template_path
+
+        # Phase 2 입력 선행 준비용 워커 (Phase 1 LLM 응답 대기 시간과 겹쳐 실행)
+        self._prefetch_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="three-step-prefetch"
         )
+        weakref.finalize(self, self._prefetch_pool.shutdown, wait=False)
+        self._planning_inputs_future: Optional[Tuple[int, Future]] = None
+
+        # 분석 LLM (Phase 1, 2) 응답 디스크 캐시 (설정 시에만 사용)
+        # 상대 경로는 target_project 기준이며, 디렉토리는 첫 저장 시 생성합니다.
+        self._analysis_cache_dir: Optional[Path] = None
+        if self.three_step_config.analysis_cache_dir:
+            self._analysis_cache_dir = (
+                Path(config.target_project) / self.three_step_config.analysis_cache_dir
+            )
 
-        # 템플릿 로드
-        template_dir = Path(__file__).parent
+        # 출력 디렉토리 초기화 (부모 클래스 메서드 사용)
+        self._init_output_directory()
+
+    def _resolve_template_paths(self, template_dir: Path) -> None:
+        """
+        Phase별 템플릿 경로를 결정하고 존재 여부를 확인합니다.
+
+        __init__에서 한 번만 호출됩니다. 다른 위치의 템플릿을 사용하는
+        서브클래스는 이 메서드를 오버라이드합니다.
+
+        Args:
+            template_dir: 템플릿 디렉토리 경로
+
+        Raises:
+            NotImplementedError: 지원하지 않는 generate_type인 경우
+            FileNotFoundError: 템플릿 파일이 없는 경우
+        """
         self.data_mapping_template_path = template_dir / "data_mapping_template.md"
         self.planning_template_path = template_dir / "planning_template.md"
 
-
         if self.config.generate_type == "full_source":
             execution_template_name = "execution_template_full.md"
         elif self.config.generate_type == "diff":
@@ -98,7 +129,7 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
             self.planning_template_path,
             self.execution_template_path,
         ]:
-            if not template_path.exists():
+            if not template_file_exists(template_path):
                 raise FileNotFoundError(
                     f"\n{'='*60}\n"
                     f" [오류] 템플릿 파일을 찾을 수 없습니다\n"
@@ -115,11 +146,37 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
                     f"{'='*60}"
                 )
 
-        # BaseContextGenerator.create_batches()에서 토큰 계산을 위해 사용하는 속성
-        self.template_path = self.planning_template_path
+    # ========== LLM Provider (지연 초기화) ==========
 
-        # 출력 디렉토리 초기화 (부모 클래스 메서드 사용)
-        self._init_output_directory()
+    @cached_property
+    def analysis_provider(self) -> LLMProvider:
+        """Phase 1, 2: 분석용 LLM Provider (첫 사용 시 생성)"""
+        logger.info(
+            f"Analysis LLM 초기화: {self.three_step_config.analysis_provider} "
+            f"(model: {self.three_step_config.analysis_model})"
+        )
+        return create_llm_provider(
+            provider_name=self.three_step_config.analysis_provider,
+            model_id=self.three_step_config.analysis_model,
+            requests_per_minute=self.config.llm_requests_per_minute,
+            tokens_per_minute=self.config.llm_tokens_per_minute,
+            expected_output_tokens=self.config.llm_expected_output_tokens,
+        )
+
+    @cached_property
+    def execution_provider(self) -> LLMProvider:
+        """Phase 3: 코드 생성용 LLM Provider (첫 사용 시 생성)"""
+        logger.info(
+            f"Execution LLM 초기화: {self.three_step_config.execution_provider} "
+            f"(model: {self.three_step_config.execution_model})"
+        )
+        return create_llm_provider(
+            provider_name=self.three_step_config.execution_provider,
+            model_id=self.three_step_config.execution_model,
+            requests_per_minute=self.config.llm_requests_per_minute,
+            tokens_per_minute=self.config.llm_tokens_per_minute,
+            expected_output_tokens=self.config.llm_expected_output_tokens,
+        )
 
     # ========== 추상 메서드 구현 ==========
 
@@ -157,13 +214,11 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
 
     def _get_planning_reasons(self, planning_result: Dict[str, Any]) -> Dict[str, str]:
         """Planning 결과에서 파일명 -> reason 매핑 추출"""
-        planning_reasons = {}
-        for instr in planning_result.get("modification_instructions", []):
-            file_name = instr.get("file_name", "")
-            reason = instr.get("reason", "")
-            if file_name:
-                planning_reasons[file_name] = reason
-        return planning_reasons
+        return {
+            file_name: instr.get("reason", "")
+            for instr in planning_result.get("modification_instructions", [])
+            if (file_name := instr.get("file_name", ""))
+        }
 
     def _execute_planning_phases(
         self,
@@ -186,10 +241,25 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
         """
         total_tokens = 0
 
+        # Phase 2 입력은 Phase 1 결과와 무관하므로 Phase 1 LLM 호출과 병행 준비
+        if self._PREFETCH_PLANNING_INPUTS:
+            self._planning_inputs_future = (
+                id(modification_context),
+                self._prefetch_pool.submit(
+                    self._prepare_planning_inputs,
+                    modification_context,
+                    table_access_info,
+                ),
+            )
+
         # ===== Phase 1: Data Mapping Extraction =====
-        mapping_info, phase1_tokens = self._execute_data_mapping_phase(
-            session_dir, modification_context, table_access_info
-        )
+        try:
+            mapping_info, phase1_tokens = self._execute_data_mapping_phase(
+                session_dir, modification_context, table_access_info
+            )
+        except Exception:
+            self._planning_inputs_future = None
+            raise
         total_tokens += phase1_tokens
 
         # ===== Phase 2: Planning =====
@@ -209,11 +279,10 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
     ) -> str:
         """Phase 1 (Data Mapping Extraction) 프롬프트를 생성합니다."""
         # 테이블/칼럼 정보 (★ 타겟 테이블 명시)
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         # VO 파일 내용 (context_files)
         vo_files_str = self._read_file_contents(
@@ -250,13 +319,15 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
             modification_context, table_access_info
         )
 
-        logger.debug(f"Query Analysis 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Query Analysis 프롬프트 길이: %d chars", len(prompt))
 
-        # 프롬프트 저장 (LLM 호출 직전)
-        self._save_prompt_to_file(prompt, modification_context, "data_mapping")
+        # 프롬프트 저장 (LLM 호출과 병행, 백그라운드)
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "data_mapping"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "data_mapping")
         tokens_used = response.get("tokens_used", 0)
         logger.info(f"Query Analysis 응답 완료 (토큰: {tokens_used})")
 
@@ -264,7 +335,8 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
         mapping_info = self._parse_json_response(response, "Query Analysis")
 
         # 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=1,
@@ -275,8 +347,158 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
 
         return mapping_info, tokens_used
 
+    def _call_analysis_llm(self, prompt: str, phase_name: str) -> Dict[str, Any]:
+        """
+        분석용 LLM (Phase 1, 2)을 호출합니다. 같은 프롬프트는 한 번만 호출합니다.
+
+        같은 테이블에서 VO 파일과 SQL 쿼리 집합이 동일한 컨텍스트들은 Phase 1
+        프롬프트가, 소스 파일과 mapping_info까지 동일하면 Phase 2 프롬프트가
+        완전히 같으므로, 첫 응답을 공유하여 LLM 호출을 줄입니다.
+        재사용된 응답의 tokens_used는 0으로 기록됩니다.
+
+        three_step_config.analysis_cache_dir이 설정되어 있으면 응답을 디스크에도
+        저장하여, 같은 소스에 대한 재실행에서 LLM 호출 없이 재사용합니다.
+
+        Args:
+            prompt: LLM 프롬프트
+            phase_name: 단계 이름 (캐시 구분 및 로깅용)
+
+        Returns:
+            Dict[str, Any]: LLM 응답
+        """
+        cache_key = f"{phase_name}:" + self._get_cache_key(prompt)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"동일한 {phase_name} 프롬프트의 이전 응답을 재사용합니다.")
+            return {**cached, "tokens_used": 0}
+
+        cache_file = self._get_analysis_cache_file(prompt, phase_name)
+        if cache_file is not None:
+            cached = self._load_analysis_cache(cache_file)
+            if cached is not None:
+                logger.info(
+                    f"{phase_name} 응답을 디스크 캐시에서 재사용합니다: {cache_file.name}"
+                )
+                self._prompt_cache[cache_key] = cached
+                return {**cached, "tokens_used": 0}
+
+        response = self.analysis_provider.call(prompt)
+        self._prompt_cache[cache_key] = response
+        if cache_file is not None and response.get("content"):
+            self._submit_io(self._write_analysis_cache, cache_file, response)
+        return response
+
+    def _get_analysis_cache_file(self, prompt: str, phase_name: str) -> Optional[Path]:
+        """
+        분석 LLM 응답의 디스크 캐시 파일 경로를 반환합니다.
+
+        프로바이더, 모델, 단계 이름과 프롬프트 전체의 SHA-256을 키로 사용합니다.
+
+        Args:
+            prompt: LLM 프롬프트
+            phase_name: 단계 이름
+
+        Returns:
+            Optional[Path]: 캐시 파일 경로 (디스크 캐시 미사용 시 None)
+        """
+        if self._analysis_cache_dir is None:
+            return None
+        key_data = "\0".join(
+            [
+                self.three_step_config.analysis_provider,
+                self.three_step_config.analysis_model or "",
+                phase_name,
+                prompt,
+            ]
+        )
+        digest = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        return self._analysis_cache_dir / f"{phase_name}__{digest}.json"
+
+    def _load_analysis_cache(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        디스크 캐시에서 분석 LLM 응답을 읽습니다.
+
+        Args:
+            cache_file: 캐시 파일 경로
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시된 응답 (없거나 만료/손상된 경우 None)
+        """
+        try:
+            stat = cache_file.stat()
+        except OSError:
+            return None
+
+        ttl_hours = self.three_step_config.analysis_cache_ttl_hours
+        if ttl_hours >= 0 and time.time() - stat.st_mtime > ttl_hours * 3600:
+            return None
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = loads_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"LLM 응답 캐시 파일 로드 실패: {cache_file} - {e}")
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_analysis_cache(self, cache_file: Path, response: Dict[str, Any]) -> None:
+        """분석 LLM 응답을 디스크 캐시에 저장합니다. (임시 파일 작성 후 교체)"""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(dumps_pretty_json(response))
+        os.replace(tmp_file, cache_file)
+
     # ========== ThreeStep 고유 메서드: Phase 2 (Planning) ==========
 
+    def _prepare_planning_inputs(
+        self,
+        modification_context: ModificationContext,
+        table_access_info: TableAccessInfo,
+    ) -> Dict[str, str]:
+        """
+        Phase 1 결과와 무관한 Phase 2 프롬프트 입력을 준비합니다.
+
+        Args:
+            modification_context: 수정 컨텍스트
+            table_access_info: 테이블 접근 정보
+
+        Returns:
+            Dict[str, str]: source_files, call_stacks 문자열
+        """
+        add_line_num: bool = self.config and self.config.generate_type != "full_source"
+        return {
+            "source_files": self._read_file_contents(
+                modification_context.file_paths, add_line_num=add_line_num
+            ),
+            "call_stacks": self._get_callstacks_from_table_access_info(
+                modification_context.file_paths, table_access_info
+            ),
+        }
+
+    def _get_planning_inputs(
+        self,
+        modification_context: ModificationContext,
+        table_access_info: TableAccessInfo,
+    ) -> Dict[str, str]:
+        """
+        선행 준비된 Phase 2 입력을 반환합니다. 없으면 즉시 준비합니다.
+
+        Args:
+            modification_context: 수정 컨텍스트
+            table_access_info: 테이블 접근 정보
+
+        Returns:
+            Dict[str, str]: source_files, call_stacks 문자열
+        """
+        pending, self._planning_inputs_future = self._planning_inputs_future, None
+        if pending is not None and pending[0] == id(modification_context):
+            try:
+                return pending[1].result()
+            except Exception as e:
+                logger.warning(f"Phase 2 입력 선행 준비 실패, 재시도합니다: {e}")
+        return self._prepare_planning_inputs(modification_context, table_access_info)
+
     def _create_planning_prompt(
         self,
         modification_context: ModificationContext,
@@ -288,26 +510,20 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
         Note: SQL 쿼리와 데이터 매핑 정보는 Phase 1의 mapping_info에 포함되어 있습니다.
         """
         # 테이블/칼럼 정보
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
-        # 소스 파일 내용
-        add_line_num: bool = self.config and self.config.generate_type != 'full_source'
-        source_files_str = self._read_file_contents(
-            modification_context.file_paths,
-            add_line_num=add_line_num
+        # 소스 파일 내용 + Call Stacks 정보 (Phase 1 진행 중 선행 준비된 결과 사용)
+        planning_inputs = self._get_planning_inputs(
+            modification_context, table_access_info
         )
+        source_files_str = planning_inputs["source_files"]
+        call_stacks_str = planning_inputs["call_stacks"]
 
         # mapping_info (Phase 1 결과)를 JSON 문자열로 변환
-        mapping_info_str = json.dumps(mapping_info, indent=2, ensure_ascii=False)
-
-        # Call Stacks 정보 (각 call chain 별로 data flow 분석 수행)
-        call_stacks_str = self._get_callstacks_from_table_access_info(
-            modification_context.file_paths, table_access_info
-        )
+        mapping_info_str = dumps_pretty_json(mapping_info)
 
         variables = {
             "table_info": table_info_str,
@@ -335,13 +551,15 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
         prompt = self._create_planning_prompt(
             modification_context, table_access_info, mapping_info
         )
-        logger.debug(f"Planning 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Planning 프롬프트 길이: %d chars", len(prompt))
 
-        # 프롬프트 저장 (LLM 호출 직전)
-        self._save_prompt_to_file(prompt, modification_context, "planning")
+        # 프롬프트 저장 (LLM 호출과 병행, 백그라운드)
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "planning"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "planning")
         tokens_used = response.get("tokens_used", 0)
         logger.info(f"Planning 응답 완료 (토큰: {tokens_used})")
 
@@ -349,7 +567,8 @@ class ThreeStepCodeGenerator(BaseMultiStepCodeGenerator):
         modification_instructions = self._parse_json_response(response, "Planning")
 
         # 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=2,
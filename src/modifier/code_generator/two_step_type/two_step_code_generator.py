@@ -9,8 +9,8 @@ Two-Step Code Generator
   수정 지침에 따라 실제 코드를 작성합니다.
 """
 
-import json
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -20,6 +20,7 @@ from models.table_access_info import TableAccessInfo
 from modifier.llm.llm_factory import create_llm_provider
 from modifier.llm.llm_provider import LLMProvider
 
+from ..base_code_generator import dumps_table_info, template_file_exists
 from ..multi_step_base import BaseMultiStepCodeGenerator
 
 logger = logging.getLogger(__name__)
@@ -49,31 +50,14 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
 
         self.two_step_config: TwoStepConfig = config.two_step_config
 
-        # 두 개의 LLM Provider 초기화
-        logger.info(
-            f"Planning LLM 초기화: {self.two_step_config.planning_provider} "
-            f"(model: {self.two_step_config.planning_model})"
-        )
-        self.planning_provider: LLMProvider = create_llm_provider(
-            provider_name=self.two_step_config.planning_provider,
-            model_id=self.two_step_config.planning_model,
-        )
-
-        logger.info(
-            f"Execution LLM 초기화: {self.two_step_config.execution_provider} "
-            f"(model: {self.two_step_config.execution_model})"
-        )
-        self.execution_provider: LLMProvider = create_llm_provider(
-            provider_name=self.two_step_config.execution_provider,
-            model_id=self.two_step_config.execution_model,
-        )
+        # 두 개의 LLM Provider는 처음 사용할 때 생성 (planning_provider / execution_provider)
 
         # 템플릿 로드
         template_dir = Path(__file__).parent
         self.planning_template_path = template_dir / "planning_template.md"
         self.execution_template_path = template_dir / "execution_template.md"
 
-        if not self.planning_template_path.exists():
+        if not template_file_exists(self.planning_template_path):
             raise FileNotFoundError(
                 f"\n{'='*60}\n"
                 f" [오류] Planning 템플릿 파일을 찾을 수 없습니다\n"
@@ -89,7 +73,7 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
                 f"  파일을 위치시킨 후 다시 실행해 주세요.\n"
                 f"{'='*60}"
             )
-        if not self.execution_template_path.exists():
+        if not template_file_exists(self.execution_template_path):
             raise FileNotFoundError(
                 f"\n{'='*60}\n"
                 f" [오류] Execution 템플릿 파일을 찾을 수 없습니다\n"
@@ -112,6 +96,38 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
         # 출력 디렉토리 초기화 (부모 클래스 메서드 사용)
         self._init_output_directory()
 
+    # ========== LLM Provider (지연 초기화) ==========
+
+    @cached_property
+    def planning_provider(self) -> LLMProvider:
+        """Planning LLM Provider (첫 사용 시 생성)"""
+        logger.info(
+            f"Planning LLM 초기화: {self.two_step_config.planning_provider} "
+            f"(model: {self.two_step_config.planning_model})"
+        )
+        return create_llm_provider(
+            provider_name=self.two_step_config.planning_provider,
+            model_id=self.two_step_config.planning_model,
+            requests_per_minute=self.config.llm_requests_per_minute,
+            tokens_per_minute=self.config.llm_tokens_per_minute,
+            expected_output_tokens=self.config.llm_expected_output_tokens,
+        )
+
+    @cached_property
+    def execution_provider(self) -> LLMProvider:
+        """Execution LLM Provider (첫 사용 시 생성)"""
+        logger.info(
+            f"Execution LLM 초기화: {self.two_step_config.execution_provider} "
+            f"(model: {self.two_step_config.execution_model})"
+        )
+        return create_llm_provider(
+            provider_name=self.two_step_config.execution_provider,
+            model_id=self.two_step_config.execution_model,
+            requests_per_minute=self.config.llm_requests_per_minute,
+            tokens_per_minute=self.config.llm_tokens_per_minute,
+            expected_output_tokens=self.config.llm_expected_output_tokens,
+        )
+
     # ========== 추상 메서드 구현 ==========
 
     def _get_output_subdir_name(self) -> str:
@@ -150,13 +166,11 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
         self, planning_result: Dict[str, Any]
     ) -> Dict[str, str]:
         """Planning 결과에서 파일명 -> reason 매핑 추출"""
-        planning_reasons = {}
-        for instr in planning_result.get("modification_instructions", []):
-            file_name = instr.get("file_name", "")
-            reason = instr.get("reason", "")
-            if file_name:
-                planning_reasons[file_name] = reason
-        return planning_reasons
+        return {
+            file_name: instr.get("reason", "")
+            for instr in planning_result.get("modification_instructions", [])
+            if (file_name := instr.get("file_name", ""))
+        }
 
     def _execute_planning_phases(
         self,
@@ -186,10 +200,12 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
         planning_prompt = self._create_planning_prompt(
             modification_context, table_access_info
         )
-        logger.debug(f"Planning 프롬프트 길이: {len(planning_prompt)} chars")
+        logger.debug("Planning 프롬프트 길이: %d chars", len(planning_prompt))
 
-        # 프롬프트 저장 (LLM 호출 직전)
-        self._save_prompt_to_file(planning_prompt, modification_context, "planning")
+        # 프롬프트 저장 (LLM 호출과 병행, 백그라운드)
+        self._submit_io(
+            self._save_prompt_to_file, planning_prompt, modification_context, "planning"
+        )
 
         # LLM 호출
         planning_response = self.planning_provider.call(planning_prompt)
@@ -202,7 +218,8 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
         )
 
         # Planning 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=1,
@@ -241,11 +258,10 @@ class TwoStepCodeGenerator(BaseMultiStepCodeGenerator):
             str: Planning 프롬프트
         """
         # 테이블/칼럼 정보
-        table_info = {
-            "table_name": modification_context.table_name,
-            "columns": modification_context.columns,
-        }
-        table_info_str = json.dumps(table_info, indent=2, ensure_ascii=False)
+        table_info_str = dumps_table_info(
+            modification_context.table_name,
+            modification_context.columns,
+        )
 
         # 소스 파일 내용
         source_files_str = self._read_file_contents(modification_context.file_paths)
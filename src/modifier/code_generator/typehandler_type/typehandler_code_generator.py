@@ -1,11 +1,11 @@
 import logging
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
-from config.config_manager import Configuration
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
+from util.json_utils import dumps_pretty_json
+from ..base_code_generator import template_file_exists
 from ..three_step_type.three_step_code_generator import ThreeStepCodeGenerator
 
 logger = logging.getLogger("applycrypto")
@@ -19,10 +19,8 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
     Raw Text 그대로 Execution 단계(Step 3)로 전달합니다.
     """
     
-    def __init__(self, config: Configuration):
-        super().__init__(config)
-
-        # 템플릿 경로를 현재 클래스 파일 위치 기준으로 재설정
+    def _resolve_template_paths(self, template_dir: Path) -> None:
+        """템플릿 경로를 현재 클래스 파일 위치 기준으로 결정합니다."""
         template_dir = Path(__file__).parent
         self.data_mapping_template_path = template_dir / "data_mapping_template.md"
         self.planning_template_path = template_dir / "planning_template.md"
@@ -36,9 +34,6 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
             execution_template_name = "execution_template_full.md"
             
         self.execution_template_path = template_dir / execution_template_name
-        
-        # 토큰 계산용 템플릿 경로 업데이트
-        self.template_path = self.planning_template_path
 
         # 템플릿 파일 존재 여부 확인
         for template_path in [
@@ -46,7 +41,7 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
             self.planning_template_path,
             self.execution_template_path,
         ]:
-            if not template_path.exists():
+            if not template_file_exists(template_path):
                 logger.warning(f"Template file not found at local path: {template_path}, falling back to parent default might be safer or raise error.")
 
     def _execute_planning_phase(
@@ -65,13 +60,15 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
         prompt = self._create_planning_prompt(
             modification_context, table_access_info, mapping_info
         )
-        logger.debug(f"Planning 프롬프트 길이: {len(prompt)} chars")
+        logger.debug("Planning 프롬프트 길이: %d chars", len(prompt))
 
         # 프롬프트 저장
-        self._save_prompt_to_file(prompt, modification_context, "planning")
+        self._submit_io(
+            self._save_prompt_to_file, prompt, modification_context, "planning"
+        )
 
-        # LLM 호출
-        response = self.analysis_provider.call(prompt)
+        # LLM 호출 (동일 프롬프트의 이전 응답이 있으면 재사용)
+        response = self._call_analysis_llm(prompt, "planning")
         tokens_used = response.get("tokens_used", 0)
         content = response.get("content", "")
         
@@ -84,7 +81,8 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
         }
 
         # 결과 저장
-        self._save_phase_result(
+        self._submit_io(
+            self._save_phase_result,
             session_dir=session_dir,
             modification_context=modification_context,
             step_number=2,
@@ -102,6 +100,48 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
         """Planning 결과가 텍스트이므로 파일별 reason은 생성하지 않습니다."""
         return {}
 
+    def _save_phase_result(
+        self,
+        session_dir: Path,
+        modification_context: ModificationContext,
+        step_number: int,
+        phase_name: str,
+        result: Dict[str, Any],
+        tokens_used: int,
+    ) -> Path:
+        """
+        Phase 결과를 저장합니다. Raw Text 수정 지침은 .txt 파일로 분리합니다.
+
+        수백 KB의 텍스트를 JSON 문자열로 다시 escape하지 않도록
+        step{N}_{phase_name}.txt에 그대로 쓰고, JSON에는 파일명만 남깁니다.
+        """
+        instructions = result.get("modification_instructions")
+        if isinstance(instructions, str):
+            text_filename = f"step{step_number}_{phase_name}.txt"
+            with open(session_dir / text_filename, "w", encoding="utf-8") as f:
+                f.write(instructions)
+            result = {"modification_instructions_file": text_filename}
+
+        return super()._save_phase_result(
+            session_dir=session_dir,
+            modification_context=modification_context,
+            step_number=step_number,
+            phase_name=phase_name,
+            result=result,
+            tokens_used=tokens_used,
+        )
+
+    def _load_previous_planning_result(self, session_dir: Path) -> Dict[str, Any]:
+        """이전 Planning 결과를 로드합니다. (.txt로 분리된 수정 지침 복원)"""
+        planning_result = super()._load_previous_planning_result(session_dir)
+
+        text_filename = planning_result.get("modification_instructions_file")
+        if text_filename:
+            with open(session_dir / text_filename, "r", encoding="utf-8") as f:
+                planning_result = {"modification_instructions": f.read()}
+
+        return planning_result
+
     def _create_execution_prompt(
         self,
         modification_context: ModificationContext,
@@ -127,9 +167,7 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
         
         # 만약 (혹시라도) 리스트/딕셔너리가 넘어오면 JSON 변환 (안전장치)
         if not isinstance(instructions_str, str):
-            instructions_str = json.dumps(
-                instructions_str, indent=2, ensure_ascii=False
-            )
+            instructions_str = dumps_pretty_json(instructions_str)
 
         variables = {
             "source_files": source_files_str,
@@ -185,4 +223,4 @@ class TypeHandlerCodeGenerator(ThreeStepCodeGenerator):
                 }
             )
 
-        return json.dumps(relevant_queries, indent=2, ensure_ascii=False)
+        return dumps_pretty_json(relevant_queries)
@@ -19,7 +19,14 @@ from models.table_access_info import TableAccessInfo
 from .code_generator.code_generator_factory import CodeGeneratorFactory
 from .code_generator.base_code_generator import BaseCodeGenerator
 from .context_generator.context_generator_factory import ContextGeneratorFactory
-from .code_patcher import DiffCodePatcher, FullSourceCodePatcher, MethodCodePatcher, PartCodePatcher
+from .batch_processor import BatchProcessor
+from .code_patcher import (
+    BaseCodePatcher,
+    DiffCodePatcher,
+    FullSourceCodePatcher,
+    MethodCodePatcher,
+    PartCodePatcher,
+)
 from .error_handler import ErrorHandler
 from .llm.llm_factory import create_llm_provider
 from .llm.llm_provider import LLMProvider
@@ -27,6 +34,20 @@ from .result_tracker import ResultTracker
 
 logger = logging.getLogger(__name__)
 
+# CodeModifier의 공용 LLM 프로바이더를 사용하는 modification_type
+_SHARED_LLM_PROVIDER_TYPES = frozenset({"ControllerOrService", "ServiceImplOrBiz"})
+
+# 이 개수 미만의 계획은 스레드 풀 없이 순차 적용
+_PARALLEL_APPLY_MIN_PLANS = 4
+
+# generate_type별 코드 패처 클래스
+_PATCHER_CLASSES = {
+    "full_source": FullSourceCodePatcher,
+    "method": MethodCodePatcher,
+    "part": PartCodePatcher,
+    "diff": DiffCodePatcher,
+}
+
 
 class CodeModifier:
     """
@@ -51,17 +72,19 @@ class CodeModifier:
         self.config = config
         self.target_project = Path(config.target_project)
 
-        # LLM 프로바이더 초기화
-        if llm_provider:
-            self.llm_provider = llm_provider
-        else:
-            llm_provider_name = config.llm_provider
-            self.llm_provider = create_llm_provider(provider_name=llm_provider_name)
+        # LLM 프로바이더 (미지정 시 처음 사용할 때 설정에서 생성)
+        self._llm_provider: Optional[LLMProvider] = llm_provider
 
         # CodeGenerator 생성
+        # TypeHandler/TwoStep/ThreeStep 생성기는 자체 LLM Provider를 생성하므로
+        # 공용 프로바이더를 만들지 않음 (프로바이더 생성 시 인증 요청 발생)
         self.code_generator = CodeGeneratorFactory.create(
             config=self.config,
-            llm_provider=self.llm_provider,
+            llm_provider=(
+                self.llm_provider
+                if config.modification_type in _SHARED_LLM_PROVIDER_TYPES
+                else self._llm_provider
+            ),
         )
 
         # ContextGenerator 생성
@@ -74,15 +97,52 @@ class CodeModifier:
 
         self.error_handler = ErrorHandler(max_retries=config.max_retries)
         self.result_tracker = ResultTracker(self.target_project)
+        self.batch_processor = BatchProcessor(max_workers=config.max_workers)
+        # 코드 패처 (처음 사용 시 생성하여 모든 계획에 재사용)
+        self._code_patcher: Optional[BaseCodePatcher] = None
         self._current_table_access_info: Optional[TableAccessInfo] = None
 
         # 초기화 시 프로젝트 전체 Java 파일에 대해 Lint 수행 (Trailing Spaces 제거)
         # TODO: setup_lint_code implementation was missing in migration source.
         # self.code_patcher.setup_lint_code()
 
-        logger.info(
-            f"CodeModifier 초기화 완료: {self.llm_provider.get_provider_name()}"
+        provider_name = (
+            self._llm_provider.get_provider_name()
+            if self._llm_provider is not None
+            else config.llm_provider
         )
+        logger.info(f"CodeModifier 초기화 완료: {provider_name}")
+
+    @property
+    def code_patcher(self) -> BaseCodePatcher:
+        """
+        generate_type에 맞는 코드 패처 (처음 사용할 때 생성)
+
+        패처는 호출 간 상태를 갖지 않으므로 모든 계획 적용에 하나를 재사용합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 generate_type인 경우
+        """
+        if self._code_patcher is None:
+            patcher_class = _PATCHER_CLASSES.get(self.config.generate_type)
+            if patcher_class is None:
+                raise ValueError(f"Invalid generate_type: {self.config.generate_type}")
+            self._code_patcher = patcher_class(
+                project_root=self.target_project, config=self.config
+            )
+        return self._code_patcher
+
+    @property
+    def llm_provider(self) -> LLMProvider:
+        """공용 LLM 프로바이더 (처음 사용할 때 설정에서 생성)"""
+        if self._llm_provider is None:
+            self._llm_provider = create_llm_provider(
+                provider_name=self.config.llm_provider,
+                requests_per_minute=self.config.llm_requests_per_minute,
+                tokens_per_minute=self.config.llm_tokens_per_minute,
+                expected_output_tokens=self.config.llm_expected_output_tokens,
+            )
+        return self._llm_provider
 
 
     def _get_api_key_from_env(self, provider_name: str) -> Optional[str]:
@@ -114,16 +174,20 @@ class CodeModifier:
             table_access_info: 테이블 접근 정보
 
         Returns:
-            List[ModificationContext]: 수정 컨텍스트 리스트
+            List[ModificationContext]: 수정 컨텍스트 리스트 (수정 대상 파일이 없는 컨텍스트 제외)
         """
         # table_access_info를 임시로 저장 (generate_plan에서 사용하기 위해)
         self._current_table_access_info = table_access_info
-        return self.context_generator.generate(
-            layer_files=table_access_info.layer_files,
-            table_name=table_access_info.table_name,
-            columns=table_access_info.columns,
-            table_access_info=table_access_info,
-        )
+        # 여러 레이어에 있는 파일은 레이어마다 배치되지만 읽기/토큰 계산은 한 번만 수행
+        with self.context_generator.reuse_file_reads():
+            contexts = self.context_generator.generate(
+                layer_files=table_access_info.layer_files,
+                table_name=table_access_info.table_name,
+                columns=table_access_info.columns,
+                table_access_info=table_access_info,
+            )
+        # 빈 컨텍스트는 계획 생성 단계로 넘기지 않음 (진행률/디버그 로그 대상에서도 제외)
+        return [context for context in contexts if context.file_paths]
 
     def generate_plan(
         self, modification_context: ModificationContext
@@ -138,11 +202,93 @@ class CodeModifier:
             List[ModificationPlan]: 수정 계획 리스트
         """
         # 현재 table_access_info를 전달
-        table_access_info = getattr(self, '_current_table_access_info', None)
+        table_access_info = self._current_table_access_info
         return self.code_generator.generate_modification_plan(
             modification_context, table_access_info=table_access_info
         )
 
+    def apply_plans(
+        self, plans: List[ModificationPlan], dry_run: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 수정 계획을 적용합니다.
+
+        계획을 대상 파일별로 묶어, 파일 그룹이 _PARALLEL_APPLY_MIN_PLANS개
+        이상이면 그룹끼리는 병렬로 적용하여 파일 백업/패치 I/O를 겹칩니다.
+        같은 파일을 대상으로 하는 계획은 한 그룹 안에서 입력 순서대로 적용됩니다.
+        dry_run에서는 파일 I/O 없이 결과만 기록하므로 그룹화와 스레드 풀 없이
+        순서대로 처리합니다.
+
+        Args:
+            plans: 수정 계획 리스트
+            dry_run: 시뮬레이션 모드
+
+        Returns:
+            List[Dict[str, Any]]: 적용 결과 리스트 (입력 순서 보장)
+        """
+        if dry_run:
+            return [self._apply_plan_or_fail(plan, dry_run=True) for plan in plans]
+
+        file_groups: Dict[str, List[int]] = {}
+        for index, plan in enumerate(plans):
+            file_groups.setdefault(str(plan.file_path), []).append(index)
+
+        if len(file_groups) < _PARALLEL_APPLY_MIN_PLANS:
+            return [self._apply_plan_or_fail(plan, dry_run=dry_run) for plan in plans]
+
+        def apply_group(indices: List[int]) -> List[Dict[str, Any]]:
+            return [
+                self._apply_plan_or_fail(plans[index], dry_run=dry_run)
+                for index in indices
+            ]
+
+        groups = list(file_groups.values())
+        group_results = self.batch_processor.process_items_parallel(
+            groups, apply_group, show_progress=False
+        )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(plans)
+        for indices, group_result in zip(groups, group_results):
+            for index, result in zip(indices, group_result or []):
+                results[index] = result
+
+        # 처리 중 예외로 결과가 없는 계획은 실패로 기록
+        return [
+            result
+            if result is not None
+            else self._record_failed_plan(
+                plan, "패치 적용 중 예기치 않은 오류가 발생했습니다."
+            )
+            for plan, result in zip(plans, results)
+        ]
+
+    def _apply_plan_or_fail(
+        self, plan: ModificationPlan, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        수정 계획을 적용하고, 예외가 발생하면 해당 계획만 실패로 기록합니다.
+
+        순차/병렬 적용 경로 모두 같은 방식으로 실패를 처리하여, 한 계획의
+        예외가 컨텍스트의 나머지 계획 적용을 중단시키지 않도록 합니다.
+        """
+        try:
+            return self.apply_plan(plan, dry_run=dry_run)
+        except Exception as e:
+            logger.error(f"패치 적용 실패: {plan.file_path} - {e}")
+            return self._record_failed_plan(plan, str(e))
+
+    def _record_failed_plan(self, plan: ModificationPlan, error: str) -> Dict[str, Any]:
+        """계획을 실패로 기록하고 기록된 결과를 반환합니다."""
+        return self.result_tracker.record_modification(
+            file_path=plan.file_path,
+            layer=plan.layer_name,
+            modification_type=plan.modification_type,
+            status="failed",
+            error=error,
+            tokens_used=plan.tokens_used,
+            reason=plan.reason or "",
+        )
+
     def apply_plan(
         self, plan: ModificationPlan, dry_run: bool = False
     ) -> Dict[str, Any]:
@@ -156,6 +302,8 @@ class CodeModifier:
         Returns:
             Dict[str, Any]: 적용 결과
         """
+        # 계획의 파일 경로는 생성 단계에서 이미 정규화된 절대 경로 문자열이므로
+        # 결과 기록과 패처/백업 호출에 문자열 그대로 사용
         file_path_str = plan.file_path
         modified_code = plan.modified_code
         status = plan.status
@@ -191,47 +339,28 @@ class CodeModifier:
                 reason=reason,
             )
 
+        if dry_run:
+            logger.info(f"[DRY RUN] 수정 시뮬레이션: {file_path_str}")
+            return self.result_tracker.record_modification(
+                file_path=file_path_str,
+                layer=layer_name,
+                modification_type=modification_type,
+                status="success",
+                modified_code=modified_code,
+                error=None,
+                tokens_used=tokens_used,
+                reason=reason,
+            )
+
         try:
-            file_path = Path(file_path_str)
-
-            if dry_run:
-                logger.info(f"[DRY RUN] 수정 시뮬레이션: {file_path}")
-                return self.result_tracker.record_modification(
-                    file_path=str(file_path),
-                    layer=layer_name,
-                    modification_type=modification_type,
-                    status="success",
-                    modified_code=modified_code,
-                    error=None,
-                    tokens_used=tokens_used,
-                    reason=reason,
-                )
-
-            # 파일 백업
-            backup_path = self.error_handler.backup_file(file_path)
+            # 파일 백업 (keep_backups 설정 시에만, 패처가 원자적으로 교체하므로 복구용은 아님)
+            backup_path = None
+            if self.config.keep_backups:
+                backup_path = self.error_handler.backup_file(file_path_str)
 
             # 패치 적용
-            if self.config.generate_type == "full_source":
-                patcher = FullSourceCodePatcher(
-                    project_root=self.target_project, config=self.config
-                )
-            elif self.config.generate_type == "method":
-                patcher = MethodCodePatcher(
-                    project_root=self.target_project, config=self.config
-                )
-            elif self.config.generate_type == "part":
-                patcher = PartCodePatcher(
-                    project_root=self.target_project, config=self.config
-                )
-            elif self.config.generate_type == "diff":
-                patcher = DiffCodePatcher(
-                    project_root=self.target_project, config=self.config
-                )
-            else:
-                raise ValueError(f"Invalid generate_type: {self.config.generate_type}")
-
-            success, error = patcher.apply_patch(
-                file_path=file_path, modified_code=modified_code
+            success, error = self.code_patcher.apply_patch(
+                file_path=file_path_str, modified_code=modified_code
             )
 
             if success:
@@ -240,12 +369,11 @@ class CodeModifier:
             else:
                 status = "failed"
                 error_msg = error
-                # 롤백은 apply_patch 내부나 error_handler에서 처리하지 않으므로 여기서 복구
-                self.error_handler.restore_file(file_path)
+                # 패처는 임시 파일을 쓴 뒤 교체하므로 실패 시 원본이 그대로 남아 복구 불필요
 
             # 수정 정보 기록
             return self.result_tracker.record_modification(
-                file_path=str(file_path),
+                file_path=file_path_str,
                 layer=layer_name,
                 modification_type=modification_type,
                 status=status,
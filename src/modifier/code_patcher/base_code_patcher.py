@@ -1,10 +1,13 @@
 import logging
+import os
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from config.config_manager import Configuration
+from util.file_utils import resolve_target_path
 
 logger = logging.getLogger(__name__)
 
@@ -30,29 +33,57 @@ class BaseCodePatcher(ABC):
         self.config = config
 
     def _normalize_file_path(
-        self, file_path: Path
+        self, file_path: Union[str, Path]
     ) -> Tuple[Path, Optional[str]]:
         """파일 경로를 정규화하고 존재 여부를 검증합니다.
 
+        문자열 경로는 여기서 한 번만 Path로 변환합니다.
+
         Returns:
             Tuple[Path, Optional[str]]:
                 (정규화된 경로, 에러 메시지 또는 None)
         """
-        if not file_path.is_absolute():
+        if not os.path.isabs(file_path):
             logger.warning(
                 f"Relative path passed: {file_path}. Converting to absolute."
             )
-            file_path = self.project_root / file_path
-        file_path = file_path.resolve()
+        # 계획 생성 단계에서 이미 해석한 경로는 캐시에서 바로 반환됨
+        file_path = Path(
+            resolve_target_path(os.fspath(file_path), str(self.project_root))
+        )
         if not file_path.exists():
             error_msg = f"File does not exist: {file_path}"
             logger.error(error_msg)
             return file_path, error_msg
         return file_path, None
 
+    def _write_source(self, file_path: Path, content: str) -> None:
+        """수정된 소스를 임시 파일에 쓴 뒤 원본과 교체합니다.
+
+        쓰기 도중 실패해도 원본 파일은 그대로 남으므로, apply_patch가 실패를
+        반환한 경우 대상 파일은 변경되지 않은 상태입니다.
+
+        Args:
+            file_path: 대상 파일 경로 (존재하는 파일)
+            content: 기록할 소스 코드
+        """
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp-{os.getpid()}")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            # 원본 파일 권한 유지
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+
     @abstractmethod
     def apply_patch(
-        self, file_path: Path, modified_code: str, dry_run: bool = False
+        self, file_path: Union[str, Path], modified_code: str, dry_run: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Apply changes to a file.
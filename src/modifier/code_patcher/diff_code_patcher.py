@@ -1,9 +1,11 @@
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from config.config_manager import Configuration
 from persistence.debug_manager import DebugManager
+from util.file_utils import read_text_file
+
 from .base_code_patcher import BaseCodePatcher
 from .diff_utils import FileDiff, LineType, UnifiedDiffHunk, parse_diff
 
@@ -25,7 +27,7 @@ class DiffCodePatcher(BaseCodePatcher):
             self.debug_manager = None
 
     def apply_patch(
-        self, file_path: Path, modified_code: str, dry_run: bool = False
+        self, file_path: Union[str, Path], modified_code: str, dry_run: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Apply a Unified Diff to a file.
@@ -79,11 +81,15 @@ class DiffCodePatcher(BaseCodePatcher):
         Apply patch using struct approach with flexible context matching.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_text_file(file_path)
             
             # Split keeping newlines to preserve unknown line endings
             original_lines = content.splitlines(keepends=True)
+            # Normalize once per file instead of once per candidate position
+            stripped_lines = [line.rstrip() for line in original_lines]
+            skippable_lines = [
+                self._check_is_skippable(line) for line in stripped_lines
+            ]
             new_lines = []
             current_original_idx = 0
             
@@ -93,7 +99,11 @@ class DiffCodePatcher(BaseCodePatcher):
             for hunk in hunks:
                 # Find modification point based on context
                 result = self._find_modification_point(
-                    original_lines, hunk, current_original_idx
+                    original_lines,
+                    hunk,
+                    current_original_idx,
+                    stripped_lines=stripped_lines,
+                    skippable_lines=skippable_lines,
                 )
                 if result is None:
                     if self.debug_manager:
@@ -138,8 +148,7 @@ class DiffCodePatcher(BaseCodePatcher):
                 logger.info(f"[DRY RUN] Simulating write to {file_path}")
                 return True, None
                 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
+            self._write_source(file_path, "".join(new_lines))
                 
             logger.info(f"Patch applied successfully to {file_path}")
             return True, None
@@ -150,14 +159,30 @@ class DiffCodePatcher(BaseCodePatcher):
             return False, error_msg
 
     def _find_modification_point(
-        self, original_lines: List[str], hunk: UnifiedDiffHunk, search_start_idx: int
+        self,
+        original_lines: List[str],
+        hunk: UnifiedDiffHunk,
+        search_start_idx: int,
+        stripped_lines: Optional[List[str]] = None,
+        skippable_lines: Optional[List[bool]] = None,
     ) -> Optional[Tuple[int, int, Dict[int, List[str]]]]:
         """
         Find the line index in original_lines where the hunk's old_text matches.
         Returns tuple of (start_index, consumed_line_count, skipped_lines_map).
         skipped_lines_map is { old_text_index: [list of raw skipped lines] }
+
+        stripped_lines / skippable_lines are the rstripped original lines and
+        their _check_is_skippable flags; callers applying several hunks to the
+        same file pass them in so they are computed only once.
         """
         expected_lines = hunk.old_text()
+        if stripped_lines is None:
+            stripped_lines = [line.rstrip() for line in original_lines]
+        if skippable_lines is None:
+            skippable_lines = [
+                self._check_is_skippable(line) for line in stripped_lines
+            ]
+        expected_stripped = [line.rstrip() for line in expected_lines]
         
         # If no expected lines (pure addition), we must rely on old_start or search_start_idx
         if not expected_lines:
@@ -182,21 +207,17 @@ class DiffCodePatcher(BaseCodePatcher):
                 if current_orig_idx >= len(original_lines):
                     return -1, {} # End of file
                 
-                raw_line_orig = original_lines[current_orig_idx]
-                line_orig = raw_line_orig.rstrip()
-                line_exp = expected_lines[exp_i].rstrip()
-                
-                if line_orig == line_exp:
+                if stripped_lines[current_orig_idx] == expected_stripped[exp_i]:
                     exp_i += 1
                     orig_i += 1
                     continue
                 
                 # Mismatch: Check if original line is skippable (comment/empty)
                 # But NOT if the expected line matches it (already handled by == check)
-                if self._check_is_skippable(line_orig):
+                if skippable_lines[current_orig_idx]:
                     if exp_i not in local_skipped_map:
                         local_skipped_map[exp_i] = []
-                    local_skipped_map[exp_i].append(raw_line_orig)
+                    local_skipped_map[exp_i].append(original_lines[current_orig_idx])
                     orig_i += 1
                     continue
                 
@@ -71,6 +71,19 @@ class UnifiedDiff(BaseModel):
     files: List[FileDiff] = Field(default_factory=list)
 
 
+# Regex for hunk header
+# Matches: @@ -1,2 +3,4 @@ optional section header
+# Note: count is optional and defaults to 1 if omitted
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*\n?)?$")
+
+# Diff body prefix -> line type
+_LINE_PREFIX_TYPES = {
+    " ": LineType.CONTEXT,
+    "-": LineType.DELETE,
+    "+": LineType.ADD,
+}
+
+
 def parse_diff(diff_content: str) -> UnifiedDiff:
     """
     Parses a unified diff string into a UnifiedDiff object.
@@ -81,13 +94,6 @@ def parse_diff(diff_content: str) -> UnifiedDiff:
     files: List[FileDiff] = []
     current_file: Optional[FileDiff] = None
     current_hunk: Optional[UnifiedDiffHunk] = None
-    
-    # Regex for hunk header
-    # Matches: @@ -1,2 +3,4 @@ optional section header
-    # Note: count is optional and defaults to 1 if omitted
-    hunk_header_pattern = re.compile(
-        r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*\n?)?$"
-    )
 
     i = 0
     while i < len(lines):
@@ -109,7 +115,7 @@ def parse_diff(diff_content: str) -> UnifiedDiff:
         
         # Hunk Header
         if line.startswith("@@ "):
-            match = hunk_header_pattern.match(line.strip())
+            match = _HUNK_HEADER_RE.match(line.strip())
             if match:
                 # If no file header was seen, create a dummy file for these hunks
                 if current_file is None:
@@ -138,12 +144,9 @@ def parse_diff(diff_content: str) -> UnifiedDiff:
         
         # Hunk Content
         if current_hunk:
-            if line.startswith(" "):
-                current_hunk.lines.append(HunkLine(type=LineType.CONTEXT, content=line[1:]))
-            elif line.startswith("-"):
-                current_hunk.lines.append(HunkLine(type=LineType.DELETE, content=line[1:]))
-            elif line.startswith("+"):
-                current_hunk.lines.append(HunkLine(type=LineType.ADD, content=line[1:]))
+            line_type = _LINE_PREFIX_TYPES.get(line[:1])
+            if line_type is not None:
+                current_hunk.lines.append(HunkLine(type=line_type, content=line[1:]))
             elif line == "":
                  # Assuming empty context line
                  current_hunk.lines.append(HunkLine(type=LineType.CONTEXT, content=""))
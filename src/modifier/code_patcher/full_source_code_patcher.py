@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from .base_code_patcher import BaseCodePatcher
 
@@ -13,7 +13,7 @@ class FullSourceCodePatcher(BaseCodePatcher):
     """
 
     def apply_patch(
-        self, file_path: Path, modified_code: str, dry_run: bool = False
+        self, file_path: Union[str, Path], modified_code: str, dry_run: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Overwrite the file with full source code.
@@ -27,8 +27,7 @@ class FullSourceCodePatcher(BaseCodePatcher):
                 logger.info(f"[DRY RUN] Overwrite Simulation: {file_path}")
                 return True, None
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(modified_code)
+            self._write_source(file_path, modified_code)
 
             logger.info(f"Full source overwrite complete: {file_path}")
             return True, None
@@ -1,7 +1,9 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from util.json_utils import loads_json
 
 from .base_code_patcher import BaseCodePatcher
 
@@ -35,7 +37,7 @@ class MethodCodePatcher(BaseCodePatcher):
     """
 
     def apply_patch(
-        self, file_path: Path, modified_code: str, dry_run: bool = False
+        self, file_path: Union[str, Path], modified_code: str, dry_run: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """JSON 메서드 수정 데이터를 파싱하여 원본 파일에 적용합니다.
 
@@ -54,7 +56,7 @@ class MethodCodePatcher(BaseCodePatcher):
 
             # 1. JSON 파싱
             try:
-                patch_data: Dict[str, Any] = json.loads(modified_code)
+                patch_data: Dict[str, Any] = loads_json(modified_code)
             except json.JSONDecodeError as e:
                 error_msg = f"Invalid JSON in modified_code: {e}"
                 logger.error(error_msg)
@@ -129,8 +131,7 @@ class MethodCodePatcher(BaseCodePatcher):
                 )
 
             # 6. 파일 쓰기
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(reconstructed)
+            self._write_source(file_path, reconstructed)
 
             logger.info(
                 f"Method patch complete: {file_path} "
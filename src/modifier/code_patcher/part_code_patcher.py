@@ -2,7 +2,9 @@ import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
+
+from util.file_utils import read_text_file
 
 from .base_code_patcher import BaseCodePatcher
 
@@ -22,7 +24,7 @@ class PartCodePatcher(BaseCodePatcher):
     """
 
     def apply_patch(
-        self, file_path: Path, modified_code: str, dry_run: bool = False
+        self, file_path: Union[str, Path], modified_code: str, dry_run: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Apply Search/Replace blocks to a file.
@@ -50,8 +52,7 @@ class PartCodePatcher(BaseCodePatcher):
                 # But if syntax was wrong, might be an issue.
                 return True, None
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_text_file(file_path)
 
             new_content = content
             
@@ -67,8 +68,7 @@ class PartCodePatcher(BaseCodePatcher):
                 logger.info(f"[DRY RUN] Applied {len(patches)} patches to {file_path}")
                 return True, None
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            self._write_source(file_path, new_content)
 
             logger.info(f"Part replacement complete: {file_path}, {len(patches)} blocks.")
             return True, None
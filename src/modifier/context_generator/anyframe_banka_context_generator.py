@@ -14,8 +14,8 @@ BNK 온라인 타입 전용 Context Generator입니다.
    - BIZ 파일은 call_stack 기반 메서드만으로 토큰을 계산하여 배치 분할 최적화.
 """
 
-import json
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -25,6 +25,7 @@ from models.table_access_info import TableAccessInfo
 from modifier.code_generator.base_code_generator import BaseCodeGenerator
 from modifier.context_generator.base_context_generator import BaseContextGenerator
 from parser.java_ast_parser import JavaASTParser
+from util.file_utils import read_text_file
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,8 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
     def __init__(self, config: Configuration, code_generator: BaseCodeGenerator):
         super().__init__(config, code_generator)
         self._java_parser = JavaASTParser()
+        # BIZ 메서드 추출은 파일 읽기 스레드에서 실행되므로 파서 사용을 직렬화
+        self._java_parser_lock = threading.Lock()
         self._table_access_info: Optional[TableAccessInfo] = None
 
     # ========== generate 오버라이드 (call_stack 기반) ==========
@@ -369,8 +372,6 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
                 file_paths, table_name, columns, layer, context_files
             )
 
-        if context_files is None:
-            context_files = []
         if not file_paths:
             return []
 
@@ -379,90 +380,16 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
             file_paths, self._table_access_info
         )
 
-        batches: List[ModificationContext] = []
-        current_paths: List[str] = []
+        def read_content(file_path: str) -> str:
+            # ━━━ 핵심 차이: BIZ 파일은 메서드만으로 토큰 계산 ━━━
+            if self._is_biz_file(file_path):
+                return self._get_biz_method_content(file_path, raw_call_stacks)
+            return read_text_file(file_path)
 
-        # 기본 정보 준비 (부모와 동일)
-        from models.code_generator import CodeGeneratorInput
-
-        table_info = {
-            "table_name": table_name,
-            "columns": columns,
-        }
-        formatted_table_info = json.dumps(table_info, indent=2, ensure_ascii=False)
-        max_tokens = self._config.max_tokens_per_batch
-
-        input_empty_data = CodeGeneratorInput(
-            file_paths=[], table_info=formatted_table_info, layer_name=layer
-        )
-
-        empty_prompt = self._code_generator.create_prompt(input_empty_data)
-        empty_num_tokens = self._code_generator.calculate_token_size(empty_prompt)
-        separator_tokens = self._code_generator.calculate_token_size("\n\n")
-
-        current_batch_tokens = empty_num_tokens
-
-        for file_path in file_paths:
-            try:
-                path_obj = Path(file_path)
-                if not path_obj.exists():
-                    logger.warning(f"File not found during batch creation: {file_path}")
-                    continue
-
-                # ━━━ 핵심 차이: BIZ 파일은 메서드만으로 토큰 계산 ━━━
-                if self._is_biz_file(file_path):
-                    content = self._get_biz_method_content(file_path, raw_call_stacks)
-                else:
-                    with open(path_obj, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-            except Exception as e:
-                logger.error(f"Failed to read file {file_path}: {e}")
-                continue
-
-            snippet_formatted = f"=== File Path (Absolute): {file_path} ===\n{content}"
-            snippet_tokens = self._code_generator.calculate_token_size(
-                snippet_formatted
-            )
-
-            tokens_to_add = snippet_tokens
-            if current_paths:
-                tokens_to_add += separator_tokens
-
-            if current_paths and (current_batch_tokens + tokens_to_add) > max_tokens:
-                batches.append(
-                    ModificationContext(
-                        file_paths=current_paths,
-                        table_name=table_name,
-                        columns=columns,
-                        file_count=len(current_paths),
-                        layer=layer,
-                        context_files=context_files,
-                    )
-                )
-                current_paths = [file_path]
-                current_batch_tokens = empty_num_tokens + snippet_tokens
-            else:
-                current_paths.append(file_path)
-                current_batch_tokens += tokens_to_add
-
-        if current_paths:
-            batches.append(
-                ModificationContext(
-                    file_paths=current_paths,
-                    table_name=table_name,
-                    columns=columns,
-                    file_count=len(current_paths),
-                    layer=layer,
-                    context_files=context_files,
-                )
-            )
-
-        logger.info(
-            f"Split {len(file_paths)} files into {len(batches)} batches "
-            f"(BIZ method-level token estimation)."
+        # 읽기/토큰 계산/배치 분할은 부모와 동일
+        return self._batch_files(
+            file_paths, table_name, columns, layer, context_files or [], read_content
         )
-        return batches
 
     # ========== BIZ 메서드 추출 헬퍼 ==========
 
@@ -537,6 +464,7 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
 
         토큰 계산용으로 순수 메서드 코드만 반환합니다.
         매칭 메서드 없으면 전체 파일 내용을 반환합니다 (fallback).
+        파일을 읽을 수 없으면 FileNotFoundError 등 읽기 예외가 그대로 전파됩니다.
         """
         target_methods = self._get_target_methods_for_file(file_path, raw_call_stacks)
 
@@ -547,15 +475,16 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
             return self._read_full_file(file_path)
 
         # JavaASTParser로 메서드 정보 획득
-        tree, error = self._java_parser.parse_file(Path(file_path))
+        with self._java_parser_lock:
+            tree, error = self._java_parser.parse_file(Path(file_path))
+            if not error:
+                classes = self._java_parser.extract_class_info(tree, Path(file_path))
         if error:
             logger.warning(
                 f"BIZ 파일 파싱 실패, 전체 포함: {Path(file_path).name} - {error}"
             )
             return self._read_full_file(file_path)
 
-        classes = self._java_parser.extract_class_info(tree, Path(file_path))
-
         # 매칭 메서드의 라인 범위 수집
         method_ranges: List[tuple] = []
         for cls_info in classes:
@@ -572,12 +501,7 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
             return self._read_full_file(file_path)
 
         # 파일에서 해당 라인만 추출
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-        except Exception as e:
-            logger.warning(f"BIZ 파일 읽기 실패: {file_path} - {e}")
-            return ""
+        all_lines = read_text_file(file_path).splitlines(keepends=True)
 
         extracted_parts: List[str] = []
         for method_name, start_line, end_line in sorted(
@@ -589,13 +513,8 @@ class AnyframeBankaContextGenerator(BaseContextGenerator):
         return "\n\n".join(extracted_parts)
 
     def _read_full_file(self, file_path: str) -> str:
-        """단일 파일의 전체 내용을 읽습니다."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception as e:
-            logger.warning(f"파일 읽기 실패: {file_path} - {e}")
-            return ""
+        """단일 파일의 전체 내용을 읽습니다. 읽기 예외는 호출자에게 전파됩니다."""
+        return read_text_file(file_path)
 
     # ========== VO 선택 관련 메서드 (AnyframeContextGenerator에서 복사) ==========
 
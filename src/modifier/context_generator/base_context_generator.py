@@ -1,15 +1,18 @@
-import json
 import logging
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
 from config.config_manager import Configuration
-from models.code_generator import CodeGeneratorInput
 from models.modification_context import ModificationContext
 from models.table_access_info import TableAccessInfo
 
-from modifier.code_generator.base_code_generator import BaseCodeGenerator
+from modifier.code_generator.base_code_generator import (
+    BaseCodeGenerator,
+    count_tokens,
+    dumps_table_info,
+)
+from util.file_utils import read_files_concurrently, read_text_file, resolve_target_path
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,8 @@ class BaseContextGenerator(ABC):
     def __init__(self, config: Configuration, code_generator: BaseCodeGenerator):
         self._config = config
         self._code_generator = code_generator
+        # resolved path -> (content, content tokens), only inside reuse_file_reads()
+        self._file_cache: Optional[Dict[str, Tuple[str, int]]] = None
 
     @abstractmethod
     def generate(
@@ -45,16 +50,218 @@ class BaseContextGenerator(ABC):
         """
         raise NotImplementedError
 
+    @contextmanager
+    def reuse_file_reads(self) -> Iterator[None]:
+        """
+        Reads and tokenizes each file at most once while the block runs.
+
+        A file listed under several layers is still batched, and sent to the
+        LLM, once per layer; only its read and content token count are shared.
+        Paths are compared after resolving them against the target project.
+        The cache is dropped when the block ends, so a later table sees files
+        as patched by earlier plans.
+        """
+        self._file_cache = {}
+        try:
+            yield
+        finally:
+            self._file_cache = None
+
     def _calculate_token_size(self, text: str) -> int:
         """텍스트의 토큰 크기를 계산합니다."""
         try:
             import tiktoken
 
             encoder = tiktoken.encoding_for_model("gpt-4")
-            return len(encoder.encode(text))
+            return count_tokens(encoder, text)
         except Exception:
             return len(text) // 4
 
+    def _pack_batches(
+        self,
+        sized_paths: List[Tuple[str, int]],
+        empty_num_tokens: int,
+        separator_tokens: int,
+        max_tokens: int,
+    ) -> List[List[str]]:
+        """
+        Groups files into batches whose prompt stays within max_tokens.
+
+        With config.batch_packing == "sequential" files are added in input
+        order and a new batch starts when the next file does not fit. With
+        "first_fit_decreasing" files are placed largest-first into the first
+        batch with room, which usually needs fewer batches. Files inside a
+        batch, and the batches themselves, keep input order. A file larger
+        than max_tokens always gets a batch of its own.
+
+        Args:
+            sized_paths: (file path, snippet tokens) in input order.
+            empty_num_tokens: Tokens of the prompt without source files.
+            separator_tokens: Tokens of the separator between snippets.
+            max_tokens: Token cap per batch.
+
+        Returns:
+            List[List[str]]: File paths of each batch.
+        """
+        if self._config.batch_packing != "first_fit_decreasing":
+            batches: List[List[str]] = []
+            current_paths: List[str] = []
+            current_batch_tokens = empty_num_tokens
+            for file_path, snippet_tokens in sized_paths:
+                # Add separator tokens if not the first snippet
+                tokens_to_add = snippet_tokens
+                if current_paths:
+                    tokens_to_add += separator_tokens
+
+                if (
+                    current_paths
+                    and (current_batch_tokens + tokens_to_add) > max_tokens
+                ):
+                    batches.append(current_paths)
+                    current_paths = [file_path]
+                    current_batch_tokens = empty_num_tokens + snippet_tokens
+                else:
+                    current_paths.append(file_path)
+                    current_batch_tokens += tokens_to_add
+            if current_paths:
+                batches.append(current_paths)
+            return batches
+
+        # First-fit decreasing: [used tokens, member indices]
+        bins: List[List[Any]] = []
+        # Batches that can still take the smallest file (full ones are not rescanned)
+        open_bins: List[List[Any]] = []
+        order = sorted(range(len(sized_paths)), key=lambda i: -sized_paths[i][1])
+        min_fill = (
+            separator_tokens + min(size for _, size in sized_paths)
+            if sized_paths
+            else 0
+        )
+        for index in order:
+            snippet_tokens = sized_paths[index][1]
+            for pos, bin_ in enumerate(open_bins):
+                if bin_[0] + separator_tokens + snippet_tokens <= max_tokens:
+                    bin_[0] += separator_tokens + snippet_tokens
+                    bin_[1].append(index)
+                    if bin_[0] + min_fill > max_tokens:
+                        del open_bins[pos]
+                    break
+            else:
+                bin_ = [empty_num_tokens + snippet_tokens, [index]]
+                bins.append(bin_)
+                if bin_[0] + min_fill <= max_tokens:
+                    open_bins.append(bin_)
+
+        groups = sorted(sorted(members) for _, members in bins)
+        return [[sized_paths[i][0] for i in members] for members in groups]
+
+    def _size_snippets(
+        self,
+        file_paths: List[str],
+        contents: List[str],
+        content_tokens: Optional[List[Optional[int]]] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Estimates the prompt tokens of each file snippet.
+
+        A snippet is "=== File Path (Absolute): {path} ===\n{content}". The
+        header and the content are tokenized separately in one batch call, so
+        no content-sized snippet string is built. Tokenizing them apart can
+        split differently at the join than the real snippet, by at most one
+        token, so each file reserves one boundary token to keep the batch
+        within max_tokens_per_batch.
+
+        Args:
+            file_paths: Paths of the files that were read.
+            contents: Content of each file, in the same order.
+            content_tokens: Already known content token counts, None where
+                unknown. Unknown entries are counted and filled in place.
+
+        Returns:
+            List[Tuple[str, int]]: (file path, snippet tokens) in input order.
+        """
+        if content_tokens is None:
+            content_tokens = [None] * len(contents)
+        headers = [
+            f"=== File Path (Absolute): {file_path} ===\n" for file_path in file_paths
+        ]
+        uncounted = [i for i, tokens in enumerate(content_tokens) if tokens is None]
+        token_counts = self._code_generator.calculate_token_sizes(
+            headers + [contents[i] for i in uncounted]
+        )
+        for i, tokens in zip(uncounted, token_counts[len(headers) :]):
+            content_tokens[i] = tokens
+        return [
+            (file_path, token_counts[i] + content_tokens[i] + 1)
+            for i, file_path in enumerate(file_paths)
+        ]
+
+    def _read_sized_snippets(
+        self,
+        file_paths: List[str],
+        read_content: Optional[Callable[[str], str]] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Reads the files and estimates the prompt tokens of each snippet.
+
+        Files are read concurrently. Files that cannot be read are logged and
+        left out. Inside reuse_file_reads() a whole file already read for
+        another batch is not read or tokenized again.
+
+        Args:
+            file_paths: List of file paths.
+            read_content: Returns the snippet content of one file. Defaults to
+                the whole file. Custom content is not shared through
+                reuse_file_reads().
+
+        Returns:
+            List[Tuple[str, int]]: (file path, snippet tokens) in input order.
+        """
+        cache = self._file_cache if read_content is None else None
+        if read_content is None:
+            read_content = read_text_file
+        if cache is None:
+            keys = file_paths
+        else:
+            project_root = str(self._config.target_project)
+            keys = [resolve_target_path(path, project_root) for path in file_paths]
+        to_read = [
+            path
+            for path, key in zip(file_paths, keys)
+            if cache is None or key not in cache
+        ]
+        # Read content for token calculation (no separate exists() stat)
+        read_results = dict(
+            zip(to_read, read_files_concurrently(to_read, read_content))
+        )
+
+        read_paths: List[str] = []
+        read_keys: List[str] = []
+        contents: List[str] = []
+        content_tokens: List[Optional[int]] = []
+        for file_path, key in zip(file_paths, keys):
+            if cache is not None and key in cache:
+                content, tokens = cache[key]
+            else:
+                content, tokens = read_results[file_path], None
+                if isinstance(content, FileNotFoundError):
+                    logger.warning(f"File not found during batch creation: {file_path}")
+                    continue
+                if isinstance(content, Exception):
+                    logger.error(f"Failed to read file {file_path}: {content}")
+                    continue
+
+            read_paths.append(file_path)
+            read_keys.append(key)
+            contents.append(content)
+            content_tokens.append(tokens)
+
+        sized_paths = self._size_snippets(read_paths, contents, content_tokens)
+        if cache is not None:
+            for key, content, tokens in zip(read_keys, contents, content_tokens):
+                cache[key] = (content, tokens)
+        return sized_paths
+
     def create_batches(
         self,
         file_paths: List[str],
@@ -81,86 +288,59 @@ class BaseContextGenerator(ABC):
         if not file_paths:
             return []
 
-        batches: List[ModificationContext] = []
-        current_paths: List[str] = []
+        return self._batch_files(file_paths, table_name, columns, layer, context_files)
+
+    def _batch_files(
+        self,
+        file_paths: List[str],
+        table_name: str,
+        columns: List[Dict],
+        layer: str,
+        context_files: List[str],
+        read_content: Optional[Callable[[str], str]] = None,
+    ) -> List[ModificationContext]:
+        """
+        Reads, sizes and packs files into modification contexts.
+
+        Args:
+            file_paths: List of file paths (not empty).
+            table_name: Table name.
+            columns: List of columns.
+            layer: Layer name.
+            context_files: List of context file paths.
+            read_content: Returns the snippet content used to size one file.
+                Defaults to the whole file.
 
+        Returns:
+            List[ModificationContext]: List of split modification contexts.
+        """
         # Prepare basic info
-        table_info = {
-            "table_name": table_name,
-            "columns": columns,
-        }
-        formatted_table_info = json.dumps(table_info, indent=2, ensure_ascii=False)
+        formatted_table_info = dumps_table_info(table_name, columns)
         max_tokens = self._config.max_tokens_per_batch
 
-        input_empty_data = CodeGeneratorInput(
-            file_paths=[], table_info=formatted_table_info, layer_name=layer
+        # Tokens of the prompt without source files (cached per table/layer)
+        empty_num_tokens = self._code_generator.calculate_empty_prompt_tokens(
+            formatted_table_info, layer
         )
 
-        # Create empty prompt and calculate tokens
-        empty_prompt = self._code_generator.create_prompt(input_empty_data)
-        empty_num_tokens = self._code_generator.calculate_token_size(empty_prompt)
-
         # Calculate separator tokens ("\n\n")
         separator_tokens = self._code_generator.calculate_token_size("\n\n")
 
-        current_batch_tokens = empty_num_tokens
-
-        for file_path in file_paths:
-            # Read content for token calculation
-            try:
-                path_obj = Path(file_path)
-                if not path_obj.exists():
-                    logger.warning(f"File not found during batch creation: {file_path}")
-                    continue
+        sized_paths = self._read_sized_snippets(file_paths, read_content)
 
-                with open(path_obj, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception as e:
-                logger.error(f"Failed to read file {file_path}: {e}")
-                continue
-
-            # Format snippet and calculate tokens
-            snippet_formatted = f"=== File Path (Absolute): {file_path} ===\n{content}"
-            snippet_tokens = self._code_generator.calculate_token_size(
-                snippet_formatted
+        batches = [
+            ModificationContext(
+                file_paths=batch_paths,
+                table_name=table_name,
+                columns=columns,
+                file_count=len(batch_paths),
+                layer=layer,
+                context_files=context_files,
             )
-
-            # Add separator tokens if not the first snippet
-            tokens_to_add = snippet_tokens
-            if current_paths:
-                tokens_to_add += separator_tokens
-
-            if current_paths and (current_batch_tokens + tokens_to_add) > max_tokens:
-                # Save current batch and start new one
-                batches.append(
-                    ModificationContext(
-                        file_paths=current_paths,
-                        table_name=table_name,
-                        columns=columns,
-                        file_count=len(current_paths),
-                        layer=layer,
-                        context_files=context_files,
-                    )
-                )
-                current_paths = [file_path]
-                current_batch_tokens = empty_num_tokens + snippet_tokens
-            else:
-                # Add to current batch
-                current_paths.append(file_path)
-                current_batch_tokens += tokens_to_add
-
-        # Add last batch
-        if current_paths:
-            batches.append(
-                ModificationContext(
-                    file_paths=current_paths,
-                    table_name=table_name,
-                    columns=columns,
-                    file_count=len(current_paths),
-                    layer=layer,
-                    context_files=context_files,
-                )
+            for batch_paths in self._pack_batches(
+                sized_paths, empty_num_tokens, separator_tokens, max_tokens
             )
+        ]
 
         logger.info(
             f"Split {len(file_paths)} files into {len(batches)} batches (ModificationContext)."
@@ -4,15 +4,62 @@ Error Handler 모듈
 에러 처리, 롤백, 재시도 로직을 구현하는 모듈입니다.
 """
 
+import errno
 import logging
+import random
 import shutil
+import sys
 import time
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# reflink(copy-on-write) 복사 지원 (Linux 전용, 미지원 환경에서는 shutil.copy2 사용)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# FICLONE ioctl (linux/fs.h) - Python 3.12 미만에서는 fcntl에 상수가 없음
+_FICLONE: Optional[int] = None
+if fcntl is not None and sys.platform.startswith("linux"):
+    _FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+# 파일시스템이 reflink를 지원하지 않는 경우 이후 시도를 생략
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS}
+)
+_reflink_enabled = _FICLONE is not None
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    파일을 메타데이터와 함께 복사합니다. (shutil.copy2와 동일한 결과)
+
+    btrfs/XFS 등 reflink를 지원하는 파일시스템에서는 데이터 블록을 복사하지 않고
+    copy-on-write 복제를 사용합니다.
+
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+    """
+    global _reflink_enabled
+
+    if _reflink_enabled:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError as e:
+            if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                _reflink_enabled = False
+            # 실패 시 아래 shutil.copy2가 대상 파일을 덮어씀
+
+    shutil.copy2(src, dst)
+
 
 class ErrorHandler:
     """
@@ -54,6 +101,9 @@ class ErrorHandler:
         """
         지수 백오프 전략으로 함수를 재시도합니다.
 
+        대기 시간에는 지터(백오프의 50~100%)를 적용하여, 여러 워커 스레드가 같은
+        오류(429 등)를 동시에 받았을 때 같은 시점에 다시 몰려 재시도하지 않도록 합니다.
+
         Args:
             func: 재시도할 함수
             *args: 함수 인자
@@ -81,8 +131,9 @@ class ErrorHandler:
                 )
 
                 if attempt < self.max_retries:
-                    # 백오프 시간 계산
+                    # 백오프 시간 계산 (지터 적용)
                     wait_time = min(backoff, self.max_backoff)
+                    wait_time *= random.uniform(0.5, 1.0)
                     logger.info(f"{wait_time:.2f}초 후 재시도...")
                     time.sleep(wait_time)
 
@@ -93,7 +144,7 @@ class ErrorHandler:
 
         return None, last_error
 
-    def backup_file(self, file_path: Path) -> Optional[Path]:
+    def backup_file(self, file_path: Union[str, Path]) -> Optional[Path]:
         """
         파일을 백업합니다.
 
@@ -103,6 +154,7 @@ class ErrorHandler:
         Returns:
             Optional[Path]: 백업된 파일 경로 (실패 시 None)
         """
+        file_path = Path(file_path)
         try:
             if not file_path.exists():
                 logger.warning(f"백업할 파일이 존재하지 않습니다: {file_path}")
@@ -111,7 +163,7 @@ class ErrorHandler:
             # 백업 파일 경로 생성
             base_backup_path = file_path.with_suffix(file_path.suffix + ".backup")
             backup_path = base_backup_path
-            
+
             # 이미 백업 파일이 존재하면 번호 붙이기 (.backup.1, .backup.2, ...)
             counter = 1
             while backup_path.exists():
@@ -119,7 +171,7 @@ class ErrorHandler:
                 counter += 1
 
             # 백업
-            shutil.copy2(file_path, backup_path)
+            _copy_file(file_path, backup_path)
 
             # 백업 정보 저장
             self._backup_files[str(file_path)] = backup_path
@@ -132,7 +184,7 @@ class ErrorHandler:
             logger.error(f"파일 백업 실패: {file_path} - {e}")
             return None
 
-    def restore_file(self, file_path: Path) -> bool:
+    def restore_file(self, file_path: Union[str, Path]) -> bool:
         """
         백업된 파일을 복원합니다.
 
@@ -142,6 +194,7 @@ class ErrorHandler:
         Returns:
             bool: 복원 성공 여부
         """
+        file_path = Path(file_path)
         try:
             backup_path = self._backup_files.get(str(file_path))
             if not backup_path or not backup_path.exists():
@@ -149,7 +202,7 @@ class ErrorHandler:
                 return False
 
             # 복원
-            shutil.copy2(backup_path, file_path)
+            _copy_file(backup_path, file_path)
 
             logger.info(f"파일 복원 완료: {backup_path} -> {file_path}")
             return True
@@ -9,6 +9,7 @@ from .llm_factory import create_llm_provider
 from .llm_provider import LLMProvider
 from .mock_llm_provider import MockLLMProvider
 from .openai_provider import OpenAIProvider
+from .rate_limited_provider import RateLimitedLLMProvider
 from .watsonx_provider import WatsonXAIProvider
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     "OpenAIProvider",
     "ClaudeAIProvider",
     "MockLLMProvider",
+    "RateLimitedLLMProvider",
     "create_llm_provider",
 ]
@@ -4,7 +4,10 @@ Claude AI Provider 구현
 Anthropic Claude AI LLM API를 호출하는 프로바이더입니다.
 """
 
+import functools
 import logging
+import os
+import threading
 from typing import Any, Dict, Optional
 
 try:
@@ -19,6 +22,50 @@ from .llm_provider import LLMProvider
 logger = logging.getLogger(__name__)
 
 
+# 프롬프트 캐시를 적용할 최소 공통 접두부 길이 (문자 수, 약 1024 토큰)
+_PROMPT_CACHE_MIN_CHARS = 4096
+
+
+def _cacheable_prefix_length(previous_prompt: Optional[str], prompt: str) -> int:
+    """
+    직전 프롬프트와 공유하는 접두부 중 캐시할 길이를 반환합니다.
+
+    같은 템플릿/테이블의 배치 프롬프트는 지시문과 table_info가 동일하고
+    소스 파일 부분부터 달라지므로, 공통 접두부를 줄 경계에서 잘라 캐시 경계로
+    사용합니다. 줄 단위로 자르므로 배치가 바뀌어도 경계 위치가 유지됩니다.
+
+    Args:
+        previous_prompt: 직전에 전송한 프롬프트
+        prompt: 이번에 전송할 프롬프트
+
+    Returns:
+        int: 캐시할 접두부 길이 (캐시하지 않으면 0)
+    """
+    if not previous_prompt:
+        return 0
+    # 뒷부분 블록이 비지 않도록 마지막 문자는 비교에서 제외
+    common = len(os.path.commonprefix([previous_prompt, prompt[:-1]]))
+    boundary = prompt.rfind("\n", 0, common) + 1
+    return boundary if boundary >= _PROMPT_CACHE_MIN_CHARS else 0
+
+
+@functools.lru_cache(maxsize=8)
+def _get_shared_client(api_key: str) -> "Anthropic":
+    """
+    API 키별로 공유하는 Anthropic 클라이언트를 반환합니다.
+
+    analysis/execution 등 여러 프로바이더 인스턴스가 같은 클라이언트의
+    keep-alive 커넥션 풀을 재사용하여 호출마다 TLS 연결을 새로 맺지 않습니다.
+
+    Args:
+        api_key: Anthropic API 키
+
+    Returns:
+        Anthropic: 공유 클라이언트
+    """
+    return Anthropic(api_key=api_key)
+
+
 class ClaudeAIProvider(LLMProvider):
     """
     Claude AI Provider 구현 클래스
@@ -26,6 +73,8 @@ class ClaudeAIProvider(LLMProvider):
     Anthropic Claude AI API를 사용하여 LLM 호출을 수행합니다.
     """
 
+    DEFAULT_MAX_TOKENS = 64000
+
     def __init__(self, api_key: str, model_id: Optional[str] = None, **kwargs):
         """
         Claude AI Provider 초기화
@@ -43,10 +92,14 @@ class ClaudeAIProvider(LLMProvider):
 
         self.api_key = api_key
         self.model_id = model_id or "claude-sonnet-4-20250514"
+        # 프롬프트 캐시 경계 계산용 직전 프롬프트 (스레드별)
+        # 배치 워커 스레드들이 인스턴스를 공유하므로 다른 스레드의 프롬프트로
+        # 캐시 경계가 흔들리지 않도록 스레드마다 따로 보관
+        self._thread_state = threading.local()
 
         # Anthropic 클라이언트 초기화
         try:
-            self.client = Anthropic(api_key=self.api_key)
+            self.client = _get_shared_client(self.api_key)
 
             logger.info(f"Claude AI Provider 초기화 완료: {self.model_id}")
         except Exception as e:
@@ -75,11 +128,28 @@ class ClaudeAIProvider(LLMProvider):
                 - model: 사용된 모델명
         """
         try:
+            # 직전 프롬프트와 같은 접두부(지시문, table_info)는 프롬프트 캐시로 재사용
+            prefix_length = _cacheable_prefix_length(
+                getattr(self._thread_state, "last_prompt", None), prompt
+            )
+            self._thread_state.last_prompt = prompt
+            if prefix_length:
+                content_blocks: Any = [
+                    {
+                        "type": "text",
+                        "text": prompt[:prefix_length],
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": prompt[prefix_length:]},
+                ]
+            else:
+                content_blocks = prompt
+
             # 파라미터 설정
             params = {
                 "model": self.model_id,
-                "max_tokens": max_tokens or 64000,
-                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
+                "messages": [{"role": "user", "content": content_blocks}],
             }
 
             if temperature is not None:
@@ -97,9 +167,13 @@ class ClaudeAIProvider(LLMProvider):
                 # 최종 메시지에서 사용량 정보 가져오기
                 final_message = stream.get_final_message()
                 if final_message.usage:
+                    usage = final_message.usage
+                    # 캐시에서 읽거나 캐시에 기록한 입력 토큰도 사용량에 포함
                     tokens_used = (
-                        final_message.usage.input_tokens
-                        + final_message.usage.output_tokens
+                        usage.input_tokens
+                        + usage.output_tokens
+                        + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+                        + (getattr(usage, "cache_read_input_tokens", 0) or 0)
                     )
 
             # 수집한 텍스트를 하나의 문자열로 결합
@@ -6,11 +6,13 @@ LLM Provider Factory
 
 import logging
 import os
+from typing import Optional
 
 from .claude_ai_provider import ClaudeAIProvider
 from .llm_provider import LLMProvider
 from .mock_llm_provider import MockLLMProvider
 from .openai_provider import OpenAIProvider
+from .rate_limited_provider import RateLimitedLLMProvider
 from .watsonx_provider import WatsonXAIProvider
 from .watsonx_provider_on_prem import WatsonXAIOnPremiseProvider
 
@@ -24,7 +26,11 @@ class LLMProviderError(Exception):
 
 
 def create_llm_provider(
-    provider_name: str, model_id: str = None
+    provider_name: str,
+    model_id: str = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    expected_output_tokens: int = 0,
 ) -> LLMProvider:
     """
     설정에 따라 적절한 LLM 프로바이더를 생성합니다.
@@ -33,6 +39,9 @@ def create_llm_provider(
     Args:
         provider_name: 프로바이더 이름 ("watsonx_ai", "openai", "claude_ai", "mock")
         model_id: 사용할 모델 ID (선택적, 지정하지 않으면 환경변수에서 가져옴)
+        requests_per_minute: 분당 최대 요청 수 (선택적, 지정 시 호출 속도 조절)
+        tokens_per_minute: 분당 최대 토큰 수 (선택적, 지정 시 호출 속도 조절)
+        expected_output_tokens: max_tokens 미지정 호출의 예상 출력 토큰 수 (TPM 차감용)
 
     Returns:
         LLMProvider: 생성된 LLM 프로바이더 인스턴스
@@ -40,6 +49,25 @@ def create_llm_provider(
     Raises:
         LLMProviderError: 지원하지 않는 프로바이더이거나 생성 실패 시
     """
+    provider = _create_provider(provider_name, model_id)
+    if requests_per_minute or tokens_per_minute:
+        logger.info(
+            f"LLM 호출 한도 적용: {provider_name} "
+            f"(RPM: {requests_per_minute}, TPM: {tokens_per_minute})"
+        )
+        return RateLimitedLLMProvider(
+            provider,
+            provider_name=provider_name.lower(),
+            model_id=model_id,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            expected_output_tokens=expected_output_tokens,
+        )
+    return provider
+
+
+def _create_provider(provider_name: str, model_id: str = None) -> LLMProvider:
+    """프로바이더 이름에 맞는 LLM 프로바이더 인스턴스를 생성합니다."""
     provider_name_lower = provider_name.lower()
 
     if provider_name_lower == "watsonx_ai" or provider_name_lower == "watsonx":
@@ -15,6 +15,10 @@ class LLMProvider(ABC):
     모든 LLM 프로바이더는 이 클래스를 상속받아 구현해야 합니다.
     """
 
+    # call()에 max_tokens를 지정하지 않았을 때 API에 전달하는 최대 출력 토큰 수
+    # (None이면 API 기본값 사용)
+    DEFAULT_MAX_TOKENS: Optional[int] = None
+
     @abstractmethod
     def call(
         self,
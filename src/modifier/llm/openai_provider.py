@@ -4,6 +4,7 @@ OpenAI Provider 구현
 OpenAI LLM API를 호출하는 프로바이더입니다.
 """
 
+import functools
 import logging
 from typing import Any, Dict, Optional
 
@@ -19,6 +20,23 @@ from .llm_provider import LLMProvider
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_shared_client(api_key: str) -> "openai.OpenAI":
+    """
+    API 키별로 공유하는 OpenAI 클라이언트를 반환합니다.
+
+    analysis/execution 등 여러 프로바이더 인스턴스가 같은 클라이언트의
+    keep-alive 커넥션 풀을 재사용하여 호출마다 TLS 연결을 새로 맺지 않습니다.
+
+    Args:
+        api_key: OpenAI API 키
+
+    Returns:
+        openai.OpenAI: 공유 클라이언트
+    """
+    return openai.OpenAI(api_key=api_key)
+
+
 class OpenAIProvider(LLMProvider):
     """
     OpenAI Provider 구현 클래스
@@ -47,7 +65,7 @@ class OpenAIProvider(LLMProvider):
         # OpenAI 클라이언트 초기화
         try:
             openai.api_key = self.api_key
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self.client = _get_shared_client(self.api_key)
 
             logger.info(f"OpenAI Provider 초기화 완료: {self.model_id}")
         except Exception as e:
@@ -0,0 +1,191 @@
+"""
+Rate Limited LLM Provider
+
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 한도에 맞춰 LLM 호출 속도를 조절하는
+프로바이더 래퍼입니다. 한도를 넘는 호출을 미리 대기시켜 429 응답과 재시도로 인한
+지연을 줄입니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .llm_provider import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷
+
+    분당 용량만큼 채워져 있다가 초당 (용량 / 60)씩 다시 채워집니다.
+    """
+
+    def __init__(self, capacity_per_minute: int):
+        """
+        TokenBucket 초기화
+
+        Args:
+            capacity_per_minute: 분당 허용량 (양수)
+        """
+        self.capacity = float(capacity_per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        허용량을 차감합니다. 부족하면 채워질 때까지 대기합니다.
+
+        용량보다 큰 요청은 용량만큼만 차감하여 무한 대기를 막습니다.
+
+        Args:
+            amount: 차감할 양
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._available = min(
+                    self.capacity,
+                    self._available + (now - self._updated) * self.refill_rate,
+                )
+                self._updated = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return waited
+                wait_seconds = (amount - self._available) / self.refill_rate
+            time.sleep(wait_seconds)
+            waited += wait_seconds
+
+
+# (프로바이더명, 모델 ID, 종류) -> 버킷
+# 같은 모델을 쓰는 프로바이더 인스턴스들은 API 한도를 공유하므로 버킷도 공유
+_BUCKETS: Dict[Tuple[str, Optional[str], str], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _get_bucket(
+    provider_name: str, model_id: Optional[str], kind: str, capacity_per_minute: int
+) -> TokenBucket:
+    """
+    프로바이더/모델별 공용 버킷을 반환합니다.
+
+    이미 버킷이 있으면 사용량을 유지하기 위해 기존 버킷을 그대로 사용하며,
+    다른 한도가 지정되면 경고를 남기고 기존 한도를 유지합니다.
+    """
+    key = (provider_name, model_id, kind)
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = TokenBucket(capacity_per_minute)
+            _BUCKETS[key] = bucket
+        elif bucket.capacity != capacity_per_minute:
+            logger.warning(
+                f"{provider_name}/{model_id} {kind} 한도가 이미 "
+                f"{int(bucket.capacity)}/분으로 설정되어 있어 "
+                f"{capacity_per_minute}/분 설정을 무시합니다."
+            )
+        return bucket
+
+
+class RateLimitedLLMProvider(LLMProvider):
+    """
+    RPM/TPM 한도를 지키도록 호출을 조절하는 LLM 프로바이더 래퍼
+
+    TPM은 프롬프트 길이로 추정한 입력 토큰 수(문자 4개당 1토큰)와 호출 시 지정한
+    max_tokens(미지정 시 설정된 예상 출력 토큰 수)를 더한 값으로 차감합니다.
+    모델의 최대 출력 토큰 수(DEFAULT_MAX_TOKENS)는 실제 출력보다 훨씬 커서
+    차감에 쓰면 한 번의 호출이 분당 한도를 모두 소진하므로 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        provider_name: str,
+        model_id: Optional[str] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        expected_output_tokens: int = 0,
+    ):
+        """
+        RateLimitedLLMProvider 초기화
+
+        Args:
+            provider: 실제 호출을 수행할 LLM 프로바이더
+            provider_name: 프로바이더 이름 (버킷 공유 키)
+            model_id: 모델 ID (버킷 공유 키)
+            requests_per_minute: 분당 최대 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (None이면 제한 없음)
+            expected_output_tokens: max_tokens 미지정 호출의 예상 출력 토큰 수
+        """
+        self._provider = provider
+        self._expected_output_tokens = expected_output_tokens
+        self._request_bucket = (
+            _get_bucket(provider_name, model_id, "requests", requests_per_minute)
+            if requests_per_minute
+            else None
+        )
+        self._token_bucket = (
+            _get_bucket(provider_name, model_id, "tokens", tokens_per_minute)
+            if tokens_per_minute
+            else None
+        )
+
+    @property
+    def DEFAULT_MAX_TOKENS(self) -> Optional[int]:
+        """원본 프로바이더의 기본 최대 출력 토큰 수"""
+        return self._provider.DEFAULT_MAX_TOKENS
+
+    def __getattr__(self, name: str) -> Any:
+        # 프로바이더 고유 속성(model_id 등)은 원본 프로바이더에서 조회
+        if name == "_provider":
+            raise AttributeError(name)
+        return getattr(self._provider, name)
+
+    def call(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        한도 안에서 LLM API를 호출합니다.
+
+        Args:
+            prompt: LLM에 전달할 프롬프트
+            max_tokens: 최대 토큰 수 (선택적)
+            temperature: 온도 파라미터 (선택적)
+
+        Returns:
+            Dict[str, Any]: LLM 응답 딕셔너리
+        """
+        waited = 0.0
+        if self._request_bucket is not None:
+            waited += self._request_bucket.acquire(1)
+        if self._token_bucket is not None:
+            output_tokens = (
+                max_tokens if max_tokens is not None else self._expected_output_tokens
+            )
+            waited += self._token_bucket.acquire(len(prompt) // 4 + output_tokens)
+        if waited > 0:
+            logger.debug(f"LLM 호출 한도로 {waited:.2f}초 대기")
+
+        return self._provider.call(
+            prompt, max_tokens=max_tokens, temperature=temperature
+        )
+
+    def validate_response(self, response: Dict[str, Any]) -> bool:
+        """원본 프로바이더로 응답 유효성을 검증합니다."""
+        return self._provider.validate_response(response)
+
+    def get_provider_name(self) -> str:
+        """원본 프로바이더 이름을 반환합니다."""
+        return self._provider.get_provider_name()
@@ -28,6 +28,8 @@ class WatsonXAIProvider(LLMProvider):
     IBM WatsonX.AI API를 사용하여 LLM 호출을 수행합니다.
     """
 
+    DEFAULT_MAX_TOKENS = 100000
+
     def __init__(
         self,
         api_key: str,
@@ -106,7 +108,7 @@ class WatsonXAIProvider(LLMProvider):
 
             # 파라미터 설정
             params = {
-                "max_tokens": max_tokens or 100000,
+                "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
                 "temperature": 0.0,
                 "top_p": 1.0
             }
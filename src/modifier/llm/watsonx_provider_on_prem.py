@@ -7,10 +7,18 @@ IBM WatsonX.AI OnPremise LLM API를 호출하는 프로바이더입니다.
 import json
 import logging
 import os
+import threading
 import warnings
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# 요청/응답 JSON 직렬화 가속 (선택적, 미설치 시 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .llm_provider import LLMProvider
 
@@ -18,6 +26,57 @@ warnings.filterwarnings("ignore")
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전체에서 공유하는 HTTP 세션 (keep-alive 커넥션 재사용)
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _dumps_request_body(body: Dict[str, Any]) -> bytes:
+    """
+    요청 본문을 UTF-8 JSON 바이트로 직렬화합니다.
+
+    requests의 json= 인자는 ensure_ascii=True로 직렬화하여 한글 프롬프트가
+    문자당 6바이트(\\uXXXX)로 늘어나므로, UTF-8 그대로 전송합니다.
+
+    Args:
+        body: 요청 본문
+
+    Returns:
+        bytes: JSON 바이트열
+    """
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_response_body(response: requests.Response) -> Any:
+    """응답 본문 JSON을 파싱합니다. (orjson 설치 시 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _get_shared_session() -> requests.Session:
+    """
+    keep-alive 커넥션 풀을 가진 공유 requests.Session을 반환합니다.
+
+    호출마다 requests.post()로 새 TCP/TLS 연결을 맺지 않도록
+    analysis/execution 프로바이더가 같은 세션을 재사용합니다.
+
+    Returns:
+        requests.Session: 공유 세션
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _shared_session = session
+    return _shared_session
+
 
 class WatsonXAIOnPremiseProvider(LLMProvider):
     """
@@ -26,6 +85,8 @@ class WatsonXAIOnPremiseProvider(LLMProvider):
     IBM WatsonX.AI OnPremise API를 사용하여 LLM 호출을 수행합니다.
     """
 
+    DEFAULT_MAX_TOKENS = 100000
+
     def __init__(
         self,
         api_key: str,
@@ -58,6 +119,7 @@ class WatsonXAIOnPremiseProvider(LLMProvider):
             "WATSONX_ON_PREMISE_MODEL_ID", "ibm/granite-3-3-8b-instruct"
         )
         self.project_id = project_id or os.getenv("WATSONX_ON_PREMISE_PROJECT_ID")
+        self.session = _get_shared_session()
 
     def _get_credentials(self) -> Dict[str, Any]:
         """
@@ -73,7 +135,7 @@ class WatsonXAIOnPremiseProvider(LLMProvider):
                 "api_key": self.api_key,
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/icp4d-api/v1/authorize",
                 headers=headers,
                 data=json.dumps(data),
@@ -118,19 +180,19 @@ class WatsonXAIOnPremiseProvider(LLMProvider):
                 "project_id": self.project_id,
                 "model_id": self.model_id,
                 "frequency_penalty": 0,
-                "max_tokens": max_tokens or 100000,
+                "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
                 "presence_penalty": 0,
                 "temperature": 0,
                 "top_p": 1,
             }
 
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
-                json=body,
+                data=_dumps_request_body(body),
                 verify=False,
             )
-            response = response.json()
+            response = _loads_response_body(response)
 
             # 응답 파싱 (최신 형식: response["choices"][0]["message"]["content"])
             content = (
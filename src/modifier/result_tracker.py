@@ -4,13 +4,16 @@ Result Tracker 모듈
 수정 결과를 추적하고 통계를 계산하는 모듈입니다.
 """
 
-import json
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from models.table_access_info import TableAccessInfo
+from util.json_utils import dumps_pretty_json
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,12 @@ class ResultTracker:
             "start_time": None,
             "end_time": None,
         }
+        # 병렬 적용 시 통계 갱신 보호
+        self._lock = threading.Lock()
+
+        # 수정 이력 파일 쓰기는 단일 백그라운드 워커에서 처리 (처음 사용 시 생성)
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
 
     def start_tracking(self):
         """추적 시작"""
@@ -110,13 +119,14 @@ class ResultTracker:
             modification_info["reason"] = reason
 
         # 통계 업데이트
-        self.stats["total_files"] += 1
-        if status == "success":
-            self.stats["successful_files"] += 1
-        else:
-            self.stats["failed_files"] += 1
+        with self._lock:
+            self.stats["total_files"] += 1
+            if status == "success":
+                self.stats["successful_files"] += 1
+            else:
+                self.stats["failed_files"] += 1
 
-        self.stats["total_tokens"] += tokens_used
+            self.stats["total_tokens"] += tokens_used
 
         logger.debug(f"수정 정보 기록: {file_path} ({status})")
         return modification_info
@@ -143,18 +153,21 @@ class ResultTracker:
         """
         수정 이력을 JSON 파일로 저장합니다.
 
+        파일 쓰기는 백그라운드에서 진행되며, flush() 또는 save_statistics()
+        호출 시 완료를 기다립니다.
+
         Args:
             table_name: 테이블명
             modifications: 수정 정보 리스트
 
         Returns:
-            Path: 저장된 파일 경로
+            Path: 저장될 파일 경로
         """
         history_file = self.output_dir / f"modification_history_{table_name}.json"
 
         history_data = {
             "table_name": table_name,
-            "modifications": modifications,
+            "modifications": list(modifications),
             "statistics": {
                 "total_files": len(modifications),
                 "successful_files": sum(
@@ -168,36 +181,80 @@ class ResultTracker:
             "timestamp": datetime.now().isoformat(),
         }
 
-        try:
-            with open(history_file, "w", encoding="utf-8") as f:
-                json.dump(history_data, f, indent=2, ensure_ascii=False)
+        # 직렬화와 파일 쓰기는 백그라운드에서 처리하여 다음 테이블 처리를 막지 않음
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="result_tracker"
+            )
+        self._pending_writes.append(
+            self._writer.submit(
+                self._write_json, history_file, history_data, "수정 이력"
+            )
+        )
+        return history_file
 
-            logger.info(f"수정 이력 저장 완료: {history_file}")
-            return history_file
+    def flush(self) -> List[Exception]:
+        """
+        백그라운드에서 진행 중인 수정 이력 저장이 모두 끝날 때까지 대기합니다.
+
+        Returns:
+            List[Exception]: 저장에 실패한 파일의 예외 목록 (제출 순서)
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        errors: List[Exception] = []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                # 실패 로그는 _write_json에서 이미 남김
+                errors.append(e)
+        return errors
+
+    def _write_json(self, path: Path, data: Any, label: str) -> None:
+        """
+        데이터를 임시 파일에 쓴 뒤 교체하여 JSON 파일을 원자적으로 저장합니다.
 
+        Args:
+            path: 저장할 파일 경로
+            data: 저장할 데이터
+            label: 로그에 표시할 이름
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            # orjson이 설치되어 있으면 orjson으로 직렬화
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(dumps_pretty_json(data))
+            os.replace(tmp_path, path)
+            logger.info(f"{label} 저장 완료: {path}")
         except Exception as e:
-            logger.error(f"수정 이력 저장 실패: {e}")
+            logger.error(f"{label} 저장 실패: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             raise
 
     def save_statistics(self) -> Path:
         """
         전체 통계를 JSON 파일로 저장합니다.
 
+        대기 중인 수정 이력 저장을 먼저 마무리하며, 통계를 저장한 뒤
+        수정 이력 저장에 실패한 파일이 있으면 첫 번째 예외를 다시 발생시킵니다.
+
         Returns:
             Path: 저장된 파일 경로
+
+        Raises:
+            Exception: 수정 이력 또는 통계 파일 저장에 실패한 경우
         """
         stats_file = self.output_dir / "modification_statistics.json"
 
-        try:
-            with open(stats_file, "w", encoding="utf-8") as f:
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"통계 저장 완료: {stats_file}")
-            return stats_file
-
-        except Exception as e:
-            logger.error(f"통계 저장 실패: {e}")
-            raise
+        # 마지막 저장이므로 대기 중인 수정 이력 저장을 먼저 마무리
+        errors = self.flush()
+        self._write_json(stats_file, self.get_statistics(), "통계")
+        if errors:
+            raise errors[0]
+        return stats_file
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -206,4 +263,5 @@ class ResultTracker:
         Returns:
             Dict[str, Any]: 통계 딕셔너리
         """
-        return self.stats.copy()
+        with self._lock:
+            return self.stats.copy()
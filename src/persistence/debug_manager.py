@@ -78,20 +78,27 @@ class DebugManager:
         except Exception as e:
             self.logger.error(f"Failed to append rejected hunk: {e}")
 
-    def log_diff(self, backup_path: Optional[str], file_path: str) -> None:
+    def log_diff(
+        self,
+        backup_path: Optional[str],
+        file_path: str,
+        original_content: Optional[str] = None,
+    ) -> None:
         """
         변경 내용을 Diff 파일로 저장
         
         Args:
-            backup_path: 백업 파일 경로 (원본)
+            backup_path: 백업 파일 경로 (원본, original_content가 없을 때 사용)
             file_path: 수정된 파일 경로
+            original_content: 패치 전 원본 내용 (메모리에 있으면 백업 파일을 읽지 않음)
         """
         try:
             # 파일 읽기
-            original_content = ""
-            if backup_path and Path(backup_path).exists():
-                with open(backup_path, "r", encoding="utf-8") as f:
-                    original_content = f.read()
+            if original_content is None:
+                original_content = ""
+                if backup_path and Path(backup_path).exists():
+                    with open(backup_path, "r", encoding="utf-8") as f:
+                        original_content = f.read()
             
             modified_content = ""
             if file_path and Path(file_path).exists():
@@ -0,0 +1,108 @@
+"""
+File Utils 모듈
+
+소스 파일 읽기와 경로 정규화 등 파일 관련 공용 함수를 제공합니다.
+"""
+
+import functools
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+
+# 이 크기(바이트)를 넘는 파일은 메모리 매핑 후 바로 디코딩
+_MMAP_READ_MIN_SIZE = 64 * 1024
+
+
+def read_text_file(path: Union[str, Path]) -> str:
+    """
+    소스 파일을 UTF-8 텍스트로 읽습니다. (open(..., "r", encoding="utf-8").read()와 동일)
+
+    바이트로 한 번에 읽은 뒤 디코딩하여 TextIOWrapper의 증분 디코딩을 생략하며,
+    줄바꿈은 텍스트 모드와 같이 \\n으로 통일합니다. 큰 파일은 메모리 매핑한
+    버퍼에서 바로 디코딩하여 중간 bytes 사본을 만들지 않습니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        str: 파일 내용
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        UnicodeDecodeError: UTF-8로 디코딩할 수 없는 경우
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_READ_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8")
+        else:
+            text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# 여러 파일을 동시에 읽기 위한 공용 스레드 풀 (처음 사용할 때 생성)
+_READ_POOL: Optional[ThreadPoolExecutor] = None
+_READ_POOL_LOCK = threading.Lock()
+
+
+def read_files_concurrently(
+    file_paths: Sequence[Any], read: Callable[[Any], T]
+) -> List[Union[T, Exception]]:
+    """
+    파일별로 read를 공용 스레드 풀에서 실행하고 입력 순서대로 결과를 반환합니다.
+
+    콜드 캐시나 네트워크 파일시스템에서 파일별 디스크 지연이 순차로 누적되지
+    않도록 읽기를 겹쳐 실행합니다. 파일이 하나 이하이면 현재 스레드에서 읽습니다.
+
+    Args:
+        file_paths: 파일 경로 목록
+        read: 파일 하나를 읽는 함수
+
+    Returns:
+        List[Union[T, Exception]]: 파일별 read 결과 또는 읽기 중 발생한 예외
+    """
+    global _READ_POOL
+
+    def read_one(file_path: Any) -> Union[T, Exception]:
+        try:
+            return read(file_path)
+        except Exception as e:
+            return e
+
+    if len(file_paths) <= 1:
+        return [read_one(file_path) for file_path in file_paths]
+    if _READ_POOL is None:
+        with _READ_POOL_LOCK:
+            if _READ_POOL is None:
+                _READ_POOL = ThreadPoolExecutor(
+                    max_workers=8, thread_name_prefix="file-read"
+                )
+    return list(_READ_POOL.map(read_one, file_paths))
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_target_path(file_path: str, project_root: str) -> str:
+    """
+    LLM 응답의 파일 경로를 절대 경로로 정규화합니다. (str(Path.resolve())와 동일)
+
+    상대 경로는 project_root 기준으로 해석하며, 같은 경로는 프로세스당
+    한 번만 해석하여 경로 구성요소별 stat 호출을 반복하지 않습니다.
+
+    Args:
+        file_path: LLM 응답의 파일 경로
+        project_root: 대상 프로젝트 루트 경로
+
+    Returns:
+        str: 정규화된 절대 경로
+    """
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(project_root, file_path)
+    return os.path.realpath(file_path)
@@ -0,0 +1,91 @@
+"""
+JSON Utils 모듈
+
+프롬프트/결과 파일용 JSON 직렬화와 LLM 응답 파싱 함수를 제공합니다.
+"""
+
+import json
+import re
+from typing import Any
+
+# JSON 직렬화/파싱 가속 (선택적, 미설치 시 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty_json(obj: Any) -> str:
+    """
+    프롬프트에 삽입할 JSON 문자열을 생성합니다.
+
+    json.dumps(obj, indent=2, ensure_ascii=False)와 동일한 형식이며,
+    orjson이 설치되어 있으면 orjson으로 직렬화합니다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        str: 들여쓰기 2칸의 JSON 문자열
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson이 지원하지 않는 값 (64비트 초과 정수 등)은 표준 json으로 처리
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps_compact_json(obj: Any) -> str:
+    """
+    패처에 전달할 압축 JSON 문자열을 생성합니다.
+
+    orjson이 설치되어 있으면 orjson으로 직렬화하고, 없으면
+    json.dumps(obj, ensure_ascii=False)를 사용합니다. 두 결과는 공백만 다르며
+    파싱 결과는 동일합니다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        str: JSON 문자열
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson이 지원하지 않는 값 (64비트 초과 정수 등)은 표준 json으로 처리
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
+_LONG_DIGITS_RE = re.compile(r"\d{19,}")
+
+
+def loads_json(json_str: str) -> Any:
+    """
+    LLM 응답의 JSON 문자열을 파싱합니다.
+
+    orjson이 설치되어 있으면 orjson으로 먼저 파싱하고, orjson이 거부하는 입력
+    (NaN 리터럴 등)과 64비트를 넘을 수 있는 정수는 표준 json으로 파싱하므로
+    결과와 예외(json.JSONDecodeError)는 json.loads와 동일합니다.
+
+    Args:
+        json_str: JSON 문자열
+
+    Returns:
+        Any: 파싱된 객체
+
+    Raises:
+        json.JSONDecodeError: 표준 json으로도 파싱할 수 없는 경우
+    """
+    # orjson은 64비트를 넘는 정수를 float으로 변환하므로 긴 숫자열이 있으면 표준 json 사용
+    if orjson is not None and not _LONG_DIGITS_RE.search(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
@@ -0,0 +1,98 @@
+"""
+ClaudeAIProvider 프롬프트 캐시 테스트
+
+같은 템플릿/테이블의 프롬프트가 바이트 단위로 동일한 캐시 접두부를 보내는지
+검증합니다. 실제 API는 호출하지 않습니다.
+"""
+
+import hashlib
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from modifier.llm import claude_ai_provider
+from modifier.llm.claude_ai_provider import ClaudeAIProvider
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """전송된 요청 파라미터를 기록하는 가짜 클라이언트를 쓰는 프로바이더"""
+    sent = []
+    lock = threading.Lock()
+
+    def stream(**params):
+        with lock:
+            sent.append((threading.get_ident(), params))
+        response = MagicMock()
+        response.text_stream = ["ok"]
+        response.get_final_message.return_value = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1)
+        )
+        context = MagicMock()
+        context.__enter__.return_value = response
+        return context
+
+    client = SimpleNamespace(messages=SimpleNamespace(stream=stream))
+    monkeypatch.setattr(
+        claude_ai_provider, "_get_shared_client", lambda api_key: client
+    )
+    instance = ClaudeAIProvider(api_key="test")
+    instance.sent = sent
+    return instance
+
+
+def _prompt(header: str, batch: int) -> str:
+    return f"{header}\n## Source Files\n// batch {batch}\nclass A{batch} {{}}\n"
+
+
+def _cached_prefix_digest(params) -> str:
+    content = params["messages"][0]["content"]
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    return hashlib.sha256(content[0]["text"].encode("utf-8")).hexdigest()
+
+
+def test_cached_prefix_is_byte_identical_across_batches(provider):
+    header = "## Instructions\n" + "Encrypt the target columns.\n" * 300
+
+    for batch in range(4):
+        provider.call(_prompt(header, batch))
+
+    digests = {_cached_prefix_digest(params) for _, params in provider.sent[1:]}
+    expected = hashlib.sha256(
+        f"{header}\n## Source Files\n".encode("utf-8")
+    ).hexdigest()
+    assert digests == {expected}
+
+
+def test_cached_prefix_is_stable_per_thread(provider):
+    headers = {
+        name: f"## Table {name}\n" + f"column info for {name}\n" * 300
+        for name in ("USERS", "ORDERS")
+    }
+    barrier = threading.Barrier(len(headers))
+    thread_headers = {}
+
+    def worker(header):
+        thread_headers[threading.get_ident()] = header
+        for batch in range(4):
+            barrier.wait()
+            provider.call(_prompt(header, batch))
+
+    threads = [threading.Thread(target=worker, args=(h,)) for h in headers.values()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 스레드가 번갈아 호출해도 각 스레드의 캐시 접두부는 자기 헤더로 고정
+    for ident, header in thread_headers.items():
+        params_list = [params for tid, params in provider.sent if tid == ident]
+        digests = {_cached_prefix_digest(params) for params in params_list[1:]}
+        expected = hashlib.sha256(
+            f"{header}\n## Source Files\n".encode("utf-8")
+        ).hexdigest()
+        assert digests == {expected}
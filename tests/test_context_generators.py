@@ -214,5 +214,145 @@ class TestContextGenerators(unittest.TestCase):
 
         print("Mybatis Context Generator Test Passed.")
 
+    def test_pack_batches_first_fit_decreasing(self):
+        """first_fit_decreasing은 배치 수를 줄이고 배치 안의 입력 순서를 유지"""
+        generator = JdbcContextGenerator(self.mock_config, self.mock_code_generator)
+        sized_paths = [("A", 60), ("B", 50), ("C", 40), ("D", 30)]
+
+        self.mock_config.batch_packing = "sequential"
+        sequential = generator._pack_batches(sized_paths, 10, 0, 100)
+        self.assertEqual(sequential, [["A"], ["B", "C"], ["D"]])
+
+        self.mock_config.batch_packing = "first_fit_decreasing"
+        packed = generator._pack_batches(sized_paths, 10, 0, 100)
+        self.assertEqual(packed, [["A", "D"], ["B", "C"]])
+
+    def test_reuse_file_reads_keeps_layer_batches(self):
+        """여러 레이어에 있는 파일은 레이어마다 배치되지만 한 번만 읽고 토큰화"""
+        import tempfile
+
+        from modifier.context_generator import base_context_generator
+        from modifier.context_generator.per_layer_context_generator import (
+            PerLayerContextGenerator,
+        )
+
+        self.mock_config.batch_packing = "sequential"
+        self.mock_code_generator.calculate_empty_prompt_tokens.return_value = 0
+        self.mock_code_generator.calculate_token_sizes.side_effect = lambda texts: [
+            len(text) // 4 for text in texts
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.mock_config.target_project = tmp_dir
+            shared = str(Path(tmp_dir) / "src" / "Shared.java")
+            other = str(Path(tmp_dir) / "src" / "Other.java")
+            Path(shared).parent.mkdir()
+            Path(shared).write_text("class Shared {}", encoding="utf-8")
+            Path(other).write_text("class Other {}", encoding="utf-8")
+            layer_files = {"service": [shared, other], "dao": ["src/Shared.java"]}
+
+            generator = PerLayerContextGenerator(
+                self.mock_config, self.mock_code_generator
+            )
+            read_text_file = base_context_generator.read_text_file
+            with patch.object(
+                base_context_generator, "read_text_file", side_effect=read_text_file
+            ) as mock_read:
+                with generator.reuse_file_reads():
+                    contexts = generator.generate(layer_files, "TEST_TABLE", [])
+
+        self.assertEqual(
+            [(ctx.layer, ctx.file_paths) for ctx in contexts],
+            [("service", [shared, other]), ("dao", ["src/Shared.java"])],
+        )
+        self.assertEqual(mock_read.call_count, 2)
+        # 두 번째 레이어는 헤더만 토큰화
+        (texts,) = self.mock_code_generator.calculate_token_sizes.call_args.args
+        self.assertEqual(texts, ["=== File Path (Absolute): src/Shared.java ===\n"])
+        self.assertIsNone(generator._file_cache)
+
+    def test_create_batches_reserves_boundary_token_per_file(self):
+        """헤더/본문을 따로 계산한 토큰 수가 합친 스니펫의 토큰 수보다 작지 않음"""
+        import tempfile
+
+        def estimate(texts):
+            # 토큰 인코더가 없을 때의 추정 방식 (1 토큰 = 4 문자)
+            return [len(text) // 4 for text in texts]
+
+        self.mock_config.batch_packing = "sequential"
+        generator = JdbcContextGenerator(self.mock_config, self.mock_code_generator)
+        self.mock_code_generator.calculate_token_sizes.side_effect = estimate
+        self.mock_code_generator.calculate_empty_prompt_tokens.return_value = 0
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_paths = [str(Path(tmp_dir) / f"A{length}.java") for length in range(8)]
+            contents = ["x" * (length + 3) for length in range(8)]
+            for file_path, content in zip(file_paths, contents):
+                Path(file_path).write_text(content, encoding="utf-8")
+
+            contexts = generator.create_batches(file_paths, "TEST_TABLE", [])
+
+        # 헤더와 본문 문자열을 합쳐서 토큰화하지 않음
+        (texts,) = self.mock_code_generator.calculate_token_sizes.call_args.args
+        self.assertEqual(len(texts), 2 * len(file_paths))
+        sized_paths = generator._size_snippets(file_paths, contents)
+        for (file_path, snippet_tokens), content in zip(sized_paths, contents):
+            joined = f"=== File Path (Absolute): {file_path} ===\n{content}"
+            self.assertGreaterEqual(snippet_tokens, estimate([joined])[0])
+        self.assertEqual(contexts[0].file_paths, file_paths)
+
+    def test_biz_create_batches_sizes_methods_and_skips_missing_biz_file(self):
+        """BIZ 파일은 call_stack 메서드만으로 크기를 계산하고, 없는 BIZ 파일은 제외 (banka/rps2)"""
+        import tempfile
+
+        from modifier.context_generator.anyframe_banka_context_generator import (
+            AnyframeBankaContextGenerator,
+        )
+        from modifier.context_generator.anyframe_rps2_context_generator import (
+            AnyframeRps2ContextGenerator,
+        )
+
+        self.mock_config.batch_packing = "sequential"
+        self.mock_code_generator.calculate_empty_prompt_tokens.return_value = 0
+        self.mock_code_generator.calculate_token_sizes.side_effect = lambda texts: [
+            len(text) // 4 for text in texts
+        ]
+        table_access_info = MagicMock(spec=TableAccessInfo)
+        table_access_info.sql_queries = [
+            {"call_stacks": [["UserSVC.find", "UserBIZ.find", "GoneBIZ.find"]]}
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            svc = str(Path(tmp_dir) / "UserSVC.java")
+            biz = str(Path(tmp_dir) / "UserBIZ.java")
+            gone = str(Path(tmp_dir) / "GoneBIZ.java")
+            Path(svc).write_text("class UserSVC {}", encoding="utf-8")
+            Path(biz).write_text(
+                "public class UserBIZ {\n"
+                "    public void find() { int used = 1; }\n"
+                "    public void other() { int unused = 2; }\n"
+                "}\n",
+                encoding="utf-8",
+            )
+
+            for generator_class in (
+                AnyframeBankaContextGenerator,
+                AnyframeRps2ContextGenerator,
+            ):
+                generator = generator_class(self.mock_config, self.mock_code_generator)
+                generator._table_access_info = table_access_info
+                with self.assertLogs(level="WARNING") as logs:
+                    contexts = generator.create_batches(
+                        [svc, gone, biz], "TEST_TABLE", []
+                    )
+
+                self.assertEqual([ctx.file_paths for ctx in contexts], [[svc, biz]])
+                self.assertIn(gone, "\n".join(logs.output))
+                (texts,) = self.mock_code_generator.calculate_token_sizes.call_args.args
+                self.assertIn("class UserSVC {}", texts)
+                self.assertIn("    public void find() { int used = 1; }\n", texts)
+                self.assertFalse(any("unused" in text for text in texts))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -10,13 +10,14 @@ Modify 명령어 통합 테스트
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 import pytest
 
 from modifier.code_modifier import CodeModifier
 from modifier.code_generator.code_generator_factory import CodeGeneratorFactory
 from config.config_manager import Configuration
+from models.modification_plan import ModificationPlan
 from models.table_access_info import TableAccessInfo
 
 
@@ -29,7 +30,13 @@ def sample_config():
         sql_wrapping_type="mybatis",
         modification_type="ControllerOrService",
         access_tables=[
-            {"table_name": "users", "columns": [{"name": "name", "new_column": False}, {"name": "email", "new_column": False}]},
+            {
+                "table_name": "users",
+                "columns": [
+                    {"name": "name", "new_column": False},
+                    {"name": "email", "new_column": False},
+                ],
+            },
         ],
     )
 
@@ -121,3 +128,116 @@ def test_code_generator_factory_integration(sample_config, mock_llm_provider):
         assert code_generator is not None
         assert hasattr(code_generator, "generate_modification_plan")
         assert hasattr(code_generator, "generate")
+
+
+@pytest.fixture
+def code_modifier(sample_config, mock_llm_provider, tmp_path):
+    """생성기 팩토리를 대체한 CodeModifier (계획 적용 로직 검증용)"""
+    sample_config.target_project = str(tmp_path)
+    with (
+        patch("modifier.code_modifier.CodeGeneratorFactory.create"),
+        patch("modifier.code_modifier.ContextGeneratorFactory.create"),
+    ):
+        modifier = CodeModifier(config=sample_config, llm_provider=mock_llm_provider)
+    return modifier
+
+
+def test_apply_plans_parallel_keeps_input_order_and_records_failures(code_modifier):
+    """병렬 적용 시 결과가 입력 순서로 반환되고, 예외가 난 계획만 실패로 기록되는지 테스트"""
+    plans = [
+        ModificationPlan(
+            file_path=file_path, layer_name="l", modification_type="m", reason=tag
+        )
+        for file_path, tag in [
+            ("A.java", "a1"),
+            ("B.java", "b1"),
+            ("A.java", "a2"),
+            ("C.java", "c1"),
+            ("D.java", "d1"),
+            ("E.java", "e1"),
+            ("A.java", "a3"),
+        ]
+    ]
+    applied = []
+
+    def fake_apply_plan(plan, dry_run=False):
+        applied.append(plan.reason)
+        if plan.reason == "c1":
+            raise RuntimeError("patch failed")
+        return {"file_path": plan.file_path, "status": "success", "reason": plan.reason}
+
+    code_modifier.apply_plan = fake_apply_plan
+    results = code_modifier.apply_plans(plans)
+
+    assert [result["file_path"] for result in results] == [
+        plan.file_path for plan in plans
+    ]
+    assert [result["status"] for result in results] == [
+        "success",
+        "success",
+        "success",
+        "failed",
+        "success",
+        "success",
+        "success",
+    ]
+    assert [result["reason"] for result in results] == [
+        "a1",
+        "b1",
+        "a2",
+        "c1",
+        "d1",
+        "e1",
+        "a3",
+    ]
+    assert "error" in results[3]
+    # 같은 파일의 계획은 입력 순서대로 적용됨
+    assert [tag for tag in applied if tag.startswith("a")] == ["a1", "a2", "a3"]
+    assert code_modifier.result_tracker.stats["failed_files"] == 1
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_apply_plans_sequential_records_failures_per_plan(code_modifier, dry_run):
+    """파일 그룹이 적은 순차 경로에서도 예외가 난 계획만 실패로 기록되는지 테스트"""
+    plans = [
+        ModificationPlan(
+            file_path=file_path, layer_name="l", modification_type="m", reason=tag
+        )
+        for file_path, tag in [("A.java", "a1"), ("B.java", "b1"), ("A.java", "a2")]
+    ]
+
+    def fake_apply_plan(plan, dry_run=False):
+        if plan.reason == "b1":
+            raise RuntimeError("patch failed")
+        return {"file_path": plan.file_path, "status": "success", "reason": plan.reason}
+
+    code_modifier.apply_plan = fake_apply_plan
+    results = code_modifier.apply_plans(plans, dry_run=dry_run)
+
+    assert [result["status"] for result in results] == ["success", "failed", "success"]
+    assert results[1]["file_path"] == "B.java"
+    assert results[1]["error"] == "patch failed"
+    assert code_modifier.result_tracker.stats["failed_files"] == 1
+
+
+@pytest.mark.parametrize("keep_backups", [True, False])
+def test_apply_plan_backup_follows_keep_backups(code_modifier, tmp_path, keep_backups):
+    """keep_backups 설정에 따라서만 .backup 파일을 남기는지 테스트"""
+    code_modifier.config.generate_type = "full_source"
+    code_modifier.config.keep_backups = keep_backups
+    java_file = tmp_path / "User.java"
+    java_file.write_text("class User {}\n", encoding="utf-8")
+
+    result = code_modifier.apply_plan(
+        ModificationPlan(
+            file_path=str(java_file),
+            layer_name="l",
+            modification_type="m",
+            modified_code="class User { int id; }\n",
+        )
+    )
+
+    assert result["status"] == "success"
+    assert java_file.read_text(encoding="utf-8") == "class User { int id; }\n"
+    assert (tmp_path / "User.java.backup").exists() is keep_backups
+    assert ("backup_path" in result) is keep_backups
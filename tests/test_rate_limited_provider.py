@@ -0,0 +1,99 @@
+"""
+RateLimitedLLMProvider 테스트
+
+RPM/TPM 한도 적용 여부와 원본 프로바이더 위임을 검증합니다.
+"""
+
+import time
+
+import pytest
+
+from modifier.llm import RateLimitedLLMProvider, create_llm_provider
+from modifier.llm.mock_llm_provider import MockLLMProvider
+from modifier.llm.rate_limited_provider import TokenBucket, _get_bucket
+
+
+def test_create_llm_provider_without_limits_returns_plain_provider():
+    provider = create_llm_provider("mock")
+
+    assert isinstance(provider, MockLLMProvider)
+
+
+def test_create_llm_provider_with_limits_wraps_provider():
+    provider = create_llm_provider("mock", requests_per_minute=60)
+
+    assert isinstance(provider, RateLimitedLLMProvider)
+    assert provider.get_provider_name() == "mock"
+    # 프로바이더 고유 속성은 원본에서 조회
+    assert provider.mock_response
+    assert provider.validate_response(provider.call("prompt"))
+
+
+def test_token_bucket_waits_when_exhausted():
+    bucket = TokenBucket(600)  # 초당 10개 충전
+
+    for _ in range(600):
+        assert bucket.acquire(1) == 0.0
+
+    start = time.monotonic()
+    waited = bucket.acquire(1)
+    elapsed = time.monotonic() - start
+
+    assert waited > 0
+    assert elapsed >= 0.05
+
+
+def test_token_bucket_caps_oversized_request():
+    bucket = TokenBucket(100)
+
+    # 용량보다 큰 요청도 무한 대기하지 않음
+    assert bucket.acquire(1000) == 0.0
+
+
+def test_get_bucket_keeps_existing_bucket_on_conflicting_limit():
+    first = _get_bucket("mock", "conflict-model", "requests", 60)
+    first.acquire(10)
+
+    second = _get_bucket("mock", "conflict-model", "requests", 120)
+
+    # 이미 사용한 한도가 초기화되지 않도록 기존 버킷 유지
+    assert second is first
+    assert second.capacity == 60
+
+
+def test_token_limit_charges_expected_output_not_model_maximum():
+    class LargeMaxTokensProvider(MockLLMProvider):
+        DEFAULT_MAX_TOKENS = 100000
+
+    # 모델의 최대 출력 토큰 수보다 작은 TPM 한도
+    provider = RateLimitedLLMProvider(
+        LargeMaxTokensProvider(),
+        provider_name="mock",
+        model_id="expected-output-model",
+        tokens_per_minute=10000,
+        expected_output_tokens=500,
+    )
+
+    start = time.monotonic()
+    for _ in range(3):
+        provider.call("x" * 400)
+    elapsed = time.monotonic() - start
+
+    # 호출마다 입력 추정 100토큰 + 예상 출력 500토큰만 차감하므로 대기 없음
+    assert elapsed < 1.0
+    assert provider._token_bucket._available == pytest.approx(8200, abs=5)
+
+
+def test_token_limit_charges_explicit_max_tokens():
+    provider = RateLimitedLLMProvider(
+        MockLLMProvider(),
+        provider_name="mock",
+        model_id="explicit-max-tokens-model",
+        tokens_per_minute=10000,
+        expected_output_tokens=500,
+    )
+
+    provider.call("x" * 400, max_tokens=2000)
+
+    # 입력 추정 100토큰 + 호출 시 지정한 max_tokens 2000토큰 차감
+    assert provider._token_bucket._available == pytest.approx(7900, abs=5)
@@ -0,0 +1,39 @@
+"""
+ResultTracker 테스트
+
+백그라운드 수정 이력 저장과 저장 실패 보고를 검증합니다.
+"""
+
+import json
+
+import pytest
+
+from modifier.result_tracker import ResultTracker
+
+
+def test_save_modification_history_writes_file(tmp_path):
+    tracker = ResultTracker(tmp_path)
+    modification = tracker.record_modification(
+        file_path="A.java", layer="service", modification_type="m", status="success"
+    )
+
+    history_file = tracker.save_modification_history("USERS", [modification])
+    tracker.save_statistics()
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert history["statistics"]["successful_files"] == 1
+
+
+def test_save_statistics_reraises_history_write_failure(tmp_path):
+    tracker = ResultTracker(tmp_path)
+    # 같은 이름의 디렉토리가 있으면 이력 파일 교체가 실패함
+    (tracker.output_dir / "modification_history_USERS.json").mkdir()
+
+    tracker.save_modification_history("USERS", [])
+
+    with pytest.raises(OSError):
+        tracker.save_statistics()
+    # 통계 파일은 이력 저장 실패와 관계없이 저장됨
+    assert (tracker.output_dir / "modification_statistics.json").exists()
+    # 보고된 실패는 다시 보고하지 않음
+    assert tracker.flush() == []
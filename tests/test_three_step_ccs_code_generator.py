@@ -0,0 +1,85 @@
+"""
+ThreeStepCCSCodeGenerator 보조 함수 테스트
+
+SQL alias 추출 캐시, SQL 클래스 역색인 캐시, DQM import 추출을 검증합니다.
+"""
+
+import gc
+import os
+
+import pytest
+
+from models.table_access_info import TableAccessInfo
+from modifier.code_generator.three_step_type.three_step_ccs_code_generator import (
+    ThreeStepCCSCodeGenerator,
+    _extract_column_to_alias_mapping,
+    _extract_dqm_imports,
+)
+
+
+def test_extract_column_to_alias_mapping_collects_aliases():
+    sql = (
+        "SELECT A.USER_NM AS AENAM, USER_NM TRTR_NM, NVL(EMAIL, '') AS EM, PHONE "
+        "FROM T_USER A"
+    )
+
+    mapping = _extract_column_to_alias_mapping(sql, ("USER_NM", "EMAIL", "PHONE"))
+
+    assert dict(mapping) == {
+        "USER_NM": ("AENAM", "TRTR_NM"),
+        "EMAIL": ("EM",),
+        "PHONE": ("PHONE",),
+    }
+
+
+def test_extract_column_to_alias_mapping_result_is_read_only():
+    sql = "SELECT USER_NM AS AENAM FROM T_USER"
+
+    mapping = _extract_column_to_alias_mapping(sql, ("USER_NM",))
+
+    with pytest.raises(TypeError):
+        mapping["USER_NM"] = ("OTHER",)
+    # 캐시된 결과는 호출자와 공유되어도 변하지 않음
+    assert _extract_column_to_alias_mapping(sql, ("USER_NM",))["USER_NM"] == ("AENAM",)
+
+
+def test_sql_class_index_cache_does_not_keep_table_access_info_alive():
+    generator = object.__new__(ThreeStepCCSCodeGenerator)
+    generator._sql_class_index_cache = {}
+    table_access_info = TableAccessInfo(
+        table_name="T_USER",
+        columns=[],
+        access_files=[],
+        query_type="SELECT",
+        sql_queries=[
+            {"call_stacks": [["UserService.find", "UserDQM.select"]]},
+            {"call_stacks": [["OrderService.list"]]},
+        ],
+    )
+
+    index = generator._get_sql_class_index(table_access_info)
+
+    assert index == {"UserService": {0}, "UserDQM": {0}, "OrderService": {1}}
+    assert generator._get_sql_class_index(table_access_info) is index
+
+    del table_access_info
+    gc.collect()
+
+    assert generator._sql_class_index_cache == {}
+
+
+def test_extract_dqm_imports_matches_upper_case_suffix(tmp_path):
+    java_file = tmp_path / "UserSVCImpl.java"
+    java_file.write_bytes(
+        b"package com.example.svc;\r\n"
+        b"import com.example.dqm.UserDQM;\r\n"
+        b"  import com.example.dqm.OrderDQM ;\r\n"
+        b"import com.example.dqm.CodeDqm;\r\n"
+        b"import com.example.vo.UserVO;\r\n"
+        b"// import com.example.dqm.CommentDQM;\r\n"
+    )
+    path_str = str(java_file)
+
+    imports = _extract_dqm_imports(path_str, os.stat(path_str).st_mtime_ns)
+
+    assert imports == frozenset({"UserDQM", "OrderDQM"})
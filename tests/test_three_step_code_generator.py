@@ -0,0 +1,125 @@
+"""
+ThreeStepCodeGenerator 분석 LLM 응답 캐시 테스트
+
+_call_analysis_llm의 메모리/디스크 캐시와 캐시 파일 읽기/쓰기를 검증합니다.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.config_manager import ThreeStepConfig
+from modifier.code_generator.three_step_type.three_step_code_generator import (
+    ThreeStepCodeGenerator,
+)
+
+
+def _make_generator(cache_dir, ttl_hours=-1, model="analysis-model"):
+    """템플릿/출력 디렉토리 초기화 없이 캐시 관련 속성만 갖춘 생성기"""
+    generator = object.__new__(ThreeStepCodeGenerator)
+    generator.three_step_config = ThreeStepConfig(
+        analysis_provider="mock",
+        analysis_model=model,
+        execution_provider="mock",
+        analysis_cache_dir=str(cache_dir),
+        analysis_cache_ttl_hours=ttl_hours,
+    )
+    generator._prompt_cache = {}
+    generator._analysis_cache_dir = cache_dir
+    provider = MagicMock()
+    provider.call.return_value = {"content": '{"ok": true}', "tokens_used": 42}
+    # cached_property를 가짜 프로바이더로 대체
+    generator.__dict__["analysis_provider"] = provider
+    # 백그라운드 저장을 동기 실행으로 대체
+    generator._submit_io = lambda func, *args, **kwargs: func(*args, **kwargs)
+    return generator
+
+
+def test_analysis_cache_file_key_is_stable(tmp_path):
+    generator = _make_generator(tmp_path)
+
+    first = generator._get_analysis_cache_file("PROMPT", "data_mapping")
+
+    assert first == generator._get_analysis_cache_file("PROMPT", "data_mapping")
+    assert first.parent == tmp_path
+    assert first.name.startswith("data_mapping__")
+    assert first != generator._get_analysis_cache_file("PROMPT", "planning")
+    assert first != generator._get_analysis_cache_file("PROMPT2", "data_mapping")
+    other_model = _make_generator(tmp_path, model="other-model")
+    assert first != other_model._get_analysis_cache_file("PROMPT", "data_mapping")
+
+
+def test_call_analysis_llm_reuses_memory_and_disk_cache(tmp_path):
+    generator = _make_generator(tmp_path)
+
+    response = generator._call_analysis_llm("PROMPT", "data_mapping")
+    again = generator._call_analysis_llm("PROMPT", "data_mapping")
+
+    assert response["tokens_used"] == 42
+    assert again == {"content": '{"ok": true}', "tokens_used": 0}
+    assert generator.analysis_provider.call.call_count == 1
+
+    # 새 실행(메모리 캐시 없음)에서는 디스크 캐시에서 재사용
+    rerun = _make_generator(tmp_path)
+    from_disk = rerun._call_analysis_llm("PROMPT", "data_mapping")
+
+    assert from_disk == {"content": '{"ok": true}', "tokens_used": 0}
+    rerun.analysis_provider.call.assert_not_called()
+
+
+def test_write_then_load_analysis_cache_round_trip(tmp_path):
+    generator = _make_generator(tmp_path)
+    cache_file = tmp_path / "planning__abc.json"
+    response = {"content": "응답", "tokens_used": 7}
+
+    generator._write_analysis_cache(cache_file, response)
+
+    assert generator._load_analysis_cache(cache_file) == response
+    assert not cache_file.with_suffix(".tmp").exists()
+
+
+def test_load_analysis_cache_expires_after_ttl(tmp_path):
+    generator = _make_generator(tmp_path, ttl_hours=1)
+    cache_file = tmp_path / "planning__abc.json"
+    generator._write_analysis_cache(cache_file, {"content": "old"})
+
+    assert generator._load_analysis_cache(cache_file) == {"content": "old"}
+
+    two_hours_ago = time.time() - 2 * 3600
+    os.utime(cache_file, (two_hours_ago, two_hours_ago))
+
+    assert generator._load_analysis_cache(cache_file) is None
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]"])
+def test_corrupt_cache_file_falls_back_to_llm(tmp_path, content):
+    generator = _make_generator(tmp_path)
+    cache_file = generator._get_analysis_cache_file("PROMPT", "data_mapping")
+    cache_file.write_text(content, encoding="utf-8")
+
+    assert generator._load_analysis_cache(cache_file) is None
+
+    response = generator._call_analysis_llm("PROMPT", "data_mapping")
+
+    assert response["tokens_used"] == 42
+    generator.analysis_provider.call.assert_called_once_with("PROMPT")
+    # 손상된 캐시 파일은 새 응답으로 교체됨
+    assert generator._load_analysis_cache(cache_file)["tokens_used"] == 42
+
+
+def test_missing_cache_file_returns_none(tmp_path):
+    generator = _make_generator(tmp_path)
+
+    assert generator._load_analysis_cache(tmp_path / "missing.json") is None
+
+
+def test_write_analysis_cache_creates_directory_lazily(tmp_path):
+    cache_dir = tmp_path / "llm_cache"
+    generator = _make_generator(cache_dir)
+
+    assert not cache_dir.exists()
+    generator._call_analysis_llm("PROMPT", "planning")
+
+    assert len(list(cache_dir.glob("planning__*.json"))) == 1